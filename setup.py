@@ -25,6 +25,7 @@ setup(
     ],
     extras_require={
         "touch": ["evdev>=1.6.0"],
+        "fast": ["msgspec>=0.18", "orjson>=3.9"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-mock>=3.11.0",
@@ -1,25 +1,111 @@
 """Configuration loading and validation for Solar Smart Clock."""
 
+from __future__ import annotations
+
 import dataclasses
+import functools
+import itertools
 import json
 import logging
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional, Sequence, Union
 
 logger = logging.getLogger(__name__)
 
-# Default paths to search for config
-CONFIG_PATHS = [
-    Path("config.json"),
-    Path.home() / ".config" / "solar-clock" / "config.json",
-    Path("/etc/solar-clock/config.json"),
-]
+_StrPath = Union[str, Path]
+
+# Try to import msgspec (optional, faster config decoding)
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Default paths to search for config, resolved to plain strings once at import
+CONFIG_PATHS: tuple[str, ...] = (
+    "config.json",
+    os.path.expanduser("~/.config/solar-clock/config.json"),
+    "/etc/solar-clock/config.json",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _max_view_index() -> int:
+    """Highest valid view index, resolved on first use."""
+    # Lazy import to avoid circular dependency
+    from .views import VIEW_CLASSES
+
+    return len(VIEW_CLASSES) - 1
+
+
+# Slotted dataclasses (smaller instances, faster attribute access) need 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Bounds for numeric settings
+_MIN_LATITUDE, _MAX_LATITUDE = -90, 90
+_MIN_LONGITUDE, _MAX_LONGITUDE = -180, 180
+_MIN_PORT, _MAX_PORT = 1, 65535
+_MIN_UPDATE_INTERVAL = 60  # Seconds, for weather and air quality polling
+
+# Allowed values for enumerated settings
+_VALID_UNITS = frozenset({"imperial", "metric"})
+_VALID_THEME_MODES = frozenset({"auto", "day", "night"})
+
+# Validation error messages
+_ERR_LATITUDE = f"Invalid latitude {{}}: must be {_MIN_LATITUDE} to {_MAX_LATITUDE}"
+_ERR_LONGITUDE = f"Invalid longitude {{}}: must be {_MIN_LONGITUDE} to {_MAX_LONGITUDE}"
+_ERR_TIMEZONE = "Timezone must not be empty"
+_ERR_DIMENSIONS = "Invalid display dimensions: {}x{}"
+_ERR_NAV_BAR_HEIGHT = "Invalid nav_bar_height: {}"
+_ERR_PORT = f"Invalid port {{}}: must be {_MIN_PORT}-{_MAX_PORT}"
+_ERR_WEATHER_INTERVAL = (
+    f"Weather update interval must be at least {_MIN_UPDATE_INTERVAL} seconds"
+)
+_ERR_UNITS = "Invalid units '{}': must be 'imperial' or 'metric'"
+_ERR_AQI_INTERVAL = (
+    f"Air quality update interval must be at least {_MIN_UPDATE_INTERVAL} seconds"
+)
+_ERR_SWIPE_THRESHOLD = "Swipe threshold must be positive"
+_ERR_TAP_THRESHOLD = "Tap threshold must be positive"
+_ERR_TAP_TIMEOUT = "Tap timeout must be positive"
+_ERR_DEFAULT_VIEW = "Invalid default_view {}: must be 0-{}"
+_ERR_THEME_MODE = "Invalid theme_mode '{}': must be 'auto', 'day', or 'night'"
+
+# Loaded configs keyed by file path, with the file's mtime when loaded
+_CONFIG_CACHE: dict[str, tuple[int, Config]] = {}
+
+
+# Returned by validate() when there are no errors, so valid configs allocate nothing
+_EMPTY: tuple[str, ...] = ()
+
+
+def _collect_errors(errors: Iterator[str]) -> Sequence[str]:
+    """Materialize validation errors, allocating a list only if there are any."""
+    first = next(errors, None)
+    if first is None:
+        return _EMPTY
+    return [first, *errors]
+
 
+class _ConfigSection:
+    """Base for config sections: subclasses yield errors from _iter_errors()."""
 
-@dataclass
-class LocationConfig:
+    __slots__ = ()
+
+    def validate(self) -> Sequence[str]:
+        """Return validation errors; the shared empty tuple if valid."""
+        return _collect_errors(self._iter_errors())
+
+    def _iter_errors(self) -> Iterator[str]:
+        return iter(())
+
+
+@dataclass(frozen=True, **_SLOTS)
+class LocationConfig(_ConfigSection):
     """Location settings for solar calculations."""
 
     name: str = "Unknown"
@@ -28,20 +114,17 @@ class LocationConfig:
     latitude: float = 0.0
     longitude: float = 0.0
 
-    def validate(self) -> list[str]:
-        """Return list of validation errors, empty if valid."""
-        errors = []
-        if not -90 <= self.latitude <= 90:
-            errors.append(f"Invalid latitude {self.latitude}: must be -90 to 90")
-        if not -180 <= self.longitude <= 180:
-            errors.append(f"Invalid longitude {self.longitude}: must be -180 to 180")
+    def _iter_errors(self) -> Iterator[str]:
+        if not _MIN_LATITUDE <= self.latitude <= _MAX_LATITUDE:
+            yield _ERR_LATITUDE.format(self.latitude)
+        if not _MIN_LONGITUDE <= self.longitude <= _MAX_LONGITUDE:
+            yield _ERR_LONGITUDE.format(self.longitude)
         if not self.timezone:
-            errors.append("Timezone must not be empty")
-        return errors
+            yield _ERR_TIMEZONE
 
 
-@dataclass
-class DisplayConfig:
+@dataclass(frozen=True, **_SLOTS)
+class DisplayConfig(_ConfigSection):
     """Display settings."""
 
     width: int = 480
@@ -49,64 +132,55 @@ class DisplayConfig:
     framebuffer: str = "/dev/fb1"
     nav_bar_height: int = 40
 
-    def validate(self) -> list[str]:
-        errors = []
+    def _iter_errors(self) -> Iterator[str]:
         if self.width <= 0 or self.height <= 0:
-            errors.append(f"Invalid display dimensions: {self.width}x{self.height}")
+            yield _ERR_DIMENSIONS.format(self.width, self.height)
         if self.nav_bar_height < 0 or self.nav_bar_height > self.height:
-            errors.append(f"Invalid nav_bar_height: {self.nav_bar_height}")
-        return errors
+            yield _ERR_NAV_BAR_HEIGHT.format(self.nav_bar_height)
 
 
-@dataclass
-class HttpServerConfig:
+@dataclass(frozen=True, **_SLOTS)
+class HttpServerConfig(_ConfigSection):
     """HTTP screenshot server settings."""
 
     enabled: bool = True
     port: int = 8080
     bind_address: str = "127.0.0.1"  # Secure default: localhost only
-    rate_limit_per_second: int = 10
+    rate_limit_per_second: int = 10  # Per client address
 
-    def validate(self) -> list[str]:
-        errors = []
-        if not 1 <= self.port <= 65535:
-            errors.append(f"Invalid port {self.port}: must be 1-65535")
-        return errors
+    def _iter_errors(self) -> Iterator[str]:
+        if not _MIN_PORT <= self.port <= _MAX_PORT:
+            yield _ERR_PORT.format(self.port)
 
 
-@dataclass
-class WeatherConfig:
+@dataclass(frozen=True, **_SLOTS)
+class WeatherConfig(_ConfigSection):
     """Weather API settings."""
 
     update_interval_seconds: int = 900  # 15 minutes
     units: str = "imperial"  # imperial or metric
+    one_call: bool = False  # One Call 3.0 (paid subscription) for weather+forecast
 
-    def validate(self) -> list[str]:
-        errors = []
-        if self.update_interval_seconds < 60:
-            errors.append("Weather update interval must be at least 60 seconds")
-        if self.units not in ("imperial", "metric"):
-            errors.append(
-                f"Invalid units '{self.units}': must be 'imperial' or 'metric'"
-            )
-        return errors
+    def _iter_errors(self) -> Iterator[str]:
+        if self.update_interval_seconds < _MIN_UPDATE_INTERVAL:
+            yield _ERR_WEATHER_INTERVAL
+        if self.units not in _VALID_UNITS:
+            yield _ERR_UNITS.format(self.units)
 
 
-@dataclass
-class AirQualityConfig:
+@dataclass(frozen=True, **_SLOTS)
+class AirQualityConfig(_ConfigSection):
     """Air quality API settings."""
 
     update_interval_seconds: int = 1800  # 30 minutes
 
-    def validate(self) -> list[str]:
-        errors = []
-        if self.update_interval_seconds < 60:
-            errors.append("Air quality update interval must be at least 60 seconds")
-        return errors
+    def _iter_errors(self) -> Iterator[str]:
+        if self.update_interval_seconds < _MIN_UPDATE_INTERVAL:
+            yield _ERR_AQI_INTERVAL
 
 
-@dataclass
-class TouchConfig:
+@dataclass(frozen=True, **_SLOTS)
+class TouchConfig(_ConfigSection):
     """Touchscreen settings."""
 
     enabled: bool = True
@@ -115,42 +189,31 @@ class TouchConfig:
     tap_threshold: int = 30
     tap_timeout: float = 0.4
 
-    def validate(self) -> list[str]:
-        errors = []
+    def _iter_errors(self) -> Iterator[str]:
         if self.swipe_threshold <= 0:
-            errors.append("Swipe threshold must be positive")
+            yield _ERR_SWIPE_THRESHOLD
         if self.tap_threshold <= 0:
-            errors.append("Tap threshold must be positive")
+            yield _ERR_TAP_THRESHOLD
         if self.tap_timeout <= 0:
-            errors.append("Tap timeout must be positive")
-        return errors
+            yield _ERR_TAP_TIMEOUT
 
 
-@dataclass
-class AppearanceConfig:
+@dataclass(frozen=True, **_SLOTS)
+class AppearanceConfig(_ConfigSection):
     """Appearance settings."""
 
     default_view: int = 0
     theme_mode: Literal["auto", "day", "night"] = "auto"
 
-    def validate(self) -> list[str]:
-        errors = []
-        # Lazy import to avoid circular dependency
-        from .views import VIEW_CLASSES
-
-        max_view = len(VIEW_CLASSES) - 1
+    def _iter_errors(self) -> Iterator[str]:
+        max_view = _max_view_index()
         if not 0 <= self.default_view <= max_view:
-            errors.append(
-                f"Invalid default_view {self.default_view}: must be 0-{max_view}"
-            )
-        if self.theme_mode not in ("auto", "day", "night"):
-            errors.append(
-                f"Invalid theme_mode '{self.theme_mode}': must be 'auto', 'day', or 'night'"
-            )
-        return errors
+            yield _ERR_DEFAULT_VIEW.format(self.default_view, max_view)
+        if self.theme_mode not in _VALID_THEME_MODES:
+            yield _ERR_THEME_MODE.format(self.theme_mode)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Config:
     """Main configuration container."""
 
@@ -162,55 +225,126 @@ class Config:
     touch: TouchConfig = field(default_factory=TouchConfig)
     appearance: AppearanceConfig = field(default_factory=AppearanceConfig)
 
-    def validate(self) -> list[str]:
-        """Validate all configuration sections. Returns list of errors."""
-        errors = []
-        errors.extend(self.location.validate())
-        errors.extend(self.display.validate())
-        errors.extend(self.http_server.validate())
-        errors.extend(self.weather.validate())
-        errors.extend(self.air_quality.validate())
-        errors.extend(self.touch.validate())
-        errors.extend(self.appearance.validate())
-        return errors
+    def validate(self) -> Sequence[str]:
+        """Validate all configuration sections. Returns errors, empty if valid."""
+        return _collect_errors(
+            itertools.chain(
+                self.location._iter_errors(),
+                self.display._iter_errors(),
+                self.http_server._iter_errors(),
+                self.weather._iter_errors(),
+                self.air_quality._iter_errors(),
+                self.touch._iter_errors(),
+                self.appearance._iter_errors(),
+            )
+        )
+
+
+# Field names per config dataclass, so dataclasses.fields() runs once per class
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls) -> tuple[str, ...]:
+    """Get the field names of a config dataclass."""
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = _FIELDS_CACHE[cls] = tuple(f.name for f in dataclasses.fields(cls))
+    return names
+
+
+def _reject_unknown_keys(cls, data: dict) -> None:
+    """
+    Raise if a config dict has keys that are not fields of its dataclass.
+
+    A misspelt key would otherwise be ignored and its field silently left
+    at the default (e.g. "lattitude" leaving latitude at 0.0).
+
+    Raises:
+        ValueError: If data is not a dict or has unknown keys.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{cls.__name__} must be a JSON object")
+    unknown = data.keys() - _field_names(cls)
+    if unknown:
+        raise ValueError(
+            f"Unknown keys in {cls.__name__}: {', '.join(sorted(unknown))}"
+        )
 
 
 def _dataclass_from_dict(cls, data: dict):
     """Create a dataclass instance from a dict, using field defaults for missing keys."""
-    kwargs = {}
-    for f in dataclasses.fields(cls):
-        if f.name in data:
-            kwargs[f.name] = data[f.name]
-        elif f.default is not dataclasses.MISSING:
-            kwargs[f.name] = f.default
-        elif f.default_factory is not dataclasses.MISSING:
-            kwargs[f.name] = f.default_factory()
-        # If no default, let cls(**kwargs) raise naturally
-    return cls(**kwargs)
-
-
-# Mapping from config JSON keys to their dataclass types
-_CONFIG_SECTIONS = {
-    "location": ("location", LocationConfig),
-    "display": ("display", DisplayConfig),
-    "http_server": ("http_server", HttpServerConfig),
-    "weather": ("weather", WeatherConfig),
-    "air_quality": ("air_quality", AirQualityConfig),
-    "touch": ("touch", TouchConfig),
-    "appearance": ("appearance", AppearanceConfig),
-}
+    _reject_unknown_keys(cls, data)
+    # Missing keys are filled in by the dataclass's own defaults
+    return cls(**{name: data[name] for name in _field_names(cls) if name in data})
+
+
+# Config JSON keys with the Config attribute and dataclass type they map to
+_CONFIG_SECTIONS: tuple[tuple[str, str, type], ...] = (
+    ("location", "location", LocationConfig),
+    ("display", "display", DisplayConfig),
+    ("http_server", "http_server", HttpServerConfig),
+    ("weather", "weather", WeatherConfig),
+    ("air_quality", "air_quality", AirQualityConfig),
+    ("touch", "touch", TouchConfig),
+    ("appearance", "appearance", AppearanceConfig),
+)
 
 
 def _dict_to_config(data: dict) -> Config:
     """Convert a dictionary to a Config object."""
-    config = Config()
-    for key, (attr, cls) in _CONFIG_SECTIONS.items():
-        if key in data:
-            setattr(config, attr, _dataclass_from_dict(cls, data[key]))
-    return config
+    _reject_unknown_keys(Config, data)
+    sections = {
+        attr: _dataclass_from_dict(cls, data[key])
+        for key, attr, cls in _CONFIG_SECTIONS
+        if key in data
+    }
+    return Config(**sections)
+
+
+def _parse_config(raw: bytes, path: str) -> Config:
+    """
+    Parse raw config file contents into a Config object.
+
+    Uses msgspec to decode and convert into the dataclasses when it is
+    installed, otherwise json plus _dict_to_config. Unknown section or
+    field names are rejected on both paths. Values msgspec won't convert
+    as-is (e.g. 900.0 for an int field) go through _dict_to_config too, so
+    the same files load with or without msgspec.
+
+    Args:
+        raw: Entire config file contents
+        path: Path of the file, for error messages
+
+    Returns:
+        Parsed (not yet validated) Config
+
+    Raises:
+        ValueError: If the file is not valid JSON or has unknown keys.
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            data = msgspec.json.decode(raw)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid JSON in config file {path}: {e}")
+        # msgspec ignores unknown dataclass fields, so check keys first
+        _reject_unknown_keys(Config, data)
+        for key, _, cls in _CONFIG_SECTIONS:
+            if key in data:
+                _reject_unknown_keys(cls, data[key])
+        try:
+            return msgspec.convert(data, type=Config)
+        except msgspec.ValidationError:
+            # Left to validate(), exactly as on the json path
+            return _dict_to_config(data)
 
+    try:
+        data = json.loads(raw)
+    except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError for bad bytes
+        raise ValueError(f"Invalid JSON in config file {path}: {e}")
+    return _dict_to_config(data)
 
-def load_config(config_path: Optional[Path] = None) -> Config:
+
+def load_config(config_path: Optional[_StrPath] = None) -> Config:
     """
     Load configuration from JSON file.
 
@@ -225,17 +359,21 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         ValueError: If config file has validation errors.
     """
     # Determine which path to use
+    paths_to_try: Sequence[_StrPath]
     if config_path is not None:
-        paths_to_try = [config_path]
+        paths_to_try = (config_path,)
     else:
         paths_to_try = CONFIG_PATHS
 
-    # Find first existing config file
+    # Find the first config file that exists (one stat() per candidate)
     found_path = None
     for path in paths_to_try:
-        if path.exists():
-            found_path = path
-            break
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        found_path = os.fspath(path)
+        break
 
     if found_path is None:
         if config_path is not None:
@@ -243,16 +381,17 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         logger.warning("No config file found, using defaults")
         return Config()
 
-    # Load and parse JSON
-    logger.info(f"Loading config from {found_path}")
-    try:
-        with open(found_path, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in config file {found_path}: {e}")
+    # An unchanged file needs nothing beyond that stat()
+    cached = _CONFIG_CACHE.get(found_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-    # Convert to Config object
-    config = _dict_to_config(data)
+    # Load and parse JSON into a Config object
+    logger.info(f"Loading config from {found_path}")
+    with open(found_path, "rb") as f:
+        # Key the cache on the mtime of what is actually read
+        mtime = os.fstat(f.fileno()).st_mtime_ns
+        config = _parse_config(f.read(), found_path)
 
     # Validate
     errors = config.validate()
@@ -262,13 +401,31 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         )
         raise ValueError(error_msg)
 
+    _CONFIG_CACHE[found_path] = (mtime, config)
     return config
 
 
+def reload_config(config_path: Optional[_StrPath] = None) -> Config:
+    """
+    Load configuration, bypassing the cache of previously loaded files.
+
+    Args:
+        config_path: Explicit path to config file. If None, searches default paths.
+
+    Returns:
+        Config object with freshly loaded settings.
+    """
+    _CONFIG_CACHE.clear()
+    return load_config(config_path)
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> Optional[str]:
     """
     Get OpenWeatherMap API key from environment.
 
+    The environment is read once; call get_api_key.cache_clear() to re-read.
+
     Returns:
         API key string, or None if not set.
     """
@@ -1,7 +1,37 @@
-"""Data providers for Solar Smart Clock."""
+"""Data providers for Solar Smart Clock.
 
-from .weather import WeatherProvider
-from .solar import SolarProvider
-from .lunar import LunarProvider
+Providers are imported on first access (PEP 562), so using one provider
+does not pull in the dependencies of the others (e.g. requests for weather).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .weather import WeatherProvider
+    from .solar import SolarProvider
+    from .lunar import LunarProvider
+
+# Public provider name -> submodule that defines it
+_PROVIDER_MODULES = {
+    "WeatherProvider": ".weather",
+    "SolarProvider": ".solar",
+    "LunarProvider": ".lunar",
+}
 
 __all__ = ["WeatherProvider", "SolarProvider", "LunarProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider class on first access."""
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the not-yet-imported providers."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,24 +1,193 @@
 """Lunar data provider using ephem library."""
 
+import bisect
 import datetime
+import functools
+import importlib.util
+import json
 import logging
+import math
+import os
+import sys
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-# Try to import ephem (optional dependency)
-try:
-    import ephem
+# dataclass(slots=True) is only accepted on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-    EPHEM_AVAILABLE = True
-except ImportError:
-    EPHEM_AVAILABLE = False
+# ephem is an optional dependency. Its C extension is only loaded the first
+# time a lunar calculation needs it, not when this module is imported.
+EPHEM_AVAILABLE = importlib.util.find_spec("ephem") is not None
+if not EPHEM_AVAILABLE:
     logger.info("ephem library not available - lunar features disabled")
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _ephem() -> ModuleType:
+    """Import ephem on first use."""
+    import ephem
+
+    return ephem
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Expose the lazily imported ephem module as ``lunar.ephem``."""
+    if name == "ephem" and EPHEM_AVAILABLE:
+        return _ephem()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_DEG2RAD = math.pi / 180
+
+# Mean solar motion used by the closed-form equation of time (360 deg / 365 d)
+_EOT_RADIANS_PER_DAY = 360 / 365 * _DEG2RAD
+
+
+def default_cache_dir() -> Path:
+    """Directory for persisted calculations (XDG cache dir, ~/.cache by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "solar-clock"
+
+
+def _eot_meeus(day_of_year: int) -> float:
+    """
+    Closed-form equation of time, accurate to about a minute.
+
+    Args:
+        day_of_year: Day of the year (1 = January 1)
+
+    Returns:
+        Minutes that sun is early (positive) or late (negative)
+    """
+    b = _EOT_RADIANS_PER_DAY * (day_of_year - 81)
+    return 9.87 * math.sin(2 * b) - 7.53 * math.cos(b) - 1.5 * math.sin(b)
+
+
+# Upper bounds of each named phase (0=new, 0.5=full); phases at or past the
+# last bound wrap around to "New Moon" again
+_PHASE_THRESHOLDS = (0.03, 0.22, 0.28, 0.47, 0.53, 0.72, 0.78, 0.97)
+_PHASE_NAMES = (
+    "New Moon",
+    "Waxing Crescent",
+    "First Quarter",
+    "Waxing Gibbous",
+    "Full Moon",
+    "Waning Gibbous",
+    "Last Quarter",
+    "Waning Crescent",
+    "New Moon",
+)
+
+# Meeus, Astronomical Algorithms, ch. 27: mean March equinox, June solstice,
+# September equinox and December solstice as polynomials in
+# Y = (year - 2000) / 1000, valid for years 1000-3000
+_SEASON_POLYNOMIALS = (
+    (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057),
+    (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030),
+    (2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078),
+    (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032),
+)
+
+# Periodic terms (A, B degrees, C degrees/century) correcting the mean instants
+_SEASON_PERIODIC_TERMS = (
+    (485, 324.96, 1934.136),
+    (203, 337.23, 32964.467),
+    (199, 342.08, 20.186),
+    (182, 27.85, 445267.112),
+    (156, 73.14, 45036.886),
+    (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934),
+    (74, 296.72, 3034.906),
+    (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147),
+    (52, 297.17, 150.678),
+    (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562),
+    (44, 325.15, 31555.956),
+    (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328),
+    (17, 288.79, 4562.452),
+    (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921),
+    (12, 95.39, 14577.848),
+    (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259),
+    (9, 227.73, 1222.114),
+    (8, 15.45, 16859.074),
+)
+
+# The same terms with B and C pre-converted to radians
+_SEASON_PERIODIC_TERMS_RAD = tuple(
+    (a, b * _DEG2RAD, c * _DEG2RAD) for a, b, c in _SEASON_PERIODIC_TERMS
+)
+
+# Julian day of 2000-01-01 00:00 and its proleptic Gregorian ordinal
+_J2000_MIDNIGHT = 2451544.5
+_J2000_ORDINAL = 730120
+
+# ephem.Date values are Dublin Julian days (JD - 2415020, epoch 1899-12-31 12:00)
+_DUBLIN_JD_OFFSET = 2415020.0
+
+# TT - UT (delta T) in days, ~69 s for the current era
+_DELTA_T = 69.2 / 86400
+
+
+def _jd_to_date(jd: float) -> datetime.date:
+    """UTC calendar date of a Julian day."""
+    return datetime.date.fromordinal(_J2000_ORDINAL + math.floor(jd - _J2000_MIDNIGHT))
+
+
+def _ephem_to_date(d: float) -> datetime.date:
+    """UTC calendar date of an ephem.Date, without building a datetime."""
+    return _jd_to_date(d + _DUBLIN_JD_OFFSET)
+
+
+def _meeus_season_jde(year: int, season: int) -> float:
+    """
+    Julian ephemeris day of an equinox or solstice.
+
+    Args:
+        year: Year to calculate for
+        season: 0=March equinox, 1=June solstice, 2=September equinox,
+            3=December solstice
+
+    Returns:
+        Julian ephemeris day of the event
+    """
+    y = (year - 2000) / 1000
+    c0, c1, c2, c3, c4 = _SEASON_POLYNOMIALS[season]
+    jde0 = c0 + y * (c1 + y * (c2 + y * (c3 + y * c4)))
+
+    t = (jde0 - 2451545.0) / 36525
+    w = (35999.373 * t - 2.47) * _DEG2RAD
+    dl = 1 + 0.0334 * math.cos(w) + 0.0007 * math.cos(2 * w)
+    s = sum(a * math.cos(b + c * t) for a, b, c in _SEASON_PERIODIC_TERMS_RAD)
+    return jde0 + 0.00001 * s / dl
+
+
+@functools.lru_cache(maxsize=8)
+def _meeus_solstice_equinox(year: int) -> "SolsticeEquinox":
+    """Solstice and equinox dates (UTC) for a year via Meeus' closed form."""
+    spring, summer, fall, winter = (
+        _jd_to_date(_meeus_season_jde(year, k) - _DELTA_T) for k in range(4)
+    )
+    return SolsticeEquinox(
+        spring_equinox=spring,
+        summer_solstice=summer,
+        fall_equinox=fall,
+        winter_solstice=winter,
+    )
+
+
+@dataclass(frozen=True, **_SLOTS)
 class MoonPhase:
     """Moon phase data."""
 
@@ -31,7 +200,7 @@ class MoonPhase:
     days_to_full: int
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MoonTimes:
     """Moon rise and set times."""
 
@@ -39,7 +208,7 @@ class MoonTimes:
     moonset: Optional[datetime.datetime]
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SolsticeEquinox:
     """Solstice and equinox dates for a year."""
 
@@ -49,7 +218,7 @@ class SolsticeEquinox:
     winter_solstice: datetime.date
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AnalemmaPoint:
     """Sun position data for analemma calculation."""
 
@@ -58,6 +227,18 @@ class AnalemmaPoint:
     date: datetime.date
 
 
+@dataclass(frozen=True, eq=False, **_SLOTS)
+class AnalemmaSeries:
+    """Analemma samples for a year as parallel, read-only arrays."""
+
+    elevations: np.ndarray  # Degrees at solar noon
+    equations_of_time: np.ndarray  # Minutes early/late
+    dates: tuple[datetime.date, ...]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
 class LunarProvider:
     """
     Provides lunar and astronomical calculations.
@@ -67,7 +248,11 @@ class LunarProvider:
     """
 
     def __init__(
-        self, latitude: float, longitude: float, timezone: Optional[str] = None
+        self,
+        latitude: float,
+        longitude: float,
+        timezone: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize lunar provider.
@@ -77,27 +262,62 @@ class LunarProvider:
             longitude: Location longitude
             timezone: Timezone string (e.g., "America/New_York").
                 Defaults to the system local timezone.
+            cache_dir: Directory to persist the yearly analemma in, so it
+                survives restarts. None disables the disk cache.
         """
         self.latitude = latitude
         self.longitude = longitude
+        self.cache_dir = cache_dir
         self.tz = (
             ZoneInfo(timezone)
             if timezone
             else datetime.datetime.now().astimezone().tzinfo
         )
 
-        self._analemma_cache: Optional[tuple] = None  # (year, list[AnalemmaPoint])
-
-        if EPHEM_AVAILABLE:
-            self._observer = ephem.Observer()
-            self._observer.lat = str(latitude)
-            self._observer.lon = str(longitude)
-
-            self._eot_observer = ephem.Observer()
-            self._eot_observer.lat = "0"
-            self._eot_observer.lon = "0"
-            self._eot_observer.elevation = 0
-            self._eot_observer.pressure = 0
+        self._analemma_cache: Optional[tuple] = None  # (year, AnalemmaSeries)
+        # (previous new, next new, next full) moon as ephem dates; valid
+        # until the earlier of the next two passes
+        self._lunation_cache: Optional[tuple[float, float, float]] = None
+        self._moon_times_cache: dict = {}  # date -> Optional[MoonTimes]
+
+    # ephem observers and bodies are built on first use, so constructing a
+    # provider doesn't load ephem. Bodies are recomputed in place per query.
+
+    @functools.cached_property
+    def _observer(self):
+        """Observer at this location, used for moonrise/moonset."""
+        # ephem reads floats as radians, skipping its degree string parser
+        observer = _ephem().Observer()
+        observer.lat = math.radians(self.latitude)
+        observer.lon = math.radians(self.longitude)
+        return observer
+
+    @functools.cached_property
+    def _eot_observer(self):
+        """Refraction-free prime-meridian observer for the equation of time."""
+        observer = _ephem().Observer()
+        observer.lat = 0.0
+        observer.lon = 0.0
+        observer.elevation = 0
+        observer.pressure = 0
+        return observer
+
+    @functools.cached_property
+    def _analemma_observer(self):
+        """Refraction-free copy of the local observer for noon elevations."""
+        observer = self._observer.copy()
+        observer.pressure = 0
+        return observer
+
+    @functools.cached_property
+    def _moon(self):
+        """Moon body for phase and rise/set queries."""
+        return _ephem().Moon()
+
+    @functools.cached_property
+    def _sun(self):
+        """Sun body for transit queries."""
+        return _ephem().Sun()
 
     @property
     def available(self) -> bool:
@@ -114,26 +334,27 @@ class LunarProvider:
         if not EPHEM_AVAILABLE:
             return None
 
+        ephem = _ephem()
+
         try:
             now = datetime.datetime.now()
-            moon = ephem.Moon()
+            moon = self._moon
             moon.compute(now)
 
             illumination = moon.phase  # Percentage 0-100
 
             # Get next and previous new moon dates
-            next_new = ephem.next_new_moon(now)
-            next_full = ephem.next_full_moon(now)
-            prev_new = ephem.previous_new_moon(now)
+            now_ephem = ephem.Date(now)
+            prev_new, next_new, next_full = self._lunation_bounds(now_ephem)
 
             # Calculate lunation (cycle position 0-1) from days since last new moon
             # Synodic month is ~29.53 days
             synodic_month = 29.530588853
-            days_since_new = ephem.Date(now) - prev_new
+            days_since_new = now_ephem - prev_new
             lunation = (days_since_new / synodic_month) % 1.0
 
-            next_new_date = ephem.Date(next_new).datetime().date()
-            next_full_date = ephem.Date(next_full).datetime().date()
+            next_new_date = _ephem_to_date(next_new)
+            next_full_date = _ephem_to_date(next_full)
 
             days_to_new = (next_new_date - now.date()).days
             days_to_full = (next_full_date - now.date()).days
@@ -154,6 +375,33 @@ class LunarProvider:
             logger.warning(f"Failed to calculate moon phase: {e}")
             return None
 
+    def _lunation_bounds(self, now: float) -> tuple[float, float, float]:
+        """
+        Get the previous new moon, next new moon and next full moon.
+
+        The three searches are the costly part of get_moon_phase(), and
+        their results only change when a new or full moon passes, so they
+        are reused until then.
+
+        Args:
+            now: Current time as an ephem date
+
+        Returns:
+            (previous new, next new, next full) moon as ephem dates
+        """
+        cached = self._lunation_cache
+        if cached is not None and cached[0] <= now < min(cached[1], cached[2]):
+            return cached
+
+        ephem = _ephem()
+        cached = (
+            ephem.previous_new_moon(now),
+            ephem.next_new_moon(now),
+            ephem.next_full_moon(now),
+        )
+        self._lunation_cache = cached
+        return cached
+
     def get_moon_times(
         self, date: Optional[datetime.date] = None
     ) -> Optional[MoonTimes]:
@@ -169,8 +417,34 @@ class LunarProvider:
         if not EPHEM_AVAILABLE:
             return None
 
+        today = datetime.datetime.now(self.tz).date()
         if date is None:
-            date = datetime.datetime.now(self.tz).date()
+            date = today
+
+        if date in self._moon_times_cache:
+            return self._moon_times_cache[date]
+
+        result = self._compute_moon_times(date)
+
+        # Evict entries older than yesterday
+        yesterday = today - datetime.timedelta(days=1)
+        self._moon_times_cache = {
+            k: v for k, v in self._moon_times_cache.items() if k >= yesterday
+        }
+        self._moon_times_cache[date] = result
+        return result
+
+    def _compute_moon_times(self, date: datetime.date) -> Optional[MoonTimes]:
+        """
+        Search for moonrise and moonset from local midnight of a date.
+
+        Args:
+            date: Date to get times for
+
+        Returns:
+            MoonTimes with rise and set times, or None on failure
+        """
+        ephem = _ephem()
 
         try:
             # Anchor the search at local midnight (ephem works in UTC)
@@ -181,12 +455,11 @@ class LunarProvider:
                 datetime.timezone.utc
             ).replace(tzinfo=None)
             observer = self._observer
-
-            moon = ephem.Moon()
+            moon = self._moon
 
             try:
                 rise = observer.next_rising(moon)
-                moonrise = self._utc_to_local(ephem.Date(rise).datetime())
+                moonrise = self._utc_to_local(rise.datetime())
             except ephem.NeverUpError:
                 moonrise = None
             except ephem.AlwaysUpError:
@@ -194,7 +467,7 @@ class LunarProvider:
 
             try:
                 set_time = observer.next_setting(moon)
-                moonset = self._utc_to_local(ephem.Date(set_time).datetime())
+                moonset = self._utc_to_local(set_time.datetime())
             except ephem.NeverUpError:
                 moonset = None
             except ephem.AlwaysUpError:
@@ -206,24 +479,22 @@ class LunarProvider:
             logger.warning(f"Failed to calculate moon times: {e}")
             return None
 
-    def get_solstice_equinox(self, year: int) -> SolsticeEquinox:
+    def get_solstice_equinox(self, year: int, exact: bool = False) -> SolsticeEquinox:
         """
         Get solstice and equinox dates for a year.
 
         Args:
             year: Year to calculate for
+            exact: Search for each event with ephem instead of using the
+                closed-form approximation
 
         Returns:
             SolsticeEquinox with all four dates
         """
-        if not EPHEM_AVAILABLE:
-            # Return approximate dates as fallback
-            return SolsticeEquinox(
-                spring_equinox=datetime.date(year, 3, 20),
-                summer_solstice=datetime.date(year, 6, 21),
-                fall_equinox=datetime.date(year, 9, 22),
-                winter_solstice=datetime.date(year, 12, 21),
-            )
+        if not (exact and EPHEM_AVAILABLE):
+            return _meeus_solstice_equinox(year)
+
+        ephem = _ephem()
 
         try:
             start = f"{year}/1/1"
@@ -234,29 +505,26 @@ class LunarProvider:
             winter = ephem.next_winter_solstice(start)
 
             return SolsticeEquinox(
-                spring_equinox=ephem.Date(spring).datetime().date(),
-                summer_solstice=ephem.Date(summer).datetime().date(),
-                fall_equinox=ephem.Date(fall).datetime().date(),
-                winter_solstice=ephem.Date(winter).datetime().date(),
+                spring_equinox=_ephem_to_date(spring),
+                summer_solstice=_ephem_to_date(summer),
+                fall_equinox=_ephem_to_date(fall),
+                winter_solstice=_ephem_to_date(winter),
             )
 
         except (ValueError, AttributeError) as e:
             logger.warning(f"Failed to calculate solstice/equinox: {e}")
-            return SolsticeEquinox(
-                spring_equinox=datetime.date(year, 3, 20),
-                summer_solstice=datetime.date(year, 6, 21),
-                fall_equinox=datetime.date(year, 9, 22),
-                winter_solstice=datetime.date(year, 12, 21),
-            )
+            return _meeus_solstice_equinox(year)
 
     def get_equation_of_time(
-        self, date: Optional[datetime.date] = None
+        self, date: Optional[datetime.date] = None, accurate: bool = False
     ) -> Optional[float]:
         """
         Get equation of time (difference between solar and clock time).
 
         Args:
             date: Date to calculate for (default: today)
+            accurate: Solve the sun's transit with ephem instead of using
+                the closed-form approximation
 
         Returns:
             Minutes that sun is early (positive) or late (negative)
@@ -267,18 +535,20 @@ class LunarProvider:
         if date is None:
             date = datetime.date.today()
 
+        if not accurate:
+            return _eot_meeus(date.timetuple().tm_yday)
+
         try:
             # Set date to noon UTC on the shared prime-meridian observer
             dt = datetime.datetime(date.year, date.month, date.day, 12, 0)
             self._eot_observer.date = dt
 
             # Find when sun transits (crosses meridian)
-            sun = ephem.Sun()
-            transit = self._eot_observer.next_transit(sun)
+            transit = self._eot_observer.next_transit(self._sun)
 
             # Equation of time = 12:00 - transit time (in minutes)
             # Positive = sun is early (ahead of clock), negative = sun is late
-            transit_dt = ephem.Date(transit).datetime()
+            transit_dt = transit.datetime()
             eot_minutes = (12 * 60) - (
                 transit_dt.hour * 60 + transit_dt.minute + transit_dt.second / 60
             )
@@ -293,59 +563,160 @@ class LunarProvider:
         """
         Get analemma data points for the year.
 
+        Returns:
+            List of AnalemmaPoint for each week of the year
+        """
+        series = self.get_analemma_series()
+        if series is None:
+            return []
+
+        return [
+            AnalemmaPoint(elevation=elev, equation_of_time=eot, date=date)
+            for elev, eot, date in zip(
+                series.elevations.tolist(),
+                series.equations_of_time.tolist(),
+                series.dates,
+            )
+        ]
+
+    def get_analemma_series(self) -> Optional[AnalemmaSeries]:
+        """
+        Get analemma samples for the year as parallel arrays.
+
         Calculates sun position at solar noon (transit) for each sample date,
         giving the characteristic figure-8 pattern.
 
         Returns:
-            List of AnalemmaPoint for each week of the year
+            AnalemmaSeries with one sample per week of the year, or None
         """
         if not EPHEM_AVAILABLE:
-            return []
+            return None
 
         year = datetime.date.today().year
         if self._analemma_cache is not None and self._analemma_cache[0] == year:
             return self._analemma_cache[1]
 
-        points = []
+        # Sample every 7 days
+        start = datetime.date(year, 1, 1)
+        days_in_year = (datetime.date(year + 1, 1, 1) - start).days
+        dates = tuple(
+            start + datetime.timedelta(days=d) for d in range(0, days_in_year, 7)
+        )
+
+        series = self._load_analemma(year, dates)
+        if series is not None:
+            self._analemma_cache = (year, series)
+            return series
+
+        ephem = _ephem()
 
         try:
-            observer = ephem.Observer()
-            observer.lat = str(self.latitude)
-            observer.lon = str(self.longitude)
-            observer.pressure = 0  # No refraction for consistency
-
-            # Sample every 7 days
-            date = datetime.date(year, 1, 1)
-            while date.year == year:
-                # Set observer to morning of this date
-                observer.date = datetime.datetime(date.year, date.month, date.day, 6, 0)
-
-                sun = ephem.Sun()
+            observer = self._analemma_observer
+            sun = self._sun
+            transits = np.empty(len(dates))
+            elevations = np.empty(len(dates))
+            # First search starts at local mean midnight on January 1
+            observer.date = ephem.Date(start) - self.longitude / 360
+            for i in range(len(dates)):
                 # Find solar noon (transit) for this date
                 transit = observer.next_transit(sun)
                 observer.date = transit
                 sun.compute(observer)
 
-                # Elevation at solar noon
-                elevation = float(sun.alt) * 180 / ephem.pi
-                eot = self.get_equation_of_time(date) or 0
+                transits[i] = transit
+                elevations[i] = sun.alt
 
-                points.append(
-                    AnalemmaPoint(
-                        elevation=elevation,
-                        equation_of_time=eot,
-                        date=date,
-                    )
-                )
+                # Transits drift by minutes per week, so seed the next search
+                # half a day ahead of next week's instead of from scratch
+                observer.date = transit + 6.5
 
-                date += datetime.timedelta(days=7)
+            # Equation of time from the same transits: 12:00 local mean solar
+            # time minus the transit's local mean time (ephem days start at noon)
+            mean_minutes = ((transits + 0.5) % 1.0) * 1440 + self.longitude * 4
+            eots = 720 - mean_minutes % 1440
+            np.degrees(elevations, out=elevations)
 
-            self._analemma_cache = (year, points)
-            return points
+            # The series is cached and shared between callers
+            eots.flags.writeable = False
+            elevations.flags.writeable = False
+            series = AnalemmaSeries(
+                elevations=elevations, equations_of_time=eots, dates=dates
+            )
+            self._analemma_cache = (year, series)
+            self._store_analemma(year, series)
+            return series
 
         except (ValueError, AttributeError) as e:
             logger.warning(f"Failed to calculate analemma: {e}")
-            return []
+            return None
+
+    def _analemma_cache_path(self, year: int) -> Optional[Path]:
+        """Disk cache file for a year's analemma at this location."""
+        if self.cache_dir is None:
+            return None
+        name = f"analemma_{year}_{self.latitude:.4f}_{self.longitude:.4f}.json"
+        return self.cache_dir / name
+
+    def _load_analemma(
+        self, year: int, dates: tuple[datetime.date, ...]
+    ) -> Optional[AnalemmaSeries]:
+        """
+        Load a persisted analemma, if one exists for this year and location.
+
+        Args:
+            year: Year of the series
+            dates: Expected sample dates
+
+        Returns:
+            AnalemmaSeries, or None on a miss or an unreadable file
+        """
+        path = self._analemma_cache_path(year)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            elevations = np.array(data["elevations"], dtype=np.float64)
+            eots = np.array(data["equations_of_time"], dtype=np.float64)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable analemma cache {path}: {e}")
+            return None
+
+        if elevations.shape != (len(dates),) or eots.shape != (len(dates),):
+            logger.warning(f"Ignoring analemma cache {path}: wrong sample count")
+            return None
+
+        elevations.flags.writeable = False
+        eots.flags.writeable = False
+        return AnalemmaSeries(
+            elevations=elevations, equations_of_time=eots, dates=dates
+        )
+
+    def _store_analemma(self, year: int, series: AnalemmaSeries) -> None:
+        """Persist an analemma atomically; failures only cost a recompute."""
+        path = self._analemma_cache_path(year)
+        if path is None:
+            return
+
+        data = {
+            "elevations": series.elevations.tolist(),
+            "equations_of_time": series.equations_of_time.tolist(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write analemma cache {path}: {e}")
 
     def _utc_to_local(self, utc_naive: datetime.datetime) -> datetime.datetime:
         """Convert a naive UTC datetime (as returned by ephem) to local time."""
@@ -362,21 +733,4 @@ class LunarProvider:
         Returns:
             Human-readable phase name
         """
-        if phase < 0.03:
-            return "New Moon"
-        elif phase < 0.22:
-            return "Waxing Crescent"
-        elif phase < 0.28:
-            return "First Quarter"
-        elif phase < 0.47:
-            return "Waxing Gibbous"
-        elif phase < 0.53:
-            return "Full Moon"
-        elif phase < 0.72:
-            return "Waning Gibbous"
-        elif phase < 0.78:
-            return "Last Quarter"
-        elif phase < 0.97:
-            return "Waning Crescent"
-        else:
-            return "New Moon"
+        return _PHASE_NAMES[bisect.bisect_right(_PHASE_THRESHOLDS, phase)]
@@ -1,18 +1,32 @@
 """Solar data provider using astral library."""
 
+import bisect
 import datetime
+import functools
 import logging
+import sys
 from dataclasses import dataclass
 from typing import Optional
 from zoneinfo import ZoneInfo
 
-from astral import LocationInfo
-from astral.sun import sun, elevation, azimuth, golden_hour, twilight, SunDirection
+from astral import LocationInfo, Observer
+from astral.sun import (
+    sun,
+    sunrise,
+    sunset,
+    zenith_and_azimuth,
+    golden_hour,
+    twilight,
+    SunDirection,
+)
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) is only accepted on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class SunTimes:
     """Sun event times for a day."""
 
@@ -23,7 +37,7 @@ class SunTimes:
     dusk: datetime.datetime
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class GoldenHour:
     """Golden hour time range."""
 
@@ -31,7 +45,7 @@ class GoldenHour:
     end: datetime.datetime
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SolarPosition:
     """Current sun position in the sky."""
 
@@ -39,6 +53,49 @@ class SolarPosition:
     azimuth: float  # Degrees from north (0-360)
 
 
+# Names of the SunTimes events, in chronological order
+_EVENT_NAMES = ("Dawn", "Sunrise", "Solar Noon", "Sunset", "Dusk")
+
+# (dawn, sunrise, noon, sunset, dusk)
+_SunTuple = tuple[
+    datetime.datetime,
+    datetime.datetime,
+    datetime.datetime,
+    datetime.datetime,
+    datetime.datetime,
+]
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_sun_times(
+    latitude: float, longitude: float, tz_name: str, date: datetime.date
+) -> Optional[_SunTuple]:
+    """
+    Compute sun event times for a location and date.
+
+    Memoized across providers, so repeated same-day queries (golden hour,
+    day length, next event) skip astral's sunrise/sunset equations.
+
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        tz_name: Timezone string (e.g., "America/New_York")
+        date: Date to get times for
+
+    Returns:
+        Tuple of (dawn, sunrise, noon, sunset, dusk), or None if unavailable
+    """
+    try:
+        s = sun(Observer(latitude, longitude), date=date, tzinfo=tz_name)
+        return s["dawn"], s["sunrise"], s["noon"], s["sunset"], s["dusk"]
+    except ValueError as e:
+        # Can happen at extreme latitudes (polar day/night)
+        logger.warning(f"Could not calculate sun times for {date}: {e}")
+    except KeyError as e:
+        logger.error(f"Missing sun time data: {e}")
+    return None
+
+
 class SolarProvider:
     """
     Provides solar calculation data.
@@ -73,7 +130,8 @@ class SolarProvider:
             longitude=longitude,
         )
         self.tz = ZoneInfo(timezone)
-        self._sun_times_cache: dict = {}  # date -> Optional[SunTimes]
+        self._observer = self.location.observer
+        self._day_length_cache: dict = {}  # date -> Optional[float]
 
     def get_sun_times(self, date: Optional[datetime.date] = None) -> Optional[SunTimes]:
         """
@@ -88,33 +146,15 @@ class SolarProvider:
         if date is None:
             date = datetime.date.today()
 
-        if date in self._sun_times_cache:
-            return self._sun_times_cache[date]
-
-        try:
-            s = sun(self.location.observer, date=date, tzinfo=self.location.timezone)
-            result: Optional[SunTimes] = SunTimes(
-                dawn=s["dawn"],
-                sunrise=s["sunrise"],
-                noon=s["noon"],
-                sunset=s["sunset"],
-                dusk=s["dusk"],
-            )
-        except ValueError as e:
-            # Can happen at extreme latitudes (polar day/night)
-            logger.warning(f"Could not calculate sun times for {date}: {e}")
-            result = None
-        except KeyError as e:
-            logger.error(f"Missing sun time data: {e}")
-            result = None
-
-        # Evict entries older than today to prevent unbounded growth
-        today = datetime.date.today()
-        self._sun_times_cache = {
-            k: v for k, v in self._sun_times_cache.items() if k >= today
-        }
-        self._sun_times_cache[date] = result
-        return result
+        times = _compute_sun_times(
+            self.location.latitude,
+            self.location.longitude,
+            self.location.timezone,
+            date,
+        )
+        if times is None:
+            return None
+        return SunTimes(*times)
 
     def get_solar_position(
         self, dt: Optional[datetime.datetime] = None
@@ -132,9 +172,10 @@ class SolarProvider:
             dt = datetime.datetime.now(datetime.timezone.utc)
 
         try:
-            elev = elevation(self.location.observer, dt)
-            azim = azimuth(self.location.observer, dt)
-            return SolarPosition(elevation=elev, azimuth=azim)
+            # One solve for both angles (astral's elevation() and azimuth()
+            # each run the full position calculation)
+            zenith, azim = zenith_and_azimuth(self._observer, dt, True)
+            return SolarPosition(elevation=90.0 - zenith, azimuth=azim)
         except ValueError as e:
             logger.warning(f"Could not calculate solar position: {e}")
             return None
@@ -163,7 +204,7 @@ class SolarProvider:
         try:
             # Morning golden hour (sun rising through golden zone)
             morning_times = golden_hour(
-                self.location.observer,
+                self._observer,
                 date,
                 direction=SunDirection.RISING,
                 tzinfo=self.location.timezone,
@@ -176,7 +217,7 @@ class SolarProvider:
         try:
             # Evening golden hour (sun setting through golden zone)
             evening_times = golden_hour(
-                self.location.observer,
+                self._observer,
                 date,
                 direction=SunDirection.SETTING,
                 tzinfo=self.location.timezone,
@@ -204,9 +245,7 @@ class SolarProvider:
             date = datetime.date.today()
 
         try:
-            dawn, dusk = twilight(
-                self.location.observer, date, tzinfo=self.location.timezone
-            )
+            dawn, dusk = twilight(self._observer, date, tzinfo=self.location.timezone)
             return dawn, dusk
         except ValueError as e:
             logger.warning(f"Could not calculate twilight for {date}: {e}")
@@ -222,24 +261,58 @@ class SolarProvider:
         Returns:
             Day length in hours, or None if unavailable
         """
-        sun_times = self.get_sun_times(date)
-        if sun_times is None:
-            return None
+        today = datetime.date.today()
+        if date is None:
+            date = today
 
-        if sun_times.sunrise and sun_times.sunset:
-            delta = sun_times.sunset - sun_times.sunrise
-            return delta.total_seconds() / 3600
+        if date in self._day_length_cache:
+            return self._day_length_cache[date]
 
-        return None
+        result = self._day_length_only(date)
+
+        # Evict entries older than yesterday; get_day_length_change() reads it
+        yesterday = today - datetime.timedelta(days=1)
+        self._day_length_cache = {
+            k: v for k, v in self._day_length_cache.items() if k >= yesterday
+        }
+        self._day_length_cache[date] = result
+        return result
+
+    def _day_length_only(self, date: datetime.date) -> Optional[float]:
+        """
+        Compute day length from sunrise and sunset alone.
+
+        Skips the dawn, noon and dusk solves that get_sun_times() performs.
+
+        Args:
+            date: Date to calculate for
+
+        Returns:
+            Day length in hours, or None at polar day/night
+        """
+        observer = self._observer
+        tz = self.location.timezone
+        try:
+            rise = sunrise(observer, date, tzinfo=tz)
+            fall = sunset(observer, date, tzinfo=tz)
+        except ValueError as e:
+            logger.warning(f"Could not calculate day length for {date}: {e}")
+            return None
+        return (fall - rise).total_seconds() / 3600
 
-    def get_day_length_change(self) -> Optional[float]:
+    def get_day_length_change(
+        self, date: Optional[datetime.date] = None
+    ) -> Optional[float]:
         """
-        Get day length change from yesterday.
+        Get day length change from the previous day.
+
+        Args:
+            date: Date to compare with the day before (default: today)
 
         Returns:
             Change in minutes (positive = longer days)
         """
-        today = datetime.date.today()
+        today = date if date is not None else datetime.date.today()
         yesterday = today - datetime.timedelta(days=1)
 
         today_length = self.get_day_length(today)
@@ -250,30 +323,38 @@ class SolarProvider:
 
         return None
 
-    def get_next_solar_event(self) -> Optional[tuple[str, datetime.datetime]]:
+    def get_next_solar_event(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[tuple[str, datetime.datetime]]:
         """
         Get the next upcoming solar event.
 
+        Args:
+            now: Time to search from (default: now). Pass the caller's own
+                reading of the clock so countdowns against it never go negative.
+
         Returns:
             Tuple of (event_name, event_time) for dawn, sunrise, solar noon, sunset, or dusk
         """
-        now = datetime.datetime.now(self.tz)
+        if now is None:
+            now = datetime.datetime.now(self.tz)
+        else:
+            now = now.astimezone(self.tz)
         sun_times = self.get_sun_times(now.date())
 
         if sun_times is None:
             return None
 
-        events = [
-            ("Dawn", sun_times.dawn),
-            ("Sunrise", sun_times.sunrise),
-            ("Solar Noon", sun_times.noon),
-            ("Sunset", sun_times.sunset),
-            ("Dusk", sun_times.dusk),
-        ]
-
-        for name, event_time in events:
-            if event_time and event_time > now:
-                return name, event_time
+        events = (
+            sun_times.dawn,
+            sun_times.sunrise,
+            sun_times.noon,
+            sun_times.sunset,
+            sun_times.dusk,
+        )
+        i = bisect.bisect_right(events, now)
+        if i < len(events):
+            return _EVENT_NAMES[i], events[i]
 
         # All today's events passed, get tomorrow's dawn
         tomorrow = now.date() + datetime.timedelta(days=1)
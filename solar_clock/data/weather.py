@@ -1,15 +1,79 @@
 """Weather data provider using OpenWeatherMap API."""
 
+import bisect
+import datetime
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 import requests
 
+from .. import __version__
+
+# Try to import orjson (optional, faster JSON decoding)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# OpenWeatherMap endpoints; the query (location, key, units) comes from
+# the session's default params
+_CURRENT_URL = "https://api.openweathermap.org/data/2.5/weather"
+_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+_AIR_POLLUTION_URL = "https://api.openweathermap.org/data/2.5/air_pollution"
+_ONE_CALL_URL = "https://api.openweathermap.org/data/3.0/onecall"
+_ONE_CALL_PARAMS = {"exclude": "minutely,hourly,alerts"}
+
+_NS_PER_S = 1_000_000_000
+
+# US EPA PM2.5 breakpoints: (c_low, c_high, i_low, i_high)
+_PM25_BREAKPOINTS = (
+    (0.0, 12.0, 0, 50),
+    (12.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 150.4, 151, 200),
+    (150.5, 250.4, 201, 300),
+    (250.5, 500.4, 301, 500),
+)
+# Split into parallel tables so a bisect on c_high finds the segment
+_PM25_C_HIGH = tuple(c_high for _, c_high, _, _ in _PM25_BREAKPOINTS)
+_PM25_C_LOW = tuple(c_low for c_low, _, _, _ in _PM25_BREAKPOINTS)
+_PM25_I_LOW = tuple(i_low for _, _, i_low, _ in _PM25_BREAKPOINTS)
+_PM25_SLOPE = tuple(
+    (i_high - i_low) / (c_high - c_low)
+    for c_low, c_high, i_low, i_high in _PM25_BREAKPOINTS
+)
+
+# 16-point compass direction for every whole degree, so converting a wind
+# bearing is one index instead of a float divide per call
+_COMPASS_POINTS = (
+    "N",
+    "NNE",
+    "NE",
+    "ENE",
+    "E",
+    "ESE",
+    "SE",
+    "SSE",
+    "S",
+    "SSW",
+    "SW",
+    "WSW",
+    "W",
+    "WNW",
+    "NW",
+    "NNW",
+)
+_COMPASS_LUT = tuple(_COMPASS_POINTS[int((d + 11.25) / 22.5) % 16] for d in range(360))
+
 
 @dataclass
 class CurrentWeather:
@@ -52,13 +116,20 @@ class WeatherProvider:
     """
     Provides weather and air quality data from OpenWeatherMap API.
 
-    Data is cached and refreshed at configurable intervals.
+    Data is cached and refreshed at configurable intervals. Once start() has
+    been called, refreshes run on a background thread and the getters only
+    read the cache, so a slow or unreachable API never stalls rendering.
     """
 
     # Seconds to wait after a failed fetch before trying again. Without this,
     # views that render every second would retry (and block) on every tick
-    # while the network or API is down.
+    # while the network or API is down. The wait doubles with each further
+    # consecutive failure, up to MAX_RETRY_BACKOFF, and resets on success.
     RETRY_BACKOFF = 60
+    MAX_RETRY_BACKOFF = 3600
+
+    # How often the background thread checks whether a cache has gone stale.
+    REFRESH_POLL = 30
 
     # AQI breakpoints for US EPA scale
     AQI_BREAKPOINTS = [
@@ -69,6 +140,9 @@ class WeatherProvider:
         (201, 300, "Very Unhealthy"),
         (301, 500, "Hazardous"),
     ]
+    # Upper bound of each category but the last, for bisecting in _aqi_category
+    _AQI_CATEGORY_LIMITS = tuple(high for _, high, _ in AQI_BREAKPOINTS[:-1])
+    _AQI_CATEGORIES = tuple(name for _, _, name in AQI_BREAKPOINTS)
 
     def __init__(
         self,
@@ -78,6 +152,7 @@ class WeatherProvider:
         units: str = "imperial",
         weather_interval: int = 900,
         aqi_interval: int = 1800,
+        one_call: bool = False,
     ):
         """
         Initialize weather provider.
@@ -89,6 +164,9 @@ class WeatherProvider:
             units: "imperial" or "metric"
             weather_interval: Weather cache duration in seconds
             aqi_interval: AQI cache duration in seconds
+            one_call: Fetch current weather and forecast with a single One
+                Call 3.0 request (needs a One Call subscription) instead of
+                the free 2.5 weather and forecast endpoints
         """
         self.api_key = api_key
         self.latitude = latitude
@@ -96,27 +174,169 @@ class WeatherProvider:
         self.units = units
         self.weather_interval = weather_interval
         self.aqi_interval = aqi_interval
+        self.one_call = one_call
 
         # Cache
         self._current_weather: Optional[CurrentWeather] = None
         self._forecast: Optional[list[DailyForecast]] = None
         self._air_quality: Optional[AirQuality] = None
-        self._weather_updated: float = 0
-        self._aqi_updated: float = 0
-        self._weather_attempted: float = 0
-        self._aqi_attempted: float = 0
+        # Monotonic-clock deadlines (ns): caches are fresh until *_deadline,
+        # and after a fetch attempt no retry happens before *_retry_at
+        self._weather_deadline = 0
+        self._aqi_deadline = 0
+        self._weather_retry_at = 0
+        self._aqi_retry_at = 0
+        # Consecutive failed (or in-progress) fetches, for backoff
+        self._weather_failures = 0
+        self._aqi_failures = 0
+
+        # Background refresh
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # One session for all endpoints, so refreshes reuse the pooled
+        # keep-alive connection instead of paying a TLS handshake per call
+        params: dict[str, Union[str, float]] = {
+            "lat": latitude,
+            "lon": longitude,
+            "appid": api_key,
+            "units": units,
+        }
+        self._session = requests.Session()
+        self._session.params = params
+        self._session.headers.update(
+            {
+                "User-Agent": f"solar-clock/{__version__}",
+                "Accept-Encoding": "gzip",
+            }
+        )
 
-    def get_current_weather(self) -> Optional[CurrentWeather]:
+        # Set while a background revalidation of that cache is running
+        self._weather_inflight = threading.Event()
+        self._aqi_inflight = threading.Event()
+
+        # Workers for the weather, forecast and AQI requests of one refresh
+        self._executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="weather-fetch"
+        )
+
+    def start(self) -> bool:
         """
-        Get current weather conditions.
+        Start refreshing weather and AQI data on a background thread.
+
+        Returns:
+            True if the refresh thread was started
+        """
+        if not self.api_key:
+            logger.warning("No API key configured, background refresh disabled")
+            return False
+        if self._thread:
+            return True
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+        logger.info("Weather refresh thread started")
+        return True
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop background refresh and release pooled HTTP connections."""
+        self.stop()
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def _refresh_loop(self) -> None:
+        """Background loop: refresh stale caches, then sleep until next check."""
+        while True:
+            self.refresh_all()
+            if self._stop_event.wait(self.REFRESH_POLL):
+                break
+
+    def refresh_all(self) -> None:
+        """
+        Refresh every stale cache, overlapping all API requests.
+
+        The AQI request runs on the pool while the weather and forecast
+        requests are in flight, so a refresh takes as long as the slowest
+        endpoint rather than the sum of all three.
+        """
+        aqi_future = None
+        if self._aqi_due():
+            aqi_future = self._executor.submit(self._fetch_air_quality)
+        if self._weather_due():
+            self._fetch_weather()
+        if aqi_future is not None:
+            aqi_future.result()
+
+    def _weather_due(self) -> bool:
+        """Check if weather is stale and no retry is pending."""
+        return self._due(self._weather_deadline, self._weather_retry_at)
+
+    def _aqi_due(self) -> bool:
+        """Check if air quality is stale and no retry is pending."""
+        return self._due(self._aqi_deadline, self._aqi_retry_at)
 
-        Returns cached data if still fresh, otherwise fetches new data.
+    def _refresh_weather_if_stale(self) -> None:
         """
-        if self._is_cache_valid(self._weather_updated, self.weather_interval):
-            return self._current_weather
+        Refresh weather unless the cache is fresh or a retry is pending.
 
-        if not self._in_backoff(self._weather_attempted):
+        An empty cache is fetched synchronously; stale data is revalidated
+        on the pool while the caller keeps using it.
+        """
+        if not self._weather_due():
+            return
+        if self._current_weather is None:
             self._fetch_weather()
+        else:
+            self._revalidate(self._fetch_weather, self._weather_inflight)
+
+    def _refresh_aqi_if_stale(self) -> None:
+        """
+        Refresh air quality unless the cache is fresh or a retry is pending.
+
+        An empty cache is fetched synchronously; stale data is revalidated
+        on the pool while the caller keeps using it.
+        """
+        if not self._aqi_due():
+            return
+        if self._air_quality is None:
+            self._fetch_air_quality()
+        else:
+            self._revalidate(self._fetch_air_quality, self._aqi_inflight)
+
+    def _revalidate(self, fetch: Callable[[], None], inflight: threading.Event) -> None:
+        """Run a fetch on the pool unless one for the same data is in flight."""
+        with self._lock:
+            if inflight.is_set():
+                return
+            inflight.set()
+
+        def run() -> None:
+            try:
+                fetch()
+            finally:
+                inflight.clear()
+
+        self._executor.submit(run)
+
+    def get_current_weather(self) -> Optional[CurrentWeather]:
+        """
+        Get current weather conditions.
+
+        Returns cached data. Without a running refresh thread, an empty cache
+        is fetched synchronously first, and stale data is returned while it
+        is refreshed in the background.
+        """
+        if self._thread is None:
+            self._refresh_weather_if_stale()
         return self._current_weather
 
     def get_forecast(self, days: int = 3) -> Optional[list[DailyForecast]]:
@@ -129,91 +349,69 @@ class WeatherProvider:
         Returns:
             List of daily forecasts, or None if unavailable
         """
-        if self._is_cache_valid(self._weather_updated, self.weather_interval):
-            return self._forecast[:days] if self._forecast else None
-
-        if not self._in_backoff(self._weather_attempted):
-            self._fetch_weather()
-        return self._forecast[:days] if self._forecast else None
+        if self._thread is None:
+            self._refresh_weather_if_stale()
+        with self._lock:
+            forecast = self._forecast
+        return forecast[:days] if forecast else None
 
     def get_air_quality(self) -> Optional[AirQuality]:
         """Get current air quality data."""
-        if self._is_cache_valid(self._aqi_updated, self.aqi_interval):
-            return self._air_quality
-
-        if not self._in_backoff(self._aqi_attempted):
-            self._fetch_air_quality()
+        if self._thread is None:
+            self._refresh_aqi_if_stale()
         return self._air_quality
 
-    def _is_cache_valid(self, last_update: float, interval: int) -> bool:
-        """Check if cached data is still valid."""
-        return time.time() - last_update < interval
+    def _retry_delay_ns(self, failures: int) -> int:
+        """
+        Get the minimum wait before the next fetch attempt.
 
-    def _in_backoff(self, last_attempt: float) -> bool:
-        """Check if a recent fetch attempt means we should not retry yet."""
-        return time.time() - last_attempt < self.RETRY_BACKOFF
+        Args:
+            failures: Consecutive failed attempts so far
+
+        Returns:
+            RETRY_BACKOFF doubled per previous failure, capped at
+            MAX_RETRY_BACKOFF, in nanoseconds
+        """
+        # Cap the exponent too, so the shift stays small
+        delay = self.RETRY_BACKOFF << min(failures, 16)
+        return min(delay, self.MAX_RETRY_BACKOFF) * _NS_PER_S
+
+    @staticmethod
+    def _due(deadline: int, retry_at: int) -> bool:
+        """
+        Check if a cache is stale and no retry is pending.
+
+        Deadlines are on the monotonic clock, so NTP steps or manual clock
+        changes neither expire caches early nor stall refreshes.
+        """
+        return time.monotonic_ns() >= max(deadline, retry_at)
 
     def _fetch_weather(self) -> None:
-        """Fetch current weather and forecast from API concurrently."""
+        """Fetch current weather and forecast, committing both together."""
         if not self.api_key:
             logger.warning("No API key configured, skipping weather fetch")
             return
 
-        self._weather_attempted = time.time()
-
-        current_url = (
-            f"https://api.openweathermap.org/data/2.5/weather"
-            f"?lat={self.latitude}&lon={self.longitude}"
-            f"&appid={self.api_key}&units={self.units}"
-        )
-        forecast_url = (
-            f"https://api.openweathermap.org/data/2.5/forecast"
-            f"?lat={self.latitude}&lon={self.longitude}"
-            f"&appid={self.api_key}&units={self.units}"
+        self._weather_retry_at = time.monotonic_ns() + self._retry_delay_ns(
+            self._weather_failures
         )
+        # Counted as failed until it succeeds
+        self._weather_failures += 1
 
         try:
-            # Fetch both endpoints concurrently
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                current_future = executor.submit(requests.get, current_url, timeout=10)
-                forecast_future = executor.submit(
-                    requests.get, forecast_url, timeout=10
-                )
-
-                current_resp = current_future.result()
-                forecast_resp = forecast_future.result()
-
-            current_resp.raise_for_status()
-            current_data = current_resp.json()
-
-            # Parse current weather into local variable (defensive parsing)
-            main = current_data.get("main", {})
-            weather_list = current_data.get("weather", [{}])
-            wind = current_data.get("wind", {})
-
-            new_weather = CurrentWeather(
-                temperature=main.get("temp", 0),
-                feels_like=main.get("feels_like", 0),
-                humidity=main.get("humidity", 0),
-                description=(
-                    weather_list[0].get("description", "Unknown").title()
-                    if weather_list
-                    else "Unknown"
-                ),
-                wind_speed=wind.get("speed", 0),
-                wind_direction=self._degrees_to_compass(wind.get("deg", 0)),
-            )
-
-            forecast_resp.raise_for_status()
-            forecast_data = forecast_resp.json()
-
-            # Parse forecast into local variable
-            new_forecast = self._parse_forecast(forecast_data)
+            if self.one_call:
+                new_weather, new_forecast = self._fetch_one_call()
+            else:
+                new_weather, new_forecast = self._fetch_current_and_forecast()
 
             # Commit atomically — only if BOTH succeeded
-            self._current_weather = new_weather
-            self._forecast = new_forecast
-            self._weather_updated = time.time()
+            with self._lock:
+                self._current_weather = new_weather
+                self._forecast = new_forecast
+                self._weather_deadline = (
+                    time.monotonic_ns() + self.weather_interval * _NS_PER_S
+                )
+                self._weather_failures = 0
             logger.debug("Weather data updated successfully")
 
         except requests.Timeout:
@@ -225,23 +423,107 @@ class WeatherProvider:
         except (KeyError, ValueError) as e:
             logger.warning(f"Failed to parse weather data: {e}")
 
+    def _fetch_current_and_forecast(
+        self,
+    ) -> tuple[CurrentWeather, list[DailyForecast]]:
+        """Fetch the 2.5 current weather and 3-hourly forecast concurrently."""
+        # Fetch both endpoints concurrently
+        current_future = self._executor.submit(
+            self._session.get, _CURRENT_URL, timeout=10
+        )
+        forecast_future = self._executor.submit(
+            self._session.get, _FORECAST_URL, timeout=10
+        )
+
+        current_resp = current_future.result()
+        forecast_resp = forecast_future.result()
+
+        current_resp.raise_for_status()
+        current_data = self._decode_json(current_resp)
+
+        # Parse current weather into local variable (defensive parsing)
+        main = current_data.get("main", {})
+        weather_list = current_data.get("weather", [{}])
+        wind = current_data.get("wind", {})
+
+        new_weather = CurrentWeather(
+            temperature=main.get("temp", 0),
+            feels_like=main.get("feels_like", 0),
+            humidity=main.get("humidity", 0),
+            description=(
+                weather_list[0].get("description", "Unknown").title()
+                if weather_list
+                else "Unknown"
+            ),
+            wind_speed=wind.get("speed", 0),
+            wind_direction=self._degrees_to_compass(wind.get("deg", 0)),
+        )
+
+        forecast_resp.raise_for_status()
+        forecast_data = self._decode_json(forecast_resp)
+
+        return new_weather, self._parse_forecast(forecast_data)
+
+    def _fetch_one_call(self) -> tuple[CurrentWeather, list[DailyForecast]]:
+        """Fetch current weather and daily forecast in one One Call 3.0 request."""
+        resp = self._session.get(_ONE_CALL_URL, params=_ONE_CALL_PARAMS, timeout=10)
+        resp.raise_for_status()
+        return self._parse_one_call(self._decode_json(resp))
+
+    def _parse_one_call(self, data: dict) -> tuple[CurrentWeather, list[DailyForecast]]:
+        """Parse a One Call response into current conditions and daily forecasts."""
+        current = data["current"]
+        weather_list = current.get("weather", [{}])
+        new_weather = CurrentWeather(
+            temperature=current.get("temp", 0),
+            feels_like=current.get("feels_like", 0),
+            humidity=current.get("humidity", 0),
+            description=(
+                weather_list[0].get("description", "Unknown").title()
+                if weather_list
+                else "Unknown"
+            ),
+            wind_speed=current.get("wind_speed", 0),
+            wind_direction=self._degrees_to_compass(current.get("wind_deg", 0)),
+        )
+
+        # Daily timestamps are UTC; shift to the location's zone for the date
+        offset = data.get("timezone_offset", 0)
+        forecasts = []
+        for day in data.get("daily", [])[:5]:
+            temp = day.get("temp")
+            if not temp:
+                continue
+            date = datetime.datetime.fromtimestamp(
+                day["dt"] + offset, datetime.timezone.utc
+            )
+            forecasts.append(
+                DailyForecast(
+                    date=date.strftime("%Y-%m-%d"),
+                    high_temp=temp["max"],
+                    low_temp=temp["min"],
+                    rain_chance=int(day.get("pop", 0) * 100),
+                )
+            )
+
+        return new_weather, forecasts
+
     def _fetch_air_quality(self) -> None:
         """Fetch air quality data from API."""
         if not self.api_key:
             logger.warning("No API key configured, skipping AQI fetch")
             return
 
-        self._aqi_attempted = time.time()
+        self._aqi_retry_at = time.monotonic_ns() + self._retry_delay_ns(
+            self._aqi_failures
+        )
+        # Counted as failed until it succeeds
+        self._aqi_failures += 1
 
         try:
-            url = (
-                f"https://api.openweathermap.org/data/2.5/air_pollution"
-                f"?lat={self.latitude}&lon={self.longitude}"
-                f"&appid={self.api_key}"
-            )
-            resp = requests.get(url, timeout=10)
+            resp = self._session.get(_AIR_POLLUTION_URL, timeout=10)
             resp.raise_for_status()
-            data = resp.json()
+            data = self._decode_json(resp)
 
             components = data["list"][0]["components"]
 
@@ -250,7 +532,7 @@ class WeatherProvider:
             aqi = self._pm25_to_aqi(pm25)
             category = self._aqi_category(aqi)
 
-            self._air_quality = AirQuality(
+            new_air_quality = AirQuality(
                 aqi=aqi,
                 category=category,
                 pm25=components.get("pm2_5", 0),
@@ -262,7 +544,10 @@ class WeatherProvider:
                 updated_at=time.time(),
             )
 
-            self._aqi_updated = time.time()
+            with self._lock:
+                self._air_quality = new_air_quality
+                self._aqi_deadline = time.monotonic_ns() + self.aqi_interval * _NS_PER_S
+                self._aqi_failures = 0
             logger.debug("Air quality data updated successfully")
 
         except requests.Timeout:
@@ -274,30 +559,54 @@ class WeatherProvider:
         except (KeyError, ValueError, IndexError) as e:
             logger.warning(f"Failed to parse AQI data: {e}")
 
+    @staticmethod
+    def _decode_json(resp: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+
+        Uses orjson on the raw (already gunzipped) bytes when installed,
+        skipping requests' text decoding; otherwise falls back to resp.json().
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(resp.content)
+        return resp.json()
+
     def _parse_forecast(self, data: dict) -> list[DailyForecast]:
         """Parse 5-day forecast into daily summaries."""
-        daily: dict = {}
+        items = data.get("list", [])
+        if not items:
+            return []
 
-        for item in data.get("list", []):
-            date = item["dt_txt"].split(" ")[0]
-            if date not in daily:
-                daily[date] = {"temps": [], "rain": []}
-            temp = item.get("main", {}).get("temp")
-            if temp is not None:
-                daily[date]["temps"].append(temp)
-            daily[date]["rain"].append(int(item.get("pop", 0) * 100))
+        # Group the 3-hourly entries by date; unique() returns dates sorted
+        days, day_index = np.unique(
+            [item["dt_txt"][:10] for item in items], return_inverse=True
+        )
+        # Missing temperatures become NaN, which fmax/fmin skip
+        temps = np.array(
+            [item.get("main", {}).get("temp") for item in items], dtype=float
+        )
+        pops = np.array([item.get("pop", 0) for item in items], dtype=float)
+
+        highs = np.full(len(days), -np.inf)
+        lows = np.full(len(days), np.inf)
+        rain = np.zeros(len(days))
+        np.fmax.at(highs, day_index, temps)
+        np.fmin.at(lows, day_index, temps)
+        np.maximum.at(rain, day_index, pops)
 
         forecasts = []
-        # Explicitly sort by date to ensure chronological order
-        for date, values in sorted(daily.items())[:5]:
-            if not values["temps"]:  # all entries for this date were malformed — skip
+        for i in range(min(len(days), 5)):
+            if highs[i] == -np.inf:  # all entries for this date were malformed — skip
                 continue
             forecasts.append(
                 DailyForecast(
-                    date=date,
-                    high_temp=max(values["temps"]),
-                    low_temp=min(values["temps"]),
-                    rain_chance=max(values["rain"]) if values["rain"] else 0,
+                    date=str(days[i]),
+                    high_temp=float(highs[i]),
+                    low_temp=float(lows[i]),
+                    rain_chance=int(rain[i] * 100),
                 )
             )
 
@@ -305,60 +614,26 @@ class WeatherProvider:
 
     @staticmethod
     def _degrees_to_compass(degrees: float) -> str:
-        """Convert wind degrees to 16-point compass direction."""
-        directions = [
-            "N",
-            "NNE",
-            "NE",
-            "ENE",
-            "E",
-            "ESE",
-            "SE",
-            "SSE",
-            "S",
-            "SSW",
-            "SW",
-            "WSW",
-            "W",
-            "WNW",
-            "NW",
-            "NNW",
-        ]
-        idx = int((degrees + 11.25) / 22.5) % 16
-        return directions[idx]
+        """Convert wind degrees to 16-point compass direction.
+
+        Fractional degrees are truncated to whole degrees first.
+        """
+        return _COMPASS_LUT[int(degrees) % 360]
 
     @staticmethod
     def _pm25_to_aqi(pm25: float) -> int:
         """Convert PM2.5 concentration to US EPA AQI."""
-        # US EPA breakpoints for PM2.5
-        breakpoints = [
-            (0.0, 12.0, 0, 50),
-            (12.1, 35.4, 51, 100),
-            (35.5, 55.4, 101, 150),
-            (55.5, 150.4, 151, 200),
-            (150.5, 250.4, 201, 300),
-            (250.5, 500.4, 301, 500),
-        ]
-
-        for c_low, c_high, i_low, i_high in breakpoints:
-            if c_low <= pm25 <= c_high:
-                aqi = ((i_high - i_low) / (c_high - c_low)) * (pm25 - c_low) + i_low
-                return int(aqi)
-
-        return 500 if pm25 > 500.4 else 0
+        if pm25 < 0:
+            return 0
+        # Readings in the gap between one c_high and the next c_low (e.g.
+        # 12.05) use the upper segment instead of falling through to 0
+        i = bisect.bisect_left(_PM25_C_HIGH, pm25)
+        if i == len(_PM25_C_HIGH):
+            return 500
+        return int(_PM25_SLOPE[i] * (pm25 - _PM25_C_LOW[i]) + _PM25_I_LOW[i])
 
     @staticmethod
     def _aqi_category(aqi: int) -> str:
         """Get AQI category name."""
-        if aqi <= 50:
-            return "Good"
-        elif aqi <= 100:
-            return "Moderate"
-        elif aqi <= 150:
-            return "Unhealthy for Sensitive"
-        elif aqi <= 200:
-            return "Unhealthy"
-        elif aqi <= 300:
-            return "Very Unhealthy"
-        else:
-            return "Hazardous"
+        index = bisect.bisect_left(WeatherProvider._AQI_CATEGORY_LIMITS, aqi)
+        return WeatherProvider._AQI_CATEGORIES[index]
@@ -1,7 +1,9 @@
 """Framebuffer display handling for Solar Smart Clock."""
 
 import logging
-from typing import TYPE_CHECKING, Optional, BinaryIO
+import mmap
+import os
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 from PIL import Image
@@ -11,6 +13,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Per-channel RGB565 lookup tables: packing a pixel is three gathers and two ORs.
+# Each is 512 bytes, so all three stay in L1; they are shared by every
+# Display and frozen so nothing can corrupt them.
+_CHANNEL = np.arange(256, dtype="<u2")
+_R_LUT = (_CHANNEL >> 3) << 11
+_G_LUT = (_CHANNEL >> 2) << 5
+_B_LUT = _CHANNEL >> 3
+for _lut in (_R_LUT, _G_LUT, _B_LUT):
+    _lut.flags.writeable = False
+del _CHANNEL, _lut
+
 
 class Display:
     """Handles writing images to the framebuffer display."""
@@ -26,7 +39,26 @@ class Display:
         self.width = config.width
         self.height = config.height
         self.framebuffer = config.framebuffer
-        self._fb_handle: Optional[BinaryIO] = None
+        # Raw write-only descriptor; frames go out with one pwrite() per run
+        # of rows, skipping Python's buffered file layer
+        self._fb_fd: Optional[int] = None
+        # Shared mapping of the framebuffer and a (height, width) pixel view
+        # of it; when the device cannot be mapped, _fb_fd is opened and
+        # written to instead
+        self._fb_map: Optional[mmap.mmap] = None
+        self._fb_pixels: Optional[np.ndarray] = None
+        # Last RGB565 frame written, used to only rewrite changed scanlines
+        self._last_fb: Optional[np.ndarray] = None
+        # Buffer the next frame is packed into while _last_fb holds the
+        # current one; the two swap after every write
+        self._back_fb: Optional[np.ndarray] = None
+        # Per-channel scratch for the in-place RGB565 packing
+        self._scratch: Optional[np.ndarray] = None
+        # Source sizes already warned about in write_frame
+        self._resized_sizes: set[tuple[int, int]] = set()
+        # Whether the last write_frame() put different pixels on the panel
+        # (True when unknown, e.g. after a failed write)
+        self.frame_changed = True
 
     def open(self) -> bool:
         """
@@ -36,7 +68,9 @@ class Display:
             True if successful, False otherwise
         """
         try:
-            self._fb_handle = open(self.framebuffer, "wb")
+            self._last_fb = None
+            if not self._map_framebuffer():
+                self._fb_fd = os.open(self.framebuffer, os.O_WRONLY)
             logger.info(f"Opened framebuffer: {self.framebuffer}")
             return True
         except PermissionError:
@@ -55,22 +89,64 @@ class Display:
             logger.error(f"Failed to open framebuffer: {e}")
             return False
 
+    def _map_framebuffer(self) -> bool:
+        """
+        Map the framebuffer into memory so frames are stored with plain copies.
+
+        Returns:
+            True if mapped; False if the device cannot be opened read-write
+            or is smaller than one frame, and must be written as a file
+        """
+        size = self.width * self.height * 2
+        try:
+            fd = os.open(self.framebuffer, os.O_RDWR)
+        except OSError as e:
+            logger.debug(f"Not mapping framebuffer: {e}")
+            return False
+        try:
+            # The mapping keeps its own reference to the device
+            self._fb_map = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_WRITE)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Not mapping framebuffer: {e}")
+            return False
+        finally:
+            os.close(fd)
+        self._fb_pixels = np.frombuffer(self._fb_map, dtype="<u2").reshape(
+            self.height, self.width
+        )
+        return True
+
+    def _unmap_framebuffer(self) -> None:
+        """Release the framebuffer mapping, if any."""
+        # The pixel view must go first; an exported buffer blocks close()
+        self._fb_pixels = None
+        if self._fb_map is not None:
+            try:
+                self._fb_map.close()
+            except Exception as e:
+                logger.warning(f"Error unmapping framebuffer: {e}")
+            finally:
+                self._fb_map = None
+
     def close(self) -> None:
         """Close the framebuffer device."""
-        if self._fb_handle:
+        self._unmap_framebuffer()
+        if self._fb_fd is not None:
             try:
-                self._fb_handle.close()
+                os.close(self._fb_fd)
             except Exception as e:
                 logger.warning(f"Error closing framebuffer: {e}")
             finally:
-                self._fb_handle = None
+                self._fb_fd = None
+                self._last_fb = None
 
     def write_frame(self, image: Image.Image) -> bool:
         """
         Write a PIL Image to the framebuffer.
 
         The image is converted to RGB565 format and written directly
-        to the framebuffer device.
+        to the framebuffer device. After the first frame, only runs of
+        scanlines that differ from the previous frame are written.
 
         Args:
             image: PIL Image to write (should be width x height RGB)
@@ -78,36 +154,121 @@ class Display:
         Returns:
             True if successful, False otherwise
         """
-        if self._fb_handle is None:
+        self.frame_changed = True
+        if self._fb_fd is None and self._fb_pixels is None:
             logger.error("Framebuffer not open")
             return False
 
         try:
-            # Ensure correct size
+            # Ensure correct size. Views render at panel size, so this is a
+            # caller bug: warn once per size and use a cheap filter
             if image.size != (self.width, self.height):
+                if image.size not in self._resized_sizes:
+                    self._resized_sizes.add(image.size)
+                    logger.warning(
+                        f"Resizing {image.size[0]}x{image.size[1]} frame to "
+                        f"{self.width}x{self.height}; render at panel size instead"
+                    )
                 image = image.resize(
-                    (self.width, self.height), Image.Resampling.LANCZOS
+                    (self.width, self.height), Image.Resampling.BILINEAR
                 )
 
             # Ensure RGB mode
             if image.mode != "RGB":
                 image = image.convert("RGB")
 
-            # Convert to RGB565
-            rgb565_data = self._rgb_to_rgb565(image)
+            # Convert to RGB565 in the reused back buffer
+            back = self._back_fb
+            if back is None or back.shape != (self.height, self.width):
+                back = np.empty((self.height, self.width), dtype="<u2")
+            frame = self._rgb_to_rgb565_array(image, out=back)
 
             # Write to framebuffer
-            self._fb_handle.seek(0)
-            self._fb_handle.write(rgb565_data)
-            self._fb_handle.flush()
+            previous = self._last_fb
+            if previous is not None and previous.shape != frame.shape:
+                previous = None
+            runs = None
+            if previous is not None:
+                runs = self._changed_row_runs(frame, previous)
+                self.frame_changed = bool(runs)
+            if self._fb_pixels is not None:
+                # Mapped: copying into the view is the write, no syscalls
+                if runs is None:
+                    self._fb_pixels[...] = frame
+                else:
+                    for start, end in runs:
+                        self._fb_pixels[start:end] = frame[start:end]
+            elif self._fb_fd is not None:
+                # The frame array is contiguous, so pwrite reads it in place
+                if runs is None:
+                    os.pwrite(self._fb_fd, frame.data, 0)
+                else:
+                    self._write_changed_rows(self._fb_fd, frame, runs)
+            self._back_fb = self._last_fb
+            self._last_fb = frame
 
             return True
 
         except IOError as e:
+            # Framebuffer contents are unknown now; rewrite fully next time
+            self._last_fb = None
+            self.frame_changed = True
             logger.error(f"Failed to write to framebuffer: {e}")
             return False
 
+    @staticmethod
+    def _write_changed_rows(
+        fd: int, frame: np.ndarray, runs: list[tuple[int, int]]
+    ) -> None:
+        """
+        Write only the runs of scanlines that changed since the previous frame.
+
+        Args:
+            fd: Open framebuffer file descriptor
+            frame: New RGB565 frame, shape (height, width)
+            runs: [start, end) row ranges from _changed_row_runs()
+        """
+        row_bytes = frame.shape[1] * 2
+        for start, end in runs:
+            os.pwrite(fd, frame[start:end].data, start * row_bytes)
+
+    @staticmethod
+    def _changed_row_runs(
+        frame: np.ndarray, previous: np.ndarray
+    ) -> list[tuple[int, int]]:
+        """
+        Find the runs of scanlines that differ between two frames.
+
+        Args:
+            frame: New RGB565 frame, shape (height, width)
+            previous: Frame currently shown on the framebuffer
+
+        Returns:
+            [start, end) row ranges of changed scanlines, top to bottom
+        """
+        changed = (frame != previous).any(axis=1)
+        if not changed.any():
+            return []
+
+        # Rising/falling edges of the changed mask give [start, end) row runs
+        edges = np.flatnonzero(np.diff(changed.astype(np.int8), prepend=0, append=0))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
     def _rgb_to_rgb565(self, image: Image.Image) -> bytes:
+        """
+        Convert RGB image to RGB565 bytes (little-endian).
+
+        Args:
+            image: PIL Image in RGB mode
+
+        Returns:
+            Bytes in RGB565 format (little-endian)
+        """
+        return self._rgb_to_rgb565_array(image).tobytes()
+
+    def _rgb_to_rgb565_array(
+        self, image: Image.Image, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Convert RGB image to RGB565 format using NumPy vectorization.
 
@@ -118,23 +279,33 @@ class Display:
 
         Args:
             image: PIL Image in RGB mode
+            out: Optional little-endian uint16 (height, width) array to pack
+                into; a new one is allocated when omitted
 
         Returns:
-            Bytes in RGB565 format (little-endian)
+            Little-endian uint16 array of shape (height, width)
         """
-        # Convert PIL image to numpy array (H, W, 3) with uint16 for bit ops
-        arr = np.array(image, dtype=np.uint16)
-
-        # Extract color channels
-        r = arr[:, :, 0]
-        g = arr[:, :, 1]
-        b = arr[:, :, 2]
-
-        # Convert to RGB565: RRRRR GGGGGG BBBBB
-        rgb565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
-
-        # Convert to little-endian bytes
-        return rgb565.astype("<u2").tobytes()
+        # Wrap the packed RGB bytes as a read-only (H, W, 3) uint8 view. This
+        # is one copy out of PIL, cheaper than the array interface, and never
+        # goes through getdata(), which builds a tuple per pixel
+        width, height = image.size
+        shape = (height, width)
+        arr = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(height, width, 3)
+        if out is None:
+            out = np.empty(shape, dtype="<u2")
+        scratch = self._scratch
+        if scratch is None or scratch.shape != shape:
+            scratch = self._scratch = np.empty(shape, dtype="<u2")
+
+        # Convert to RGB565: RRRRR GGGGGG BBBBB, gathering each channel into
+        # preallocated buffers so no per-frame temporaries are created.
+        # Indices are uint8, so mode="clip" never clips and skips bounds checks.
+        np.take(_R_LUT, arr[:, :, 0], out=out, mode="clip")
+        np.take(_G_LUT, arr[:, :, 1], out=scratch, mode="clip")
+        out |= scratch
+        np.take(_B_LUT, arr[:, :, 2], out=scratch, mode="clip")
+        out |= scratch
+        return out
 
     def clear(self, color: tuple[int, int, int] = (0, 0, 0)) -> bool:
         """
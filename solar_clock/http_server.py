@@ -1,42 +1,216 @@
 """HTTP server for screenshots and view navigation with security features."""
 
 import base64
+import functools
+import hashlib
+import hmac
 import json
 import logging
 import os
+import socket
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from io import BytesIO
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
+from urllib.parse import parse_qs
+
+from PIL import features
 
 if TYPE_CHECKING:
+    from PIL import Image
+
     from .config import HttpServerConfig
 
+# Try to import orjson (optional, faster JSON encoding)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Screenshot encodings: PIL format -> (Content-Type, save options). zlib
+# level 1 encodes PNG several times faster than the default 6 for a little
+# more size; WebP at method 0 and JPEG are faster still and much smaller.
+_IMAGE_FORMATS: dict[str, tuple[str, dict]] = {
+    "PNG": ("image/png", {"compress_level": 1}),
+    "WEBP": ("image/webp", {"quality": 80, "method": 0}),
+    "JPEG": ("image/jpeg", {"quality": 85}),
+}
+WEBP_AVAILABLE = features.check("webp")
+
+_NS_PER_S = 1_000_000_000
+
+# Send buffer per connection, large enough to take a whole PNG screenshot
+# in one or two writes
+_SEND_BUFFER_SIZE = 256 * 1024
+
+# Fixed response bodies, encoded once
+_OK_BODY = b"OK"
+_NOT_FOUND_BODY = b"Not Found"
+_UNAUTHORIZED_BODY = b"Unauthorized"
+_RATE_LIMITED_BODY = b"Too Many Requests"
+_NO_CLOCK_BODY = b"Clock not initialized"
+_NO_FRAME_BODY = b"No frame available"
+_BAD_FORMAT_BODY = b"Unsupported format"
+
+# /screenshot?format=<name> -> key of _IMAGE_FORMATS
+_FORMAT_PARAMS = {"png": "PNG", "jpeg": "JPEG", "jpg": "JPEG"}
+if WEBP_AVAILABLE:
+    _FORMAT_PARAMS["webp"] = "WEBP"
+
+
+def _dumps(data) -> bytes:
+    """Encode data as JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against a strong ETag.
+
+    Uses the weak comparison RFC 9110 requires for If-None-Match: a W/
+    prefix is ignored, and "*" matches any current representation.
+
+    Args:
+        if_none_match: Raw If-None-Match header value ("" if absent)
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        True if the client already has this representation
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=64)
+def _view_status_json(view: str, index: int, count: int) -> bytes:
+    """
+    Encode the /view status as JSON.
+
+    The body only changes on navigation, so each (view, index, count) is
+    encoded once.
+
+    Args:
+        view: Current view name
+        index: Zero-based index of the current view
+        count: Number of views
+
+    Returns:
+        JSON body, e.g. b'{"view":"clock","index":0,"count":9}'
+    """
+    return _dumps({"view": view, "index": index, "count": count})
+
+
+@functools.lru_cache(maxsize=64)
+def _basic_auth_matches(auth_header: str, credentials: tuple[str, str]) -> bool:
+    """
+    Check a Basic Authorization header against the configured credentials.
+
+    Results are cached per (header, credentials), so a client repeating the
+    same header skips the base64/UTF-8 decode; changing the credentials
+    changes the key, so stale results are never reused.
+
+    Args:
+        auth_header: Raw Authorization header value
+        credentials: Expected (user, password)
+
+    Returns:
+        True if the header carries exactly these credentials
+    """
+    if not auth_header.startswith("Basic "):
+        return False
+    try:
+        encoded = auth_header[6:]  # Remove "Basic "
+        decoded = base64.b64decode(encoded).decode("utf-8")
+        user, password = decoded.split(":", 1)
+    except (ValueError, UnicodeDecodeError):
+        return False
+    # Constant-time comparisons, both always evaluated, so response timing
+    # doesn't reveal how much of a guess was right
+    user_ok = hmac.compare_digest(user.encode(), credentials[0].encode())
+    password_ok = hmac.compare_digest(password.encode(), credentials[1].encode())
+    return user_ok & password_ok
+
 
 class RateLimiter:
-    """Simple rate limiter using token bucket algorithm."""
+    """
+    Token bucket rate limiter, implemented as a generic cell rate algorithm.
+
+    Instead of a token count refilled on every call, it keeps the
+    theoretical arrival time (TAT) of the next request on the monotonic
+    clock, in integer nanoseconds: a request is allowed while the TAT is
+    less than one bucket's worth of requests ahead of now, and each allowed
+    request pushes the TAT forward by one interval. Bursts of up to
+    rate_per_second are allowed.
+    """
 
     def __init__(self, rate_per_second: int = 10):
         self.rate = rate_per_second
-        self.tokens: float = float(rate_per_second)
-        self.last_update = time.time()
         self.lock = threading.Lock()
+        if rate_per_second > 0:
+            self._interval = _NS_PER_S // rate_per_second
+            self._burst = (rate_per_second - 1) * self._interval
+        else:
+            # Deny everything
+            self._interval = 0
+            self._burst = -1
+        self._tat = time.monotonic_ns()
 
     def allow(self) -> bool:
         """Check if request is allowed. Returns True if allowed."""
-        with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
-            self.last_update = now
-
-            if self.tokens >= 1:
-                self.tokens -= 1
-                return True
+        now = time.monotonic_ns()
+        burst = self._burst
+        # The TAT never moves backwards, so a request that is over the limit
+        # by an unlocked read is over it for certain: floods are turned away
+        # without touching the lock
+        if self._tat - now > burst:
             return False
+        with self.lock:
+            tat = max(self._tat, now)
+            if tat - now > burst:
+                return False
+            self._tat = tat + self._interval
+            return True
+
+
+class ClientRateLimiter:
+    """
+    Per-client rate limiting: a separate RateLimiter bucket per client
+    address, so one noisy client can't starve the others.
+
+    Buckets are kept in least-recently-used order and the oldest is evicted
+    past MAX_CLIENTS, so a flood of distinct addresses can't grow memory
+    without bound.
+    """
+
+    MAX_CLIENTS = 1024
+
+    def __init__(self, rate_per_second: int = 10):
+        self.rate = rate_per_second
+        self.lock = threading.Lock()
+        self._buckets: OrderedDict[str, RateLimiter] = OrderedDict()
+
+    def allow(self, client: str) -> bool:
+        """Check if a request from client is allowed. Returns True if allowed."""
+        with self.lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = self._buckets[client] = RateLimiter(self.rate)
+                if len(self._buckets) > self.MAX_CLIENTS:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+        return bucket.allow()
 
 
 class ScreenshotHandler(BaseHTTPRequestHandler):
@@ -49,12 +223,45 @@ class ScreenshotHandler(BaseHTTPRequestHandler):
 
     # Class-level references (set by create_server)
     clock_instance = None
-    rate_limiter: Optional[RateLimiter] = None
+    rate_limiter: Optional[ClientRateLimiter] = None
     auth_credentials: Optional[tuple[str, str]] = None  # (user, pass)
 
+    # Last screenshot per image format, as (frame, (mode, size, raw pixels)
+    # or None, encoded bytes, ETag). Most views change at most once a second,
+    # so repeat requests skip the encode.
+    _image_cache: dict[
+        str,
+        tuple["Image.Image", Optional[tuple[str, tuple[int, int], bytes]], bytes, str],
+    ] = {}
+
+    # Query string of the current request, split off the path by do_GET
+    query = ""
+
+    # Keep connections open between requests, so pollers skip the TCP
+    # handshake; every response carries Content-Length. Idle connections
+    # are dropped after the timeout so they don't pin a thread forever.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
+    # Buffer writes to the client: headers and a small body leave in one
+    # send() when the request finishes, instead of one per header flush and
+    # body write. Bodies larger than the buffer are written through.
+    wbufsize = 16 * 1024
+
+    def setup(self) -> None:
+        """Set up the connection: no Nagle delay, large send buffer."""
+        super().setup()
+        # Responses are single small writes; don't hold them for an ACK
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE
+        )
+
     def log_message(self, format: str, *args) -> None:
         """Override to use proper logging."""
-        logger.debug(f"{self.client_address[0]} - {format % args}")
+        # Called for every request; skip all formatting unless it's shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - " + format, self.client_address[0], *args)
 
     def _check_auth(self) -> bool:
         """Check basic auth if configured. Returns True if allowed."""
@@ -62,83 +269,242 @@ class ScreenshotHandler(BaseHTTPRequestHandler):
             return True
 
         auth_header = self.headers.get("Authorization")
-        if not auth_header or not auth_header.startswith("Basic "):
-            return False
-
-        try:
-            encoded = auth_header[6:]  # Remove "Basic "
-            decoded = base64.b64decode(encoded).decode("utf-8")
-            user, password = decoded.split(":", 1)
-            return (user, password) == self.auth_credentials
-        except (ValueError, UnicodeDecodeError):
+        if not auth_header:
             return False
+        return _basic_auth_matches(auth_header, self.auth_credentials)
 
     def _send_unauthorized(self) -> None:
         """Send 401 Unauthorized response."""
         self.send_response(401)
         self.send_header("WWW-Authenticate", 'Basic realm="Solar Clock"')
         self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(_UNAUTHORIZED_BODY)))
         self.end_headers()
-        self.wfile.write(b"Unauthorized")
+        self.wfile.write(_UNAUTHORIZED_BODY)
 
     def _send_rate_limited(self) -> None:
         """Send 429 Too Many Requests response."""
         self.send_response(429)
         self.send_header("Content-Type", "text/plain")
         self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", str(len(_RATE_LIMITED_BODY)))
         self.end_headers()
-        self.wfile.write(b"Too Many Requests")
+        self.wfile.write(_RATE_LIMITED_BODY)
 
     def _send_text(self, status: int, text: str) -> None:
         """Send a text response."""
+        self._send_text_bytes(status, text.encode("utf-8"))
+
+    def _send_text_bytes(self, status: int, body: bytes) -> None:
+        """Send an already-encoded text response."""
         self.send_response(status)
         self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(text.encode("utf-8"))
+        self.wfile.write(body)
 
     def _send_json(self, status: int, data: dict) -> None:
         """Send a JSON response."""
+        self._send_json_bytes(status, _dumps(data))
+
+    def _send_json_bytes(self, status: int, body: bytes) -> None:
+        """Send an already-encoded JSON response."""
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode("utf-8"))
+        self.wfile.write(body)
+
+    def _send_image(self, image_data: bytes, content_type: str, etag: str) -> None:
+        """Send an image response, or 304 if the client has this version."""
+        if _etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept")
+            self.end_headers()
+            return
 
-    def _send_png(self, image_data: bytes) -> None:
-        """Send a PNG image response."""
         self.send_response(200)
-        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(image_data)))
+        self.send_header("ETag", etag)
         self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept")
         self.end_headers()
         self.wfile.write(image_data)
 
-    def _require_clock(self) -> bool:
-        """Check that clock_instance is available. Sends 503 if not.
+    def _require_clock(self):
+        """Get clock_instance, sending 503 if it is not available.
 
         Returns:
-            True if clock_instance is available, False otherwise.
-        """
-        if self.clock_instance is None:
-            self._send_text(503, "Clock not initialized")
-            return False
-        return True
-
-    def _send_view_status(self) -> None:
-        """Send current view name and index as text response.
-
-        Must only be called after _require_clock() returns True.
+            The clock instance, or None after a 503 has been sent.
         """
         clock = self.clock_instance
-        assert clock is not None
+        if clock is None:
+            self._send_text_bytes(503, _NO_CLOCK_BODY)
+        return clock
+
+    def _send_view_status(self, clock) -> None:
+        """Send current view name and index, as JSON if the client accepts it."""
         view = clock.view_manager.get_current()
         index = clock.view_manager.get_index()
         count = clock.view_manager.get_count()
-        self._send_text(200, f"{view} ({index + 1}/{count})")
+        if "application/json" in self.headers.get("Accept", ""):
+            self._send_json_bytes(200, _view_status_json(view, index, count))
+        else:
+            self._send_text(200, f"{view} ({index + 1}/{count})")
+
+    def _handle_health(self) -> None:
+        """GET /health: liveness check."""
+        self._send_text_bytes(200, _OK_BODY)
+
+    def _handle_screenshot(self) -> None:
+        """GET /screenshot: current frame as PNG, or WebP if the client accepts it.
+
+        ?format=png|webp|jpeg picks the encoding explicitly.
+        """
+        clock = self._require_clock()
+        if clock is None:
+            return
+        requested = parse_qs(self.query).get("format")
+        if requested:
+            image_format = _FORMAT_PARAMS.get(requested[-1].lower())
+            if image_format is None:
+                self._send_text_bytes(400, _BAD_FORMAT_BODY)
+                return
+        elif WEBP_AVAILABLE and "image/webp" in self.headers.get("Accept", ""):
+            image_format = "WEBP"
+        else:
+            image_format = "PNG"
+        try:
+            # Serve the frame the main loop already rendered; only render
+            # here before the first frame or right after a view change
+            frame = clock.get_last_frame()
+            published = frame is not None
+            if frame is None:
+                frame = clock.view_manager.render_current(copy=True)
+            if frame is None:
+                self._send_text_bytes(503, _NO_FRAME_BODY)
+                return
+            content_type, _ = _IMAGE_FORMATS[image_format]
+            data, etag = self._encode_frame(frame, image_format, published)
+            self._send_image(data, content_type, etag)
+        except Exception as e:
+            logger.error(f"Screenshot error: {e}")
+            self._send_text(500, f"Error: {e}")
+
+    @classmethod
+    def _encode_frame(
+        cls, frame: "Image.Image", image_format: str, published: bool = False
+    ) -> tuple[bytes, str]:
+        """
+        Encode a frame, reusing the previous encoding if unchanged.
+
+        A published frame is a private copy the main loop replaces only when
+        its pixels change, so the same object means the same image and no
+        pixels are read. A freshly rendered frame is a new object every time;
+        its raw pixels are compared instead, a memcmp far cheaper than
+        compressing the frame again.
+
+        Args:
+            frame: Frame to encode
+            image_format: Key of _IMAGE_FORMATS ("PNG", "WEBP" or "JPEG")
+            published: frame came from the clock's get_last_frame()
+
+        Returns:
+            Tuple of (encoded image bytes, quoted ETag)
+        """
+        cached = cls._image_cache.get(image_format)
+        key = None
+        if published:
+            if cached is not None and cached[0] is frame:
+                return cached[2], cached[3]
+        else:
+            key = (frame.mode, frame.size, frame.tobytes())
+            if cached is not None and cached[1] == key:
+                return cached[2], cached[3]
+
+        _, options = _IMAGE_FORMATS[image_format]
+        # Encoded in memory, not streamed to the socket: keep-alive needs
+        # Content-Length, and the bytes are kept for repeat requests.
+        # getvalue() hands over BytesIO's buffer without copying it.
+        buffer = BytesIO()
+        frame.save(buffer, format=image_format, **options)
+        data = buffer.getvalue()
+        # Content-derived, so it stays valid across restarts
+        etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+        # One item assignment, so concurrent readers never see a torn entry
+        cls._image_cache[image_format] = (frame, key, data, etag)
+        return data, etag
+
+    def _handle_next(self) -> None:
+        """GET /next: advance to the next view."""
+        clock = self._require_clock()
+        if clock is None:
+            return
+        clock.view_manager.next_view()
+        self._send_view_status(clock)
+
+    def _handle_prev(self) -> None:
+        """GET /prev: go back to the previous view."""
+        clock = self._require_clock()
+        if clock is None:
+            return
+        clock.view_manager.prev_view()
+        self._send_view_status(clock)
+
+    def _handle_view(self) -> None:
+        """GET /view: current view name and position."""
+        clock = self._require_clock()
+        if clock is None:
+            return
+        self._send_view_status(clock)
+
+    def _handle_theme(self) -> None:
+        """GET /theme: current theme status."""
+        clock = self._require_clock()
+        if clock is None:
+            return
+        self._send_json(200, clock.theme_manager.get_status())
+
+    def _set_theme_mode(self, mode: str) -> None:
+        """GET /theme/<mode>: switch theme mode and report the new status."""
+        clock = self._require_clock()
+        if clock is None:
+            return
+        clock.theme_manager.set_mode(mode)
+        self._send_json(200, clock.theme_manager.get_status())
+
+    def _handle_theme_auto(self) -> None:
+        """GET /theme/auto."""
+        self._set_theme_mode("auto")
+
+    def _handle_theme_day(self) -> None:
+        """GET /theme/day."""
+        self._set_theme_mode("day")
+
+    def _handle_theme_night(self) -> None:
+        """GET /theme/night."""
+        self._set_theme_mode("night")
+
+    # Lowercased request path -> handler; anything else is a 404
+    _ROUTES: dict[str, Callable[["ScreenshotHandler"], None]] = {
+        "/health": _handle_health,
+        "/screenshot": _handle_screenshot,
+        "/next": _handle_next,
+        "/prev": _handle_prev,
+        "/view": _handle_view,
+        "/theme": _handle_theme,
+        "/theme/auto": _handle_theme_auto,
+        "/theme/day": _handle_theme_day,
+        "/theme/night": _handle_theme_night,
+    }
 
     def do_GET(self) -> None:
         """Handle GET requests."""
         # Rate limiting
-        if self.rate_limiter and not self.rate_limiter.allow():
+        if self.rate_limiter and not self.rate_limiter.allow(self.client_address[0]):
             self._send_rate_limited()
             return
 
@@ -147,78 +513,26 @@ class ScreenshotHandler(BaseHTTPRequestHandler):
             self._send_unauthorized()
             return
 
-        path = self.path.lower()
-
-        if path == "/health":
-            self._send_text(200, "OK")
-
-        elif path == "/screenshot":
-            if not self._require_clock():
-                return
-            clock = self.clock_instance
-            assert clock is not None
-            try:
-                frame = clock.view_manager.render_current()
-                if frame is None:
-                    frame = clock.get_last_frame()
-                if frame is None:
-                    self._send_text(503, "No frame available")
-                    return
-                buffer = BytesIO()
-                frame.save(buffer, format="PNG")
-                self._send_png(buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Screenshot error: {e}")
-                self._send_text(500, f"Error: {e}")
-
-        elif path == "/next":
-            if not self._require_clock():
-                return
-            clock = self.clock_instance
-            assert clock is not None
-            clock.view_manager.next_view()
-            self._send_view_status()
-
-        elif path == "/prev":
-            if not self._require_clock():
-                return
-            clock = self.clock_instance
-            assert clock is not None
-            clock.view_manager.prev_view()
-            self._send_view_status()
-
-        elif path == "/view":
-            if not self._require_clock():
-                return
-            self._send_view_status()
+        path, _, self.query = self.path.partition("?")
+        handler = self._ROUTES.get(path.lower())
+        if handler is None:
+            self._send_text_bytes(404, _NOT_FOUND_BODY)
+        else:
+            handler(self)
 
-        elif path == "/theme":
-            if not self._require_clock():
-                return
-            clock = self.clock_instance
-            assert clock is not None
-            self._send_json(200, clock.theme_manager.get_status())
 
-        elif path.startswith("/theme/"):
-            if not self._require_clock():
-                return
-            clock = self.clock_instance
-            assert clock is not None
-            mode = path.split("/")[-1]
-            if mode in ("auto", "day", "night"):
-                clock.theme_manager.set_mode(mode)
-                self._send_json(200, clock.theme_manager.get_status())
-            else:
-                self._send_text(404, "Not Found")
+class ClockHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with a deeper listen backlog."""
 
-        else:
-            self._send_text(404, "Not Found")
+    # socketserver's default of 5 drops connections when several dashboards
+    # poll at once; the kernel still caps this at net.core.somaxconn
+    request_queue_size = 128
 
 
 def create_server(
     config: "HttpServerConfig",
     clock_instance,
-) -> Optional[HTTPServer]:
+) -> Optional[ClockHTTPServer]:
     """
     Create and configure the HTTP server.
 
@@ -227,7 +541,7 @@ def create_server(
         clock_instance: Reference to main clock instance
 
     Returns:
-        Configured HTTPServer, or None if disabled
+        Configured ClockHTTPServer, or None if disabled
     """
     if not config.enabled:
         logger.info("HTTP server disabled in config")
@@ -235,7 +549,7 @@ def create_server(
 
     # Set up handler class attributes
     ScreenshotHandler.clock_instance = clock_instance
-    ScreenshotHandler.rate_limiter = RateLimiter(config.rate_limit_per_second)
+    ScreenshotHandler.rate_limiter = ClientRateLimiter(config.rate_limit_per_second)
 
     # Check for auth credentials in environment
     auth_user = os.environ.get("HTTP_AUTH_USER")
@@ -248,7 +562,11 @@ def create_server(
 
     # Create server
     bind_address = (config.bind_address, config.port)
-    server = HTTPServer(bind_address, ScreenshotHandler)
+    # One thread per request, so a slow PNG encode never queues /next etc.
+    # ThreadingHTTPServer already sets daemon_threads (a stalled client can't
+    # hold up shutdown) and allow_reuse_address (a restart rebinds at once);
+    # frames are rendered under ViewManager's render lock.
+    server = ClockHTTPServer(bind_address, ScreenshotHandler)
 
     logger.info(f"HTTP server configured on {config.bind_address}:{config.port}")
 
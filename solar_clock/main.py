@@ -1,10 +1,12 @@
 """Main entry point for Solar Smart Clock."""
 
 import argparse
+import dataclasses
 import logging
 import signal
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +17,7 @@ from .display import Display
 from .http_server import create_server, start_server_thread
 from .touch_handler import TouchHandler
 from .data import WeatherProvider, SolarProvider, LunarProvider
+from .data.lunar import default_cache_dir
 from .views import VIEW_CLASSES, ViewManager
 from .views.base import DataProviders
 from .views.theme import ThemeManager
@@ -34,6 +37,12 @@ logger = logging.getLogger(__name__)
 class SolarClock:
     """Main Solar Clock application."""
 
+    # Navigation arrives in bursts (double taps, remote /next spam): after a
+    # view change, wait until no further change for NAV_SETTLE seconds, but
+    # never more than NAV_SETTLE_MAX, so a burst costs one render
+    NAV_SETTLE = 0.05
+    NAV_SETTLE_MAX = 0.25
+
     def __init__(self, config: Config):
         """
         Initialize the Solar Clock application.
@@ -43,7 +52,9 @@ class SolarClock:
         """
         self.config = config
         self.running = False
-        self._last_frame: Optional[Image.Image] = None
+        # (view generation, private copy of the frame), swapped in whole by
+        # the main loop so HTTP threads can read it without a lock
+        self._last_frame: Optional[tuple[int, Image.Image]] = None
 
         # Initialize data providers
         api_key = get_api_key()
@@ -65,6 +76,7 @@ class SolarClock:
                     units=config.weather.units,
                     weather_interval=config.weather.update_interval_seconds,
                     aqi_interval=config.air_quality.update_interval_seconds,
+                    one_call=config.weather.one_call,
                 )
                 if api_key
                 else None
@@ -74,6 +86,7 @@ class SolarClock:
                 latitude=config.location.latitude,
                 longitude=config.location.longitude,
                 timezone=config.location.timezone,
+                cache_dir=default_cache_dir(),
             ),
         )
 
@@ -105,8 +118,20 @@ class SolarClock:
         )
 
     def get_last_frame(self) -> Optional[Image.Image]:
-        """Get the last rendered frame (for HTTP screenshots)."""
-        return self._last_frame
+        """
+        Get the last rendered frame (for HTTP screenshots).
+
+        Returns:
+            The frame last written to the display, or None before the first
+            render or once the view has changed since it was rendered
+        """
+        last = self._last_frame
+        if last is None:
+            return None
+        generation, frame = last
+        if generation != self.view_manager.generation:
+            return None
+        return frame
 
     def run(self) -> None:
         """Run the main application loop."""
@@ -122,6 +147,10 @@ class SolarClock:
             self.http_thread = start_server_thread(self.http_server)
             logger.info(f"HTTP server running on port {self.config.http_server.port}")
 
+        # Start background weather refresh
+        if self.providers.weather:
+            self.providers.weather.start()
+
         # Start touch handler
         self.touch_handler.start()
 
@@ -134,30 +163,54 @@ class SolarClock:
 
         try:
             while self.running:
-                # Render current view
-                frame = self.view_manager.render_current()
-                self._last_frame = frame
-
-                # Write to display
-                self.display.write_frame(frame)
+                # Snapshot before rendering: a view change from here on,
+                # even mid-render, cuts the sleep below short
+                generation = self.view_manager.generation
+
+                # Render current view. The frame is the view's reused buffer,
+                # so it is only read while rendered() holds the render lock
+                with self.view_manager.rendered() as frame:
+                    # Write to display
+                    self.display.write_frame(frame)
+
+                    # Publish for /screenshot; the view reuses its buffer on
+                    # the next render, so hand out a copy, but only take one
+                    # when the pixels changed since the last
+                    last = self._last_frame
+                    if last is None or self.display.frame_changed:
+                        self._last_frame = (generation, frame.copy())
+                    elif last[0] != generation:
+                        self._last_frame = (generation, last[1])
 
                 # Sleep until next update
                 current_view = self.view_manager.get_current_view()
-                self.view_manager.view_changed.clear()
-                self.view_manager.view_changed.wait(
-                    timeout=current_view.update_interval
-                )
+                if self.view_manager.wait_for_change(
+                    generation, timeout=current_view.update_interval
+                ):
+                    self._settle_navigation()
 
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
         finally:
             self._cleanup()
 
+    def _settle_navigation(self) -> None:
+        """Wait for a burst of view changes to end before rendering."""
+        view_manager = self.view_manager
+        deadline = time.monotonic() + self.NAV_SETTLE_MAX
+        while self.running:
+            generation = view_manager.generation
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not view_manager.wait_for_change(
+                generation, timeout=min(self.NAV_SETTLE, remaining)
+            ):
+                return
+
     def _signal_handler(self, signum, frame) -> None:
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
-        self.view_manager.view_changed.set()  # Wake sleeping main loop immediately
+        self.view_manager.notify_changed()  # Wake sleeping main loop immediately
 
     def _cleanup(self) -> None:
         """Clean up resources on shutdown."""
@@ -166,6 +219,10 @@ class SolarClock:
         # Stop touch handler
         self.touch_handler.stop()
 
+        # Stop weather refresh and close its HTTP session
+        if self.providers.weather:
+            self.providers.weather.close()
+
         # Stop HTTP server
         if self.http_server:
             self.http_server.shutdown()
@@ -218,7 +275,10 @@ def main() -> int:
 
     # Override bind address if --bind-all specified
     if args.bind_all:
-        config.http_server.bind_address = "0.0.0.0"
+        config = dataclasses.replace(
+            config,
+            http_server=dataclasses.replace(config.http_server, bind_address="0.0.0.0"),
+        )
         logger.warning("HTTP server will bind to all interfaces (0.0.0.0)")
 
     # Check for API key
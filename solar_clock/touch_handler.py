@@ -1,6 +1,10 @@
 """Touch input handling for Solar Smart Clock."""
 
+import ctypes
+import fcntl
 import logging
+import select
+import struct
 import threading
 import time
 from typing import TYPE_CHECKING, Callable, Optional
@@ -15,10 +19,22 @@ try:
     from evdev import InputDevice, ecodes
 
     EVDEV_AVAILABLE = True
+    # Event codes read per event, bound once to skip attribute lookups
+    _EV_SYN = ecodes.EV_SYN
+    _EV_ABS = ecodes.EV_ABS
+    _EV_KEY = ecodes.EV_KEY
+    _SYN_REPORT = ecodes.SYN_REPORT
+    _ABS_X = ecodes.ABS_X
+    _ABS_Y = ecodes.ABS_Y
+    _BTN_TOUCH = ecodes.BTN_TOUCH
 except ImportError:
     EVDEV_AVAILABLE = False
     logger.info("evdev not available - touch input disabled")
 
+# EVIOCSMASK, _IOW('E', 0x93, struct input_mask): sets this client's
+# per-type event filter in the kernel (Linux 4.4+)
+_EVIOCSMASK = 0x40104593
+
 
 class TouchHandler:
     """
@@ -29,6 +45,9 @@ class TouchHandler:
     - Tap on nav buttons (< and >)
     """
 
+    # Width of the tap target for each nav button, from the screen edge
+    NAV_BUTTON_WIDTH = 60
+
     def __init__(
         self,
         config: "TouchConfig",
@@ -56,6 +75,11 @@ class TouchHandler:
         self.display_height = display_height
         self.nav_bar_height = nav_bar_height
 
+        # Nav button hit regions, fixed for the display size
+        self._nav_bar_top = display_height - nav_bar_height
+        self._prev_button_right = self.NAV_BUTTON_WIDTH
+        self._next_button_left = display_width - self.NAV_BUTTON_WIDTH
+
         # Touch state
         self.touch_start_x: Optional[int] = None
         self.touch_start_y: Optional[int] = None
@@ -67,7 +91,9 @@ class TouchHandler:
         self.last_gesture_time: float = 0.0
         self.gesture_cooldown: float = 0.15  # 150ms between gestures
 
-        # Threading
+        # Threading. The input thread waits in select() with this timeout,
+        # so it notices stop() without needing another event to arrive
+        self.poll_timeout: float = 0.5
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._device: Optional["InputDevice"] = None
@@ -78,6 +104,16 @@ class TouchHandler:
         self.raw_min = 400
         self.raw_max = 3500
 
+        # The calibration as one multiply-add per axis, with the rotation's
+        # inversion folded into the X scale and offset
+        raw_range = self.raw_max - self.raw_min
+        self._x_scale = -display_width / raw_range
+        self._x_offset = display_width - self.raw_min * self._x_scale
+        self._y_scale = display_height / raw_range
+        self._y_offset = -self.raw_min * self._y_scale
+        self._x_max = display_width - 1
+        self._y_max = display_height - 1
+
     def start(self) -> bool:
         """
         Start the touch input thread.
@@ -96,6 +132,7 @@ class TouchHandler:
         try:
             self._device = InputDevice(self.config.device)
             logger.info(f"Touch device: {self._device.name}")
+            self._claim_device(self._device)
         except FileNotFoundError:
             logger.error(f"Touch device not found: {self.config.device}")
             return False
@@ -123,51 +160,143 @@ class TouchHandler:
             self._device = None
         logger.info("Touch handler stopped")
 
+    @staticmethod
+    def _claim_device(device: "InputDevice") -> None:
+        """
+        Take exclusive use of the touch device and filter its events.
+
+        Only ABS_X/ABS_Y, BTN_TOUCH and EV_SYN are let through by the
+        kernel, so pressure, slot and MSC events never reach Python. Both
+        steps are best-effort: the device works without them.
+
+        Args:
+            device: Opened touch input device
+        """
+        try:
+            device.grab()
+        except OSError as e:
+            logger.warning(f"Could not grab touch device: {e}")
+
+        masks = (
+            (ecodes.EV_ABS, ecodes.ABS_CNT, (ecodes.ABS_X, ecodes.ABS_Y)),
+            (ecodes.EV_KEY, ecodes.KEY_CNT, (ecodes.BTN_TOUCH,)),
+            (ecodes.EV_MSC, ecodes.MSC_CNT, ()),
+        )
+        for event_type, code_count, codes in masks:
+            bits = bytearray((code_count + 7) // 8)
+            for code in codes:
+                bits[code // 8] |= 1 << (code % 8)
+            buffer = ctypes.create_string_buffer(bytes(bits), len(bits))
+            request = struct.pack(
+                "IIQ", event_type, len(bits), ctypes.addressof(buffer)
+            )
+            try:
+                fcntl.ioctl(device.fd, _EVIOCSMASK, request)
+            except OSError as e:
+                logger.debug(f"Touch event mask not applied: {e}")
+                return
+
     def _run(self) -> None:
         """Main touch input loop (runs in thread)."""
-        if self._device is None:
+        device = self._device
+        if device is None:
             return
 
+        # Bound once; the loop runs for every batch of events
+        process = self._process_events
+        read = device.read
+        wait = select.select
+        fds = [device.fd]
+        timeout = self.poll_timeout
+
         try:
-            for event in self._device.read_loop():
-                if not self._running:
-                    break
-                self._process_event(event)
-        except OSError as e:
+            while self._running:
+                readable, _, _ = wait(fds, [], [], timeout)
+                if not readable:
+                    continue
+                try:
+                    process(read())
+                except BlockingIOError:
+                    continue
+        except (OSError, ValueError) as e:
+            # ValueError: select() on a descriptor closed by stop()
             if self._running:
                 logger.error(f"Touch device error: {e}")
 
     def _process_event(self, event) -> None:
         """Process a single input event."""
-        if event.type == ecodes.EV_ABS:
-            # For 90-degree rotation: swap X and Y axes
-            if event.code == ecodes.ABS_X:
-                # Raw X becomes screen Y (inverted)
-                self.current_y = self._transform_y(event.value)
-            elif event.code == ecodes.ABS_Y:
-                # Raw Y becomes screen X
-                self.current_x = self._transform_x(event.value)
-
-        elif event.type == ecodes.EV_KEY:
-            if event.code == ecodes.BTN_TOUCH:
-                if event.value == 1:  # Touch down
-                    self._on_touch_down()
-                elif event.value == 0:  # Touch up
-                    self._on_touch_up()
+        self._process_events((event,))
+
+    def _process_events(self, events) -> None:
+        """
+        Process a batch of input events, one SYN_REPORT frame at a time.
+
+        A drag reports hundreds of positions a second, but only the last
+        value of each axis in a frame matters: earlier ABS values are
+        dropped and each axis is transformed at most once per frame. Touch
+        transitions are applied after the frame's position, so a touch-down
+        records where the finger landed.
+
+        Args:
+            events: Input events in kernel order
+        """
+        raw_x: Optional[int] = None
+        raw_y: Optional[int] = None
+        touches: list[int] = []
+        for event in events:
+            event_type = event.type
+            if event_type == _EV_ABS:
+                code = event.code
+                if code == _ABS_X:
+                    raw_x = event.value
+                elif code == _ABS_Y:
+                    raw_y = event.value
+            elif event_type == _EV_KEY:
+                if event.code == _BTN_TOUCH:
+                    touches.append(event.value)
+            elif event_type == _EV_SYN and event.code == _SYN_REPORT:
+                self._apply_frame(raw_x, raw_y, touches)
+                raw_x = raw_y = None
+                touches = []
+
+        # A frame split across reads: apply what has arrived so far
+        if raw_x is not None or raw_y is not None or touches:
+            self._apply_frame(raw_x, raw_y, touches)
+
+    def _apply_frame(
+        self, raw_x: Optional[int], raw_y: Optional[int], touches: list[int]
+    ) -> None:
+        """
+        Apply one frame's final position, then its touch transitions.
+
+        Args:
+            raw_x: Last raw ABS_X value in the frame, if any
+            raw_y: Last raw ABS_Y value in the frame, if any
+            touches: BTN_TOUCH values in the frame, in order
+        """
+        # For 90-degree rotation: swap X and Y axes
+        if raw_x is not None:
+            self.current_y = self._transform_y(raw_x)
+        if raw_y is not None:
+            self.current_x = self._transform_x(raw_y)
+
+        for value in touches:
+            if value == 1:  # Touch down
+                self._on_touch_down()
+            elif value == 0:  # Touch up
+                self._on_touch_up()
 
     def _transform_x(self, raw_value: int) -> int:
         """Transform raw X coordinate for 90-degree rotation."""
         # For 90-degree rotation: raw Y becomes screen X (inverted)
-        normalized = 1.0 - ((raw_value - self.raw_min) / (self.raw_max - self.raw_min))
-        return max(0, min(self.display_width - 1, int(normalized * self.display_width)))
+        x = int(raw_value * self._x_scale + self._x_offset)
+        return max(0, min(self._x_max, x))
 
     def _transform_y(self, raw_value: int) -> int:
         """Transform raw Y coordinate for 90-degree rotation."""
         # For 90-degree rotation: raw X becomes screen Y
-        normalized = (raw_value - self.raw_min) / (self.raw_max - self.raw_min)
-        return max(
-            0, min(self.display_height - 1, int(normalized * self.display_height))
-        )
+        y = int(raw_value * self._y_scale + self._y_offset)
+        return max(0, min(self._y_max, y))
 
     def _on_touch_down(self) -> None:
         """Handle touch start event."""
@@ -231,18 +360,17 @@ class TouchHandler:
 
     def _check_nav_button_tap(self) -> None:
         """Check if tap was on a navigation button."""
-        nav_bar_top = self.display_height - self.nav_bar_height
-
         # Only check if tap is in nav bar area
-        if self.current_y < nav_bar_top:
+        if self.current_y < self._nav_bar_top:
             return
 
+        x = self.current_x
         # Left button (< prev)
-        if self.current_x < 60:
+        if x < self._prev_button_right:
             logger.debug("Tap on prev button")
             self.on_prev()
 
         # Right button (> next)
-        elif self.current_x > self.display_width - 60:
+        elif x > self._next_button_left:
             logger.debug("Tap on next button")
             self.on_next()
@@ -1,7 +1,9 @@
 """Air Quality view - AQI and pollutant levels."""
 
 import datetime
+import functools
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from .base import BaseView, UPDATE_FREQUENT, FontSize, Layout, Spacing
@@ -15,6 +17,16 @@ from .colors import (
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _rounded_bar_mask(width: int, height: int, radius: int) -> np.ndarray:
+    """Boolean (height, width) mask of a rounded rectangle, as PIL draws it."""
+    mask = Image.new("1", (width, height), 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        ((0, 0), (width - 1, height - 1)), radius=radius, fill=1
+    )
+    return np.asarray(mask, dtype=bool)
+
+
 class AirQualityView(BaseView):
     """Air quality view with AQI and pollutant breakdown."""
 
@@ -84,12 +96,13 @@ class AirQualityView(BaseView):
         )
 
         # Pollutant breakdown (right side)
-        self._render_pollutants(draw, aqi_data, 50)
+        self._render_pollutants(draw, image, aqi_data, 50)
 
         # Footer with location and update time
         font_small = self.get_font(14)
         location = self.config.location.name
-        draw.text(
+        self.draw_text(
+            draw,
             (10, self.content_height - 25),
             location,
             fill=theme.text_tertiary,
@@ -100,7 +113,8 @@ class AirQualityView(BaseView):
         update_str = f"Updated {updated.strftime('%-I:%M %p')}"
         update_bbox = draw.textbbox((0, 0), update_str, font=font_small)
         update_width = update_bbox[2] - update_bbox[0]
-        draw.text(
+        self.draw_text(
+            draw,
             (self.width - update_width - 10, self.content_height - 25),
             update_str,
             fill=theme.text_tertiary,
@@ -135,15 +149,19 @@ class AirQualityView(BaseView):
         )
 
         # Label
-        draw.text((x, y), "US EPA AQI", fill=theme.text_tertiary, font=font_label)
+        self.draw_text(
+            draw, (x, y), "US EPA AQI", fill=theme.text_tertiary, font=font_label
+        )
 
         # AQI value - larger for emphasis, using text-friendly color
-        draw.text((x, y + 18), str(aqi), fill=text_color, font=font_aqi)
+        self.draw_text(draw, (x, y + 18), str(aqi), fill=text_color, font=font_aqi)
 
         # Category with color
-        draw.text((x, y + 85), category, fill=text_color, font=font_category)
+        self.draw_text(draw, (x, y + 85), category, fill=text_color, font=font_category)
 
-    def _render_pollutants(self, draw: ImageDraw.ImageDraw, aqi_data, y: int) -> None:
+    def _render_pollutants(
+        self, draw: ImageDraw.ImageDraw, image: Image.Image, aqi_data, y: int
+    ) -> None:
         """Render pollutant breakdown with bars."""
         theme = self.get_theme()
         font_label = self.get_font(14)
@@ -157,7 +175,8 @@ class AirQualityView(BaseView):
         )
 
         x = 195
-        draw.text(
+        self.draw_text(
+            draw,
             (x, y + 2),
             "Pollutants",
             fill=theme.text_primary,
@@ -176,47 +195,36 @@ class AirQualityView(BaseView):
         row_height = 26
         bar_width = 120
         bar_height = 16
+        bar_x = x + 55
 
+        fills = []
         for name, value, max_val in pollutants:
             # Label - right aligned
             label_bbox = draw.textbbox((0, 0), name, font=font_label)
             label_width = label_bbox[2] - label_bbox[0]
-            draw.text(
+            self.draw_text(
+                draw,
                 (x + 45 - label_width, row_y + 1),
                 name,
                 fill=theme.text_secondary,
                 font=font_label,
             )
 
-            # Bar background with rounded corners
-            bar_x = x + 55
-            draw.rounded_rectangle(
-                ((bar_x, row_y), (bar_x + bar_width, row_y + bar_height)),
-                radius=3,
-                fill=theme.divider,
-            )
-
-            # Bar fill
+            # Bar fill, colored by percentage
             fill_pct = min(value / max_val, 1.0)
             fill_width = int(bar_width * fill_pct)
-            if fill_width > 3:
-                # Color based on percentage
-                if fill_pct < 0.5:
-                    bar_color = AQI_GOOD
-                elif fill_pct < 0.75:
-                    bar_color = AQI_MODERATE
-                else:
-                    bar_color = AQI_UNHEALTHY
-
-                draw.rounded_rectangle(
-                    ((bar_x, row_y), (bar_x + fill_width, row_y + bar_height)),
-                    radius=3,
-                    fill=bar_color,
-                )
+            if fill_pct < 0.5:
+                bar_color = AQI_GOOD
+            elif fill_pct < 0.75:
+                bar_color = AQI_MODERATE
+            else:
+                bar_color = AQI_UNHEALTHY
+            fills.append((fill_width, bar_color))
 
             # Value outside bar
             value_str = f"{value:.1f}"
-            draw.text(
+            self.draw_text(
+                draw,
                 (bar_x + bar_width + 8, row_y + 1),
                 value_str,
                 fill=theme.text_primary,
@@ -224,3 +232,57 @@ class AirQualityView(BaseView):
             )
 
             row_y += row_height
+
+        # All bars are composed in one array and pasted with a single call
+        bars = self._build_pollutant_bars(
+            fills,
+            row_height,
+            bar_width,
+            bar_height,
+            background=theme.background_panel_dark,
+            track=theme.divider,
+        )
+        image.paste(bars, (bar_x, y + 28))
+
+    @staticmethod
+    def _build_pollutant_bars(
+        fills: list[tuple[int, tuple[int, int, int]]],
+        row_height: int,
+        bar_width: int,
+        bar_height: int,
+        background: tuple[int, int, int],
+        track: tuple[int, int, int],
+        radius: int = 3,
+    ) -> Image.Image:
+        """
+        Build the stacked pollutant bars as a single RGB image.
+
+        Args:
+            fills: (fill_width, color) per bar, top to bottom
+            row_height: Vertical distance between bar tops
+            bar_width: Width of a full bar in pixels
+            bar_height: Height of a bar in pixels
+            background: Panel color shown between and around bars
+            track: Color of the unfilled bar track
+            radius: Corner radius of each bar
+
+        Returns:
+            RGB image covering every bar, ready to paste at the first bar's origin
+        """
+        w = bar_width + 1
+        h = bar_height + 1
+        rows = (len(fills) - 1) * row_height + h
+        bars = np.empty((rows, w, 3), dtype=np.uint8)
+        bars[:] = background
+
+        track_mask = _rounded_bar_mask(w, h, radius)
+        for i, (fill_width, color) in enumerate(fills):
+            top = i * row_height
+            bar = bars[top:][:h]
+            bar[track_mask] = track
+
+            if fill_width > 3:
+                fw = fill_width + 1
+                bar[:, :fw][_rounded_bar_mask(fw, h, radius)] = color
+
+        return Image.fromarray(bars, "RGB")
@@ -1,12 +1,45 @@
 """Analemma view - figure-8 sun position diagram."""
 
 import datetime
+import itertools
+
+import numpy as np
 from PIL import Image, ImageDraw
 
 from .base import BaseView, UPDATE_HOURLY, FontSize
 from .colors import WHITE, ORANGE
 
 
+def _dot_offsets(radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """(dx, dy) of every pixel PIL fills for a dot of this radius."""
+    size = 2 * radius + 1
+    mask = Image.new("1", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse(((0, 0), (size - 1, size - 1)), fill=1)
+    dy, dx = np.nonzero(np.asarray(mask, dtype=bool))
+    return dx - radius, dy - radius
+
+
+# Pixel offsets of one analemma sample dot, stamped at every sample
+_DOT_DX, _DOT_DY = _dot_offsets(2)
+
+# Season key by month number (index 0 unused), for picking sample colors
+_MONTH_TO_SEASON = (
+    "",
+    "winter",
+    "winter",
+    "spring",
+    "spring",
+    "spring",
+    "summer",
+    "summer",
+    "summer",
+    "fall",
+    "fall",
+    "fall",
+    "winter",
+)
+
+
 class AnalemmaView(BaseView):
     """Analemma view showing figure-8 sun position pattern."""
 
@@ -30,7 +63,8 @@ class AnalemmaView(BaseView):
         font_title = self.get_bold_font(24)
         title_bbox = draw.textbbox((0, 0), "Analemma", font=font_title)
         title_width = title_bbox[2] - title_bbox[0]
-        draw.text(
+        self.draw_text(
+            draw,
             ((self.width - title_width) // 2, 5),
             "Analemma",
             fill=WHITE,
@@ -56,14 +90,28 @@ class AnalemmaView(BaseView):
         seasons = self._season_colors(theme)
 
         # Axis labels
-        draw.text((center_x - 15, y), "Summer", fill=seasons["summer"], font=font_tiny)
-        draw.text(
-            (center_x - 15, y + 195), "winter", fill=seasons["winter"], font=font_tiny
+        self.draw_text(
+            draw, (center_x - 15, y), "Summer", fill=seasons["summer"], font=font_tiny
+        )
+        self.draw_text(
+            draw,
+            (center_x - 15, y + 195),
+            "winter",
+            fill=seasons["winter"],
+            font=font_tiny,
+        )
+        self.draw_text(
+            draw, (5, center_y - 5), "Sun", fill=theme.text_tertiary, font=font_tiny
+        )
+        self.draw_text(
+            draw, (5, center_y + 8), "early", fill=theme.text_tertiary, font=font_tiny
+        )
+        self.draw_text(
+            draw, (200, center_y - 5), "Sun", fill=theme.text_tertiary, font=font_tiny
+        )
+        self.draw_text(
+            draw, (200, center_y + 8), "late", fill=theme.text_tertiary, font=font_tiny
         )
-        draw.text((5, center_y - 5), "Sun", fill=theme.text_tertiary, font=font_tiny)
-        draw.text((5, center_y + 8), "early", fill=theme.text_tertiary, font=font_tiny)
-        draw.text((200, center_y - 5), "Sun", fill=theme.text_tertiary, font=font_tiny)
-        draw.text((200, center_y + 8), "late", fill=theme.text_tertiary, font=font_tiny)
 
         # Draw axis lines
         draw.line(
@@ -75,46 +123,39 @@ class AnalemmaView(BaseView):
             self.render_centered_message(draw, "Data unavailable")
             return
 
-        # Get analemma data points
-        points = self.providers.lunar.get_analemma_data()
-        if not points:
+        # Get analemma samples
+        series = self.providers.lunar.get_analemma_series()
+        if not series:
             return
 
-        # Draw the figure-8 with seasonal colors
-        today = datetime.date.today()
-        today_point = None
-
-        for i, point in enumerate(points):
-            # Map equation of time (-15 to +15 min) to x
-            x = center_x + int((point.equation_of_time / 15) * scale_x)
-
-            # Map elevation to y (centered on mid-elevation, ~55° for lat 35°N)
-            # Range is approximately 32° to 79° = 47° span
-            elev_normalized = (point.elevation - 55) / 47  # Center on 55°, span 47°
-            y_pos = center_y - int(elev_normalized * scale_y)
-
-            # Determine season color
-            month = point.date.month
-            if 3 <= month <= 5:
-                color = seasons["spring"]
-            elif 6 <= month <= 8:
-                color = seasons["summer"]
-            elif 9 <= month <= 11:
-                color = seasons["fall"]
-            else:
-                color = seasons["winter"]
-
-            # Draw point
-            draw.ellipse([(x - 2, y_pos - 2), (x + 2, y_pos + 2)], fill=color)
-
-            # Check if this is close to today
-            days_diff = abs((point.date - today).days)
-            if days_diff < 7:
-                today_point = (x, y_pos)
-
-        # Highlight today's position
-        if today_point:
-            x, y_pos = today_point
+        # Map equation of time (-15 to +15 min) to x
+        xs = center_x + (series.equations_of_time / 15 * scale_x).astype(int)
+
+        # Map elevation to y (centered on mid-elevation, ~55° for lat 35°N)
+        # Range is approximately 32° to 79° = 47° span
+        ys = center_y - ((series.elevations - 55) / 47 * scale_y).astype(int)
+
+        # Draw the figure-8 with seasonal colors: one point batch per run of
+        # same-season samples, so where the curve crosses itself later dates
+        # still overlap earlier ones
+        start = 0
+        for season, run in itertools.groupby(
+            series.dates, key=lambda date: _MONTH_TO_SEASON[date.month]
+        ):
+            end = start + sum(1 for _ in run)
+            dot_xs = (xs[start:end, np.newaxis] + _DOT_DX).ravel().tolist()
+            dot_ys = (ys[start:end, np.newaxis] + _DOT_DY).ravel().tolist()
+            draw.point(list(zip(dot_xs, dot_ys)), fill=seasons[season])
+            start = end
+
+        # Highlight today's position: the last sample within a week of today
+        today = datetime.date.today().toordinal()
+        ordinals = np.fromiter(
+            (date.toordinal() for date in series.dates), dtype=np.int64
+        )
+        near = np.flatnonzero(np.abs(ordinals - today) < 7)
+        if near.size:
+            x, y_pos = int(xs[near[-1]]), int(ys[near[-1]])
             draw.ellipse(
                 [(x - 6, y_pos - 6), (x + 6, y_pos + 6)],
                 fill=theme.text_primary,
@@ -136,7 +177,8 @@ class AnalemmaView(BaseView):
             fill=theme.background_panel,
             outline=theme.outline,
         )
-        draw.text(
+        self.draw_text(
+            draw,
             (x + 10, y + 5),
             "Today",
             fill=theme.text_primary,
@@ -147,16 +189,23 @@ class AnalemmaView(BaseView):
             eot = self.providers.lunar.get_equation_of_time()
             if eot:
                 sign = "early" if eot > 0 else "late"
-                draw.text(
-                    (x + 10, y + 25), "Sun is", fill=theme.text_tertiary, font=font
+                self.draw_text(
+                    draw,
+                    (x + 10, y + 25),
+                    "Sun is",
+                    fill=theme.text_tertiary,
+                    font=font,
                 )
-                draw.text(
+                self.draw_text(
+                    draw,
                     (x + 10, y + 42),
                     f"{abs(eot):.1f} min",
                     fill=theme.accent_sun,
                     font=font_large,
                 )
-                draw.text((x + 10, y + 70), sign, fill=theme.text_secondary, font=font)
+                self.draw_text(
+                    draw, (x + 10, y + 70), sign, fill=theme.text_secondary, font=font
+                )
 
         # Sun path info
         draw.rectangle(
@@ -164,7 +213,8 @@ class AnalemmaView(BaseView):
             fill=theme.background_panel,
             outline=theme.outline,
         )
-        draw.text(
+        self.draw_text(
+            draw,
             (x + 10, y + 105),
             "Sun path",
             fill=theme.text_primary,
@@ -175,10 +225,15 @@ class AnalemmaView(BaseView):
             pos = self.providers.solar.get_solar_position()
             if pos:
                 height = "high" if pos.elevation > 45 else "low"
-                draw.text(
-                    (x + 10, y + 130), height, fill=theme.accent_sun, font=font_large
+                self.draw_text(
+                    draw,
+                    (x + 10, y + 130),
+                    height,
+                    fill=theme.accent_sun,
+                    font=font_large,
                 )
-                draw.text(
+                self.draw_text(
+                    draw,
                     (x + 10, y + 155),
                     f"{pos.elevation:.1f}° S",
                     fill=theme.text_secondary,
@@ -187,7 +242,9 @@ class AnalemmaView(BaseView):
 
         # Season legend
         seasons = self._season_colors(theme)
-        draw.text((x, y + 185), "Legend:", fill=theme.text_tertiary, font=font_small)
+        self.draw_text(
+            draw, (x, y + 185), "Legend:", fill=theme.text_tertiary, font=font_small
+        )
         legend_items = [
             ("Sp", seasons["spring"]),
             ("Su", seasons["summer"]),
@@ -197,7 +254,8 @@ class AnalemmaView(BaseView):
         legend_x = x + 50
         for label, color in legend_items:
             draw.ellipse([(legend_x, y + 188), (legend_x + 8, y + 196)], fill=color)
-            draw.text(
+            self.draw_text(
+                draw,
                 (legend_x + 12, y + 185),
                 label,
                 fill=theme.text_secondary,
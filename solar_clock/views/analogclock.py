@@ -2,13 +2,27 @@
 
 import datetime
 import math
+from typing import TYPE_CHECKING, Optional
 
 from PIL import Image, ImageDraw
 
 from .base import (
     BaseView,
+    DataProviders,
     UPDATE_REALTIME,
 )
+from .theme import Theme
+
+if TYPE_CHECKING:
+    from ..config import Config
+
+# (cos, sin) of each of the 60 dial positions, 6 degrees apart with 0 at
+# 12 o'clock. Markers and the minute and second hands only ever point at
+# these, so only the hour hand needs trig per frame.
+_DIAL_TRIG = tuple(
+    (math.cos(math.radians(m * 6 - 90)), math.sin(math.radians(m * 6 - 90)))
+    for m in range(60)
+)
 
 
 class AnalogClockView(BaseView):
@@ -18,6 +32,11 @@ class AnalogClockView(BaseView):
     title = "Analog Clock"
     update_interval = UPDATE_REALTIME
 
+    def __init__(self, config: "Config", providers: DataProviders):
+        super().__init__(config, providers)
+        # (theme, face image) for the static part of the clock face
+        self._face_layer: Optional[tuple[Theme, Image.Image]] = None
+
     def render_content(self, draw: ImageDraw.ImageDraw, image: Image.Image) -> None:
         """Render the analog clock view content."""
         now = datetime.datetime.now()
@@ -29,7 +48,9 @@ class AnalogClockView(BaseView):
 
         # Minimal title at top
         font_title = self.get_font(16)
-        draw.text((10, 5), "Analog", fill=theme.text_secondary, font=font_title)
+        self.draw_text(
+            draw, (10, 5), "Analog", fill=theme.text_secondary, font=font_title
+        )
 
         # Clock face
         self._render_clock_face(draw, image, now)
@@ -39,7 +60,8 @@ class AnalogClockView(BaseView):
         date_str = now.strftime("%A, %B %d")
         date_bbox = draw.textbbox((0, 0), date_str, font=font_date)
         date_width = date_bbox[2] - date_bbox[0]
-        draw.text(
+        self.draw_text(
+            draw,
             ((self.width - date_width) // 2, self.content_height - 35),
             date_str,
             fill=theme.text_primary,
@@ -55,6 +77,76 @@ class AnalogClockView(BaseView):
         center_y = (self.content_height - 40) // 2 + 10
         radius = 100
 
+        # Static face (background, markers), pasted through its own alpha so
+        # the time-of-day background shows around it
+        face = self._get_face_layer(theme, radius)
+        corner = radius + 5
+        image.paste(face, (center_x - corner, center_y - corner), face)
+
+        # Hour hand
+        hour = now.hour % 12
+        minute = now.minute
+        hour_angle = math.radians((hour + minute / 60) * 30 - 90)
+        hour_length = radius * 0.5
+        hour_x = center_x + int(hour_length * math.cos(hour_angle))
+        hour_y = center_y + int(hour_length * math.sin(hour_angle))
+        draw.line(
+            [(center_x, center_y), (hour_x, hour_y)], fill=theme.clock_hands, width=6
+        )
+
+        # Minute hand
+        cos, sin = _DIAL_TRIG[minute]
+        minute_length = radius * 0.75
+        minute_x = center_x + int(minute_length * cos)
+        minute_y = center_y + int(minute_length * sin)
+        draw.line(
+            [(center_x, center_y), (minute_x, minute_y)],
+            fill=theme.clock_hands,
+            width=4,
+        )
+
+        # Second hand
+        cos, sin = _DIAL_TRIG[now.second]
+        second_length = radius * 0.85
+        second_x = center_x + int(second_length * cos)
+        second_y = center_y + int(second_length * sin)
+        draw.line(
+            [(center_x, center_y), (second_x, second_y)], fill=(200, 0, 0), width=2
+        )
+
+        # Center dot
+        draw.ellipse(
+            [(center_x - 6, center_y - 6), (center_x + 6, center_y + 6)],
+            fill=theme.clock_hands,
+        )
+        draw.ellipse(
+            [(center_x - 3, center_y - 3), (center_x + 3, center_y + 3)],
+            fill=(200, 0, 0),
+        )
+
+    def _get_face_layer(self, theme: Theme, radius: int) -> Image.Image:
+        """
+        Get the clock face background with its hour and minute markers.
+
+        The face only changes with the theme, so it is drawn once and
+        pasted on every frame; only the hands are drawn per second.
+
+        Args:
+            theme: Current theme
+            radius: Dial radius in pixels
+
+        Returns:
+            RGBA face image, transparent outside the dial, to be pasted
+            centered on the clock center
+        """
+        if self._face_layer and self._face_layer[0] == theme:
+            return self._face_layer[1]
+
+        size = 2 * (radius + 5) + 1
+        face = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(face)
+        center_x = center_y = radius + 5
+
         # Clock face background
         draw.ellipse(
             [
@@ -68,15 +160,15 @@ class AnalogClockView(BaseView):
 
         # Hour markers
         for hour in range(12):
-            angle = math.radians(hour * 30 - 90)  # 30 degrees per hour, offset by -90
+            cos, sin = _DIAL_TRIG[hour * 5]
 
             # Marker position
             inner_r = radius - 15
             outer_r = radius - 5
-            x1 = center_x + int(inner_r * math.cos(angle))
-            y1 = center_y + int(inner_r * math.sin(angle))
-            x2 = center_x + int(outer_r * math.cos(angle))
-            y2 = center_y + int(outer_r * math.sin(angle))
+            x1 = center_x + int(inner_r * cos)
+            y1 = center_y + int(inner_r * sin)
+            x2 = center_x + int(outer_r * cos)
+            y2 = center_y + int(outer_r * sin)
 
             # Draw marker (thicker for 12, 3, 6, 9)
             width = 3 if hour % 3 == 0 else 1
@@ -85,8 +177,8 @@ class AnalogClockView(BaseView):
             # Hour number dots for other hours
             if hour % 3 != 0:
                 dot_r = radius - 10
-                dx = center_x + int(dot_r * math.cos(angle))
-                dy = center_y + int(dot_r * math.sin(angle))
+                dx = center_x + int(dot_r * cos)
+                dy = center_y + int(dot_r * sin)
                 draw.ellipse(
                     [(dx - 2, dy - 2), (dx + 2, dy + 2)], fill=theme.clock_markers
                 )
@@ -95,53 +187,14 @@ class AnalogClockView(BaseView):
         for minute in range(60):
             if minute % 5 == 0:
                 continue  # Skip hour markers
-            angle = math.radians(minute * 6 - 90)
+            cos, sin = _DIAL_TRIG[minute]
             inner_r = radius - 8
             outer_r = radius - 3
-            x1 = center_x + int(inner_r * math.cos(angle))
-            y1 = center_y + int(inner_r * math.sin(angle))
-            x2 = center_x + int(outer_r * math.cos(angle))
-            y2 = center_y + int(outer_r * math.sin(angle))
+            x1 = center_x + int(inner_r * cos)
+            y1 = center_y + int(inner_r * sin)
+            x2 = center_x + int(outer_r * cos)
+            y2 = center_y + int(outer_r * sin)
             draw.line([(x1, y1), (x2, y2)], fill=theme.text_tertiary, width=1)
 
-        # Hour hand
-        hour = now.hour % 12
-        minute = now.minute
-        hour_angle = math.radians((hour + minute / 60) * 30 - 90)
-        hour_length = radius * 0.5
-        hour_x = center_x + int(hour_length * math.cos(hour_angle))
-        hour_y = center_y + int(hour_length * math.sin(hour_angle))
-        draw.line(
-            [(center_x, center_y), (hour_x, hour_y)], fill=theme.clock_hands, width=6
-        )
-
-        # Minute hand
-        minute_angle = math.radians(minute * 6 - 90)
-        minute_length = radius * 0.75
-        minute_x = center_x + int(minute_length * math.cos(minute_angle))
-        minute_y = center_y + int(minute_length * math.sin(minute_angle))
-        draw.line(
-            [(center_x, center_y), (minute_x, minute_y)],
-            fill=theme.clock_hands,
-            width=4,
-        )
-
-        # Second hand
-        second = now.second
-        second_angle = math.radians(second * 6 - 90)
-        second_length = radius * 0.85
-        second_x = center_x + int(second_length * math.cos(second_angle))
-        second_y = center_y + int(second_length * math.sin(second_angle))
-        draw.line(
-            [(center_x, center_y), (second_x, second_y)], fill=(200, 0, 0), width=2
-        )
-
-        # Center dot
-        draw.ellipse(
-            [(center_x - 6, center_y - 6), (center_x + 6, center_y + 6)],
-            fill=theme.clock_hands,
-        )
-        draw.ellipse(
-            [(center_x - 3, center_y - 3), (center_x + 3, center_y + 3)],
-            fill=(200, 0, 0),
-        )
+        self._face_layer = (theme, face)
+        return face
@@ -1,15 +1,16 @@
 """Base view class and view manager for Solar Smart Clock."""
 
+import contextlib
 import datetime
 import logging
 import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
 from .colors import DARK_BLUE, LIGHT_BLUE, ORANGE, PURPLE, WHITE
-from .font_manager import get_font_manager
+from .font_manager import draw_text, get_font_manager
 from .renderers import NavBarRenderer
 from .theme import Theme, get_theme
 
@@ -131,6 +132,10 @@ class BaseView(ABC):
         # Get font manager singleton
         self._font_manager = get_font_manager()
 
+        # Frame buffer reused across renders (allocated on first render)
+        self._scratch_img: Optional[Image.Image] = None
+        self._scratch_draw: Optional[ImageDraw.ImageDraw] = None
+
     def get_font(self, size: int) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
         """
         Get a font at the specified size.
@@ -168,6 +173,29 @@ class BaseView(ABC):
         """
         return self._font_manager.get_bold_font(size)
 
+    def draw_text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        xy: tuple[int, int],
+        text: str,
+        fill: tuple[int, int, int],
+        font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont],
+    ) -> None:
+        """
+        Draw text through the shared text mask cache.
+
+        Drop-in replacement for ``draw.text`` that skips FreeType rendering
+        for strings already drawn in a previous frame.
+
+        Args:
+            draw: ImageDraw instance
+            xy: Top-left position of the text
+            text: Text to draw
+            fill: Text color
+            font: Font to draw with
+        """
+        draw_text(draw, xy, text, fill=fill, font=font)
+
     def get_theme(self) -> Theme:
         """
         Get the current theme.
@@ -194,7 +222,7 @@ class BaseView(ABC):
         msg_width = bbox[2] - bbox[0]
         x = (self.width - msg_width) // 2
         y = self.content_height // 2
-        draw.text((x, y), message, fill=theme.text_secondary, font=font)
+        self.draw_text(draw, (x, y), message, fill=theme.text_secondary, font=font)
 
     def render_header(
         self, draw: ImageDraw.ImageDraw, title: str, color: tuple[int, int, int]
@@ -215,7 +243,7 @@ class BaseView(ABC):
         title_bbox = draw.textbbox((0, 0), title, font=font_title)
         title_width = title_bbox[2] - title_bbox[0]
         title_x = (self.width - title_width) // 2
-        draw.text((title_x, 5), title, fill=WHITE, font=font_title)
+        self.draw_text(draw, (title_x, 5), title, fill=WHITE, font=font_title)
 
     def render_text_centered(
         self,
@@ -239,7 +267,7 @@ class BaseView(ABC):
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
-        draw.text((x, y), text, fill=color, font=font)
+        self.draw_text(draw, (x, y), text, fill=color, font=font)
 
     @abstractmethod
     def render_content(self, draw: ImageDraw.ImageDraw, image: Image.Image) -> None:
@@ -263,14 +291,22 @@ class BaseView(ABC):
             current_index: Current view index (0-based)
             total_views: Total number of views
 
+        The returned image is this view's reusable frame buffer and is
+        overwritten by the next call; copy it if it must outlive that.
+
         Returns:
             PIL Image ready for display
         """
         theme = self.get_theme()
 
-        # Create image with themed background
-        image = Image.new("RGB", (self.width, self.height), theme.background)
-        draw = ImageDraw.Draw(image)
+        # Reuse the frame buffer, clearing it to the themed background
+        image, draw = self._scratch_img, self._scratch_draw
+        if image is None or draw is None or image.size != (self.width, self.height):
+            image = Image.new("RGB", (self.width, self.height), theme.background)
+            draw = ImageDraw.Draw(image)
+            self._scratch_img, self._scratch_draw = image, draw
+        else:
+            image.paste(theme.background, (0, 0, self.width, self.height))
 
         # Render view-specific content
         self.render_content(draw, image)
@@ -358,18 +394,54 @@ class ViewManager:
         """
         self.views = views
         self.current_index = default_index
-        self.view_changed = threading.Event()
+        # Bumped on every view change; waiters compare against a snapshot,
+        # so a change between their snapshot and wait is never missed
+        self.generation = 0
+        self._changed = threading.Condition()
         self._render_lock = threading.Lock()
+        # Touch and concurrent HTTP requests navigate from different threads
+        self._nav_lock = threading.Lock()
+
+    def advance(self, steps: int) -> None:
+        """
+        Move several views at once, signalling a single view change.
+
+        Args:
+            steps: Views to move; negative moves backwards
+        """
+        with self._nav_lock:
+            self.current_index = (self.current_index + steps) % len(self.views)
+        self.notify_changed()
+
+    def notify_changed(self) -> None:
+        """Signal a view change, waking every wait_for_change() caller."""
+        with self._changed:
+            self.generation += 1
+            self._changed.notify_all()
+
+    def wait_for_change(self, generation: int, timeout: float) -> bool:
+        """
+        Wait until the view changes after a generation snapshot.
+
+        Args:
+            generation: Value of generation read before the caller's work
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a change happened since the snapshot, False on timeout
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self.generation != generation, timeout=timeout
+            )
 
     def next_view(self) -> None:
         """Navigate to next view."""
-        self.current_index = (self.current_index + 1) % len(self.views)
-        self.view_changed.set()
+        self.advance(1)
 
     def prev_view(self) -> None:
         """Navigate to previous view."""
-        self.current_index = (self.current_index - 1) % len(self.views)
-        self.view_changed.set()
+        self.advance(-1)
 
     def get_current(self) -> str:
         """Get current view name."""
@@ -387,8 +459,33 @@ class ViewManager:
         """Get current view instance."""
         return self.views[self.current_index]
 
-    def render_current(self) -> Image.Image:
-        """Render the current view."""
+    @contextlib.contextmanager
+    def rendered(self) -> Iterator[Image.Image]:
+        """
+        Render the current view and hold its frame buffer until the block exits.
+
+        The render lock stays held for the whole block, so no other thread
+        can redraw the buffer while the caller reads it.
+
+        Yields:
+            Rendered frame, valid only inside the block
+        """
         with self._render_lock:
             view = self.views[self.current_index]
-            return view.render(self.current_index, len(self.views))
+            yield view.render(self.current_index, len(self.views))
+
+    def render_current(self, copy: bool = False) -> Image.Image:
+        """
+        Render the current view.
+
+        Args:
+            copy: Return a private copy instead of the view's frame buffer.
+                Without it, the buffer can be redrawn by any later render;
+                callers sharing the manager across threads must copy or use
+                rendered() instead
+
+        Returns:
+            Rendered frame
+        """
+        with self.rendered() as frame:
+            return frame.copy() if copy else frame
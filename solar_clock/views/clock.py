@@ -39,8 +39,11 @@ class ClockView(BaseView):
         total_width = time_width + ampm_width + 5
         start_x = (self.width - total_width) // 2
 
-        draw.text((start_x, -1), time_str, fill=theme.text_primary, font=font_time)
-        draw.text(
+        self.draw_text(
+            draw, (start_x, -1), time_str, fill=theme.text_primary, font=font_time
+        )
+        self.draw_text(
+            draw,
             (start_x + time_width + 5, 20),
             am_pm,
             fill=theme.text_secondary,
@@ -52,7 +55,8 @@ class ClockView(BaseView):
         font_date = self.get_font(18)
         date_bbox = draw.textbbox((0, 0), date_str, font=font_date)
         date_width = date_bbox[2] - date_bbox[0]
-        draw.text(
+        self.draw_text(
+            draw,
             ((self.width - date_width) // 2, 55),
             date_str,
             fill=theme.text_primary,
@@ -83,8 +87,10 @@ class ClockView(BaseView):
 
         # Sunrise
         sunrise_str = sun_times.sunrise.strftime("%-I:%M %p")
-        draw.text((20, y), "Sunrise", fill=theme.text_tertiary, font=font)
-        draw.text((20, y + 18), sunrise_str, fill=theme.accent_sun, font=font_value)
+        self.draw_text(draw, (20, y), "Sunrise", fill=theme.text_tertiary, font=font)
+        self.draw_text(
+            draw, (20, y + 18), sunrise_str, fill=theme.accent_sun, font=font_value
+        )
 
         # Day length
         day_length = self.providers.solar.get_day_length()
@@ -98,9 +104,15 @@ class ClockView(BaseView):
             length_width = length_bbox[2] - length_bbox[0]
             center_x = (self.width - length_width) // 2
 
-            draw.text((center_x, y), "daylight", fill=theme.text_tertiary, font=font)
-            draw.text(
-                (center_x, y + 18), length_str, fill=theme.text_primary, font=font_value
+            self.draw_text(
+                draw, (center_x, y), "daylight", fill=theme.text_tertiary, font=font
+            )
+            self.draw_text(
+                draw,
+                (center_x, y + 18),
+                length_str,
+                fill=theme.text_primary,
+                font=font_value,
             )
 
         # Sunset
@@ -108,13 +120,15 @@ class ClockView(BaseView):
         sunset_bbox = draw.textbbox((0, 0), sunset_str, font=font_value)
         sunset_width = sunset_bbox[2] - sunset_bbox[0]
 
-        draw.text(
+        self.draw_text(
+            draw,
             (self.width - sunset_width - 20, y),
             "Sunset",
             fill=theme.text_tertiary,
             font=font,
         )
-        draw.text(
+        self.draw_text(
+            draw,
             (self.width - sunset_width - 20, y + 18),
             sunset_str,
             fill=theme.accent_warm,
@@ -128,15 +142,23 @@ class ClockView(BaseView):
         theme = self.get_theme()
 
         if self.providers.weather is None:
-            draw.text(
-                (20, y), "Weather: unavailable", fill=theme.text_secondary, font=font
+            self.draw_text(
+                draw,
+                (20, y),
+                "Weather: unavailable",
+                fill=theme.text_secondary,
+                font=font,
             )
             return
 
         weather = self.providers.weather.get_current_weather()
         if weather is None:
-            draw.text(
-                (20, y), "Weather: unavailable", fill=theme.text_secondary, font=font
+            self.draw_text(
+                draw,
+                (20, y),
+                "Weather: unavailable",
+                fill=theme.text_secondary,
+                font=font,
             )
             return
 
@@ -146,10 +168,16 @@ class ClockView(BaseView):
         temp = f"{weather.temperature:.0f}{unit}"
         humidity = f"{weather.humidity}%"
 
-        draw.text((20, y), desc, fill=theme.text_primary, font=font_value)
-        draw.text((20, y + 28), f"Temp: {temp}", fill=theme.accent_sun, font=font)
-        draw.text(
-            (150, y + 28), f"Humidity: {humidity}", fill=theme.text_secondary, font=font
+        self.draw_text(draw, (20, y), desc, fill=theme.text_primary, font=font_value)
+        self.draw_text(
+            draw, (20, y + 28), f"Temp: {temp}", fill=theme.accent_sun, font=font
+        )
+        self.draw_text(
+            draw,
+            (150, y + 28),
+            f"Humidity: {humidity}",
+            fill=theme.text_secondary,
+            font=font,
         )
 
         # Sun position
@@ -179,19 +207,22 @@ class ClockView(BaseView):
                 else:
                     compass = "NW"
 
-                draw.text(
+                self.draw_text(
+                    draw,
                     (self.width - 115, y),
                     "Sun Position",
                     fill=theme.text_tertiary,
                     font=font,
                 )
-                draw.text(
+                self.draw_text(
+                    draw,
                     (self.width - 115, y + 18),
                     f"El: {elev_abs:.0f}° {elev_arrow}",
                     fill=theme.accent_sun if pos.elevation > 0 else theme.accent_warm,
                     font=font,
                 )
-                draw.text(
+                self.draw_text(
+                    draw,
                     (self.width - 115, y + 36),
                     f"Az: {pos.azimuth:.0f}° {compass}",
                     fill=theme.text_secondary,
@@ -204,7 +235,7 @@ class ClockView(BaseView):
         theme = self.get_theme()
 
         # Calculate day progress
-        now = datetime.datetime.now()
+        now = datetime.datetime.now().astimezone()
         day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         day_progress = (now - day_start).total_seconds() / 86400
 
@@ -233,7 +264,8 @@ class ClockView(BaseView):
         progress_text = f"{day_progress * 100:.0f}% of day"
         text_bbox = draw.textbbox((0, 0), progress_text, font=font)
         text_width = text_bbox[2] - text_bbox[0]
-        draw.text(
+        self.draw_text(
+            draw,
             ((self.width - text_width) // 2, y + 18),
             progress_text,
             fill=theme.text_secondary,
@@ -242,15 +274,14 @@ class ClockView(BaseView):
 
         # Next event countdown
         if self.providers.solar:
-            next_event = self.providers.solar.get_next_solar_event()
+            next_event = self.providers.solar.get_next_solar_event(now)
             if next_event and len(next_event) == 2:
                 event_name, event_time = next_event
-                # Handle timezone-aware event_time
-                if event_time.tzinfo is not None:
-                    now_tz = datetime.datetime.now(event_time.tzinfo)
+                # Handle naive event_time
+                if event_time.tzinfo is None:
+                    delta = event_time - now.replace(tzinfo=None)
                 else:
-                    now_tz = now
-                delta = event_time - now_tz
+                    delta = event_time - now
                 if delta.total_seconds() < 0:
                     # Event just passed; data provider will update shortly
                     pass
@@ -261,7 +292,8 @@ class ClockView(BaseView):
                     countdown = f"{event_name} in {hours}h {minutes}m"
                     countdown_bbox = draw.textbbox((0, 0), countdown, font=font)
                     countdown_width = countdown_bbox[2] - countdown_bbox[0]
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         ((self.width - countdown_width) // 2, y + 38),
                         countdown,
                         fill=theme.text_primary,
@@ -25,13 +25,17 @@ class DayLengthView(BaseView):
         # Header
         self.render_header(draw, "Day Length", ORANGE)
 
+        today = datetime.date.today()
+
         # Day length curve
-        self._render_yearly_curve(draw, 45)
+        self._render_yearly_curve(draw, 45, today)
 
         # Info boxes
-        self._render_info_boxes(draw, self.content_height - 65)
+        self._render_info_boxes(draw, self.content_height - 65, today)
 
-    def _render_yearly_curve(self, draw: ImageDraw.ImageDraw, y: int) -> None:
+    def _render_yearly_curve(
+        self, draw: ImageDraw.ImageDraw, y: int, today: datetime.date
+    ) -> None:
         """Render the yearly day length curve."""
         theme = self.get_theme()
         chart_x = 30
@@ -49,7 +53,8 @@ class DayLengthView(BaseView):
                 + chart_height
                 - int(((hours - self.CHART_MIN_HOURS) / chart_span) * chart_height)
             )
-            draw.text(
+            self.draw_text(
+                draw,
                 (5, label_y - 5),
                 f"{hours}h",
                 fill=theme.text_tertiary,
@@ -58,13 +63,13 @@ class DayLengthView(BaseView):
 
         # X-axis month labels. The curve is rotated so today sits at the
         # center of the chart, so labels start ~6 months before today.
-        today = datetime.date.today()
         month_abbr = ["Ja", "F", "Mr", "Ap", "My", "Jn", "Jl", "Au", "S", "O", "N", "D"]
         start_month = (today - datetime.timedelta(days=182)).month - 1
         for i in range(12):
             month = month_abbr[(start_month + i) % 12]
             x = chart_x + int((i / 12) * chart_width)
-            draw.text(
+            self.draw_text(
+                draw,
                 (x, chart_y + chart_height + 2),
                 month,
                 fill=theme.text_tertiary,
@@ -124,7 +129,7 @@ class DayLengthView(BaseView):
         today_x = chart_x + chart_width // 2  # Centered
 
         if self.providers.solar:
-            today_length = self.providers.solar.get_day_length()
+            today_length = self.providers.solar.get_day_length(today)
             if today_length:
                 today_y = (
                     chart_y
@@ -140,9 +145,16 @@ class DayLengthView(BaseView):
                     outline=theme.accent_sun,
                 )
 
-    def _render_info_boxes(self, draw: ImageDraw.ImageDraw, y: int) -> None:
+    def _render_info_boxes(
+        self, draw: ImageDraw.ImageDraw, y: int, today: datetime.date
+    ) -> None:
         """Render info boxes at bottom."""
         theme = self.get_theme()
+        dates = (
+            self.providers.lunar.get_solstice_equinox(today.year)
+            if self.providers.lunar
+            else None
+        )
         font = self.get_font(12)
         font_value = self.get_bold_font(18)
         font_small = self.get_font(FontSize.AXIS_LABEL)
@@ -154,15 +166,16 @@ class DayLengthView(BaseView):
         draw.rounded_rectangle(
             ((10, y), (10 + box_width, y + 55)), radius=6, fill=theme.background_panel
         )
-        draw.text((15, y + 3), "Today", fill=theme.text_tertiary, font=font)
+        self.draw_text(draw, (15, y + 3), "Today", fill=theme.text_tertiary, font=font)
 
         if self.providers.solar:
-            length = self.providers.solar.get_day_length()
-            change = self.providers.solar.get_day_length_change()
+            length = self.providers.solar.get_day_length(today)
+            change = self.providers.solar.get_day_length_change(today)
             if length:
                 hours = int(length)
                 minutes = int((length - hours) * 60)
-                draw.text(
+                self.draw_text(
+                    draw,
                     (15, y + 18),
                     f"{hours}h {minutes}m",
                     fill=theme.text_primary,
@@ -170,7 +183,8 @@ class DayLengthView(BaseView):
                 )
             if change:
                 sign = "+" if change > 0 else ""
-                draw.text(
+                self.draw_text(
+                    draw,
                     (15, y + 40),
                     f"{sign}{change:.1f}m/day",
                     fill=theme.accent_sun if change > 0 else theme.accent_cool,
@@ -182,17 +196,14 @@ class DayLengthView(BaseView):
         draw.rounded_rectangle(
             ((x2, y), (x2 + box_width, y + 55)), radius=6, fill=theme.background_panel
         )
-        draw.text(
-            (x2 + 5, y + 3), "Shortest", fill=theme.text_tertiary, font=font_small
+        self.draw_text(
+            draw, (x2 + 5, y + 3), "Shortest", fill=theme.text_tertiary, font=font_small
         )
-        draw.text(
-            (x2 + 75, y + 3), "Longest", fill=theme.text_tertiary, font=font_small
+        self.draw_text(
+            draw, (x2 + 75, y + 3), "Longest", fill=theme.text_tertiary, font=font_small
         )
 
-        if self.providers.lunar:
-            dates = self.providers.lunar.get_solstice_equinox(
-                datetime.date.today().year
-            )
+        if dates:
 
             def fmt_length(hours_float: float) -> str:
                 hours = int(hours_float)
@@ -205,26 +216,30 @@ class DayLengthView(BaseView):
                 longest = self.providers.solar.get_day_length(dates.summer_solstice)
 
             if shortest is not None:
-                draw.text(
+                self.draw_text(
+                    draw,
                     (x2 + 5, y + 15),
                     fmt_length(shortest),
                     fill=theme.accent_cool,
                     font=font,
                 )
-            draw.text(
+            self.draw_text(
+                draw,
                 (x2 + 5, y + 30),
                 dates.winter_solstice.strftime("%b %d"),
                 fill=theme.text_secondary,
                 font=font_small,
             )
             if longest is not None:
-                draw.text(
+                self.draw_text(
+                    draw,
                     (x2 + 75, y + 15),
                     fmt_length(longest),
                     fill=theme.accent_warm,
                     font=font,
                 )
-            draw.text(
+            self.draw_text(
+                draw,
                 (x2 + 75, y + 30),
                 dates.summer_solstice.strftime("%b %d"),
                 fill=theme.text_secondary,
@@ -236,14 +251,11 @@ class DayLengthView(BaseView):
         draw.rounded_rectangle(
             ((x3, y), (self.width - 10, y + 55)), radius=6, fill=theme.background_panel
         )
-        draw.text((x3 + 5, y + 3), "Next", fill=theme.text_tertiary, font=font)
-
-        if self.providers.lunar:
-            dates = self.providers.lunar.get_solstice_equinox(
-                datetime.date.today().year
-            )
-            today = datetime.date.today()
+        self.draw_text(
+            draw, (x3 + 5, y + 3), "Next", fill=theme.text_tertiary, font=font
+        )
 
+        if dates:
             # Find next event
             events = [
                 ("Vernal", dates.spring_equinox),
@@ -255,22 +267,25 @@ class DayLengthView(BaseView):
             for name, date in events:
                 if date > today:
                     days = (date - today).days
-                    draw.text(
-                        (x3 + 5, y + 18), name, fill=theme.accent_green, font=font
+                    self.draw_text(
+                        draw, (x3 + 5, y + 18), name, fill=theme.accent_green, font=font
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (x3 + 5, y + 35),
                         date.strftime("%b %d"),
                         fill=theme.text_secondary,
                         font=font_small,
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (x3 + 70, y + 18),
                         str(days),
                         fill=theme.text_primary,
                         font=font_value,
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (x3 + 70, y + 40),
                         "days",
                         fill=theme.text_tertiary,
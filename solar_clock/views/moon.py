@@ -34,7 +34,7 @@ class MoonView(BaseView):
         self._render_phase_info(draw, moon, 180)
 
         # Moon times
-        self._render_moon_times(draw, 170)
+        self._render_moon_times(draw, moon, 170)
 
         # Upcoming dates
         self._render_upcoming_dates(draw, moon, 220)
@@ -117,13 +117,17 @@ class MoonView(BaseView):
 
         # Illumination percentage
         illum_str = f"{moon.illumination:.0f}%"
-        draw.text((x, y), illum_str, fill=theme.text_primary, font=font_large)
+        self.draw_text(
+            draw, (x, y), illum_str, fill=theme.text_primary, font=font_large
+        )
 
         # Phase name
-        draw.text((x, y + 45), moon.phase_name, fill=theme.accent_moon, font=font_name)
+        self.draw_text(
+            draw, (x, y + 45), moon.phase_name, fill=theme.accent_moon, font=font_name
+        )
 
-    def _render_moon_times(self, draw: ImageDraw.ImageDraw, y: int) -> None:
-        """Render moonrise and moonset times."""
+    def _render_moon_times(self, draw: ImageDraw.ImageDraw, moon, y: int) -> None:
+        """Render moonrise and moonset times and the lunar cycle bar."""
         theme = self.get_theme()
         font = self.get_font(FontSize.CAPTION)
         font_value = self.get_font(16)
@@ -143,50 +147,61 @@ class MoonView(BaseView):
             outline=theme.outline,
         )
 
-        draw.text((20, y + 5), "Moonrise", fill=theme.text_tertiary, font=font)
-        draw.text((175, y + 5), "Moonset", fill=theme.text_tertiary, font=font)
-        draw.text((330, y + 5), "Lunar Cycle", fill=theme.text_tertiary, font=font)
+        self.draw_text(
+            draw, (20, y + 5), "Moonrise", fill=theme.text_tertiary, font=font
+        )
+        self.draw_text(
+            draw, (175, y + 5), "Moonset", fill=theme.text_tertiary, font=font
+        )
+        self.draw_text(
+            draw, (330, y + 5), "Lunar Cycle", fill=theme.text_tertiary, font=font
+        )
 
         # Lunar cycle progress bar
-        if self.providers.lunar:
-            moon_data = self.providers.lunar.get_moon_phase()
-            if moon_data:
-                bar_x = 330
-                bar_width = self.width - 10 - bar_x - 10
-                bar_y = y + 22
-                bar_height = 10
-                # Background
-                draw.rectangle(
-                    ((bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height)),
-                    fill=theme.divider,
-                )
-                # Progress (phase 0-1, where 0.5 is full moon)
-                fill_width = int(moon_data.phase * bar_width)
-                if fill_width > 0:
-                    draw.rectangle(
-                        ((bar_x, bar_y), (bar_x + fill_width, bar_y + bar_height)),
-                        fill=PURPLE,
-                    )
-                # Full moon marker at center
-                full_x = bar_x + bar_width // 2
-                draw.line(
-                    [(full_x, bar_y - 2), (full_x, bar_y + bar_height + 2)],
-                    fill=theme.accent_moon,
-                    width=2,
-                )
+        bar_x = 330
+        bar_width = self.width - 10 - bar_x - 10
+        bar_y = y + 22
+        bar_height = 10
+        # Background
+        draw.rectangle(
+            ((bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height)),
+            fill=theme.divider,
+        )
+        # Progress (phase 0-1, where 0.5 is full moon)
+        fill_width = int(moon.phase * bar_width)
+        if fill_width > 0:
+            draw.rectangle(
+                ((bar_x, bar_y), (bar_x + fill_width, bar_y + bar_height)),
+                fill=PURPLE,
+            )
+        # Full moon marker at center
+        full_x = bar_x + bar_width // 2
+        draw.line(
+            [(full_x, bar_y - 2), (full_x, bar_y + bar_height + 2)],
+            fill=theme.accent_moon,
+            width=2,
+        )
 
         if self.providers.lunar:
             times = self.providers.lunar.get_moon_times()
             if times:
                 if times.moonrise:
                     rise_str = times.moonrise.strftime("%-I:%M %p")
-                    draw.text(
-                        (20, y + 22), rise_str, fill=theme.text_primary, font=font_value
+                    self.draw_text(
+                        draw,
+                        (20, y + 22),
+                        rise_str,
+                        fill=theme.text_primary,
+                        font=font_value,
                     )
                 if times.moonset:
                     set_str = times.moonset.strftime("%-I:%M %p")
-                    draw.text(
-                        (175, y + 22), set_str, fill=theme.text_primary, font=font_value
+                    self.draw_text(
+                        draw,
+                        (175, y + 22),
+                        set_str,
+                        fill=theme.text_primary,
+                        font=font_value,
                     )
 
     def _render_upcoming_dates(self, draw: ImageDraw.ImageDraw, moon, y: int) -> None:
@@ -202,14 +217,18 @@ class MoonView(BaseView):
             radius=Layout.ROUNDED_RADIUS,
             fill=theme.background_panel,
         )
-        draw.text((20, y + 5), "New Moon", fill=theme.text_tertiary, font=font)
-        draw.text(
+        self.draw_text(
+            draw, (20, y + 5), "New Moon", fill=theme.text_tertiary, font=font
+        )
+        self.draw_text(
+            draw,
             (20, y + 24),
             moon.next_new.strftime("%b %d"),
             fill=theme.text_primary,
             font=font_value,
         )
-        draw.text(
+        self.draw_text(
+            draw,
             (120, y + 24),
             f"{moon.days_to_new}d",
             fill=theme.text_secondary,
@@ -222,14 +241,18 @@ class MoonView(BaseView):
             radius=Layout.ROUNDED_RADIUS,
             fill=theme.background_panel,
         )
-        draw.text((255, y + 5), "Full Moon", fill=theme.text_tertiary, font=font)
-        draw.text(
+        self.draw_text(
+            draw, (255, y + 5), "Full Moon", fill=theme.text_tertiary, font=font
+        )
+        self.draw_text(
+            draw,
             (255, y + 24),
             moon.next_full.strftime("%b %d"),
             fill=theme.accent_moon,
             font=font_value,
         )
-        draw.text(
+        self.draw_text(
+            draw,
             (355, y + 24),
             f"{moon.days_to_full}d",
             fill=theme.text_secondary,
@@ -5,7 +5,7 @@ from typing import Tuple
 from PIL import ImageDraw
 
 from .colors import WHITE, GRAY
-from .font_manager import get_font_manager
+from .font_manager import draw_text, get_font_manager
 
 
 class NavBarRenderer:
@@ -56,7 +56,7 @@ class NavBarRenderer:
             outline=GRAY,
         )
         font = font_manager.get_font(20)
-        draw.text((28, button_y + 2), "<", fill=WHITE, font=font)
+        draw_text(draw, (28, button_y + 2), "<", fill=WHITE, font=font)
 
         # Next button (>)
         draw.rectangle(
@@ -67,7 +67,7 @@ class NavBarRenderer:
             fill=button_color,
             outline=GRAY,
         )
-        draw.text((width - 32, button_y + 2), ">", fill=WHITE, font=font)
+        draw_text(draw, (width - 32, button_y + 2), ">", fill=WHITE, font=font)
 
         # Page indicator dots
         dot_radius = 4
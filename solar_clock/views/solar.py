@@ -57,14 +57,14 @@ class SolarView(BaseView):
         ]
 
         for name, time, x, row_y in events:
-            draw.text((x, row_y), name, fill=theme.text_tertiary, font=font)
+            self.draw_text(draw, (x, row_y), name, fill=theme.text_tertiary, font=font)
             time_str = time.strftime("%-I:%M %p")
             color = (
                 theme.accent_sun
                 if "Sun" in name
                 else theme.accent_warm if name == "Dusk" else theme.text_secondary
             )
-            draw.text((x, row_y + 15), time_str, fill=color, font=font_value)
+            self.draw_text(draw, (x, row_y + 15), time_str, fill=color, font=font_value)
 
     def _render_golden_hour(self, draw: ImageDraw.ImageDraw, y: int) -> None:
         """Render golden hour information."""
@@ -72,8 +72,12 @@ class SolarView(BaseView):
         font = self.get_font(14)
         font_value = self.get_font(16)
 
-        draw.text(
-            (20, y), "Golden Hour", fill=theme.accent_warm, font=self.get_bold_font(16)
+        self.draw_text(
+            draw,
+            (20, y),
+            "Golden Hour",
+            fill=theme.accent_warm,
+            font=self.get_bold_font(16),
         )
 
         if self.providers.solar is None:
@@ -83,14 +87,24 @@ class SolarView(BaseView):
 
         if morning:
             morning_str = f"{morning.start.strftime('%-I:%M')} - {morning.end.strftime('%-I:%M %p')}"
-            draw.text((20, y + 22), "Morning:", fill=theme.text_tertiary, font=font)
-            draw.text((90, y + 22), morning_str, fill=theme.accent_sun, font=font_value)
+            self.draw_text(
+                draw, (20, y + 22), "Morning:", fill=theme.text_tertiary, font=font
+            )
+            self.draw_text(
+                draw, (90, y + 22), morning_str, fill=theme.accent_sun, font=font_value
+            )
 
         if evening:
             evening_str = f"{evening.start.strftime('%-I:%M')} - {evening.end.strftime('%-I:%M %p')}"
-            draw.text((250, y + 22), "Evening:", fill=theme.text_tertiary, font=font)
-            draw.text(
-                (320, y + 22), evening_str, fill=theme.accent_warm, font=font_value
+            self.draw_text(
+                draw, (250, y + 22), "Evening:", fill=theme.text_tertiary, font=font
+            )
+            self.draw_text(
+                draw,
+                (320, y + 22),
+                evening_str,
+                fill=theme.accent_warm,
+                font=font_value,
             )
 
     def _render_current_info(self, draw: ImageDraw.ImageDraw, y: int) -> None:
@@ -106,17 +120,21 @@ class SolarView(BaseView):
             radius=Layout.ROUNDED_RADIUS,
             fill=theme.background_panel,
         )
-        draw.text((20, y + 5), "Sun Position", fill=theme.text_tertiary, font=font)
+        self.draw_text(
+            draw, (20, y + 5), "Sun Position", fill=theme.text_tertiary, font=font
+        )
 
         if self.providers.solar:
             pos = self.providers.solar.get_solar_position()
             if pos:
                 elev_str = f"El: {pos.elevation:.1f}°"
                 az_str = f"Az: {pos.azimuth:.0f}°"
-                draw.text(
-                    (20, y + 22), elev_str, fill=theme.accent_sun, font=font_value
+                self.draw_text(
+                    draw, (20, y + 22), elev_str, fill=theme.accent_sun, font=font_value
+                )
+                self.draw_text(
+                    draw, (20, y + 40), az_str, fill=theme.text_secondary, font=font
                 )
-                draw.text((20, y + 40), az_str, fill=theme.text_secondary, font=font)
 
         # Day length - rounded box
         draw.rounded_rectangle(
@@ -124,7 +142,9 @@ class SolarView(BaseView):
             radius=Layout.ROUNDED_RADIUS,
             fill=theme.background_panel,
         )
-        draw.text((175, y + 5), "Day Length", fill=theme.text_tertiary, font=font)
+        self.draw_text(
+            draw, (175, y + 5), "Day Length", fill=theme.text_tertiary, font=font
+        )
 
         if self.providers.solar:
             length = self.providers.solar.get_day_length()
@@ -132,7 +152,8 @@ class SolarView(BaseView):
             if length:
                 hours = int(length)
                 minutes = int((length - hours) * 60)
-                draw.text(
+                self.draw_text(
+                    draw,
                     (175, y + 22),
                     f"{hours}h {minutes}m",
                     fill=theme.text_primary,
@@ -141,7 +162,8 @@ class SolarView(BaseView):
             if change:
                 sign = "+" if change > 0 else ""
                 color = theme.accent_sun if change > 0 else PURPLE
-                draw.text(
+                self.draw_text(
+                    draw,
                     (175, y + 42),
                     f"{sign}{change:.1f}m vs yday",
                     fill=color,
@@ -154,13 +176,15 @@ class SolarView(BaseView):
             radius=Layout.ROUNDED_RADIUS,
             fill=theme.background_panel,
         )
-        draw.text((330, y + 5), "Next Event", fill=theme.text_tertiary, font=font)
+        self.draw_text(
+            draw, (330, y + 5), "Next Event", fill=theme.text_tertiary, font=font
+        )
 
         if self.providers.solar:
-            next_event = self.providers.solar.get_next_solar_event()
+            now = datetime.datetime.now().astimezone()
+            next_event = self.providers.solar.get_next_solar_event(now)
             if next_event:
                 name, time = next_event
-                now = datetime.datetime.now(time.tzinfo)
                 delta = time - now
                 if delta.total_seconds() < 0:
                     # Event just passed; data provider will update shortly
@@ -168,10 +192,15 @@ class SolarView(BaseView):
                 else:
                     hours = int(delta.total_seconds() // 3600)
                     minutes = int((delta.total_seconds() % 3600) // 60)
-                    draw.text(
-                        (330, y + 22), name, fill=theme.accent_warm, font=font_value
+                    self.draw_text(
+                        draw,
+                        (330, y + 22),
+                        name,
+                        fill=theme.accent_warm,
+                        font=font_value,
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (330, y + 42),
                         f"in {hours}h {minutes}m",
                         fill=theme.text_secondary,
@@ -31,9 +31,15 @@ class SunPathView(BaseView):
         font_small = self.get_font(14)
         time_str = now.strftime("%-I:%M %p")
         date_str = now.strftime("%a %b %d")
-        draw.text((10, 40), time_str, fill=theme.text_primary, font=font_small)
-        draw.text(
-            (self.width - 80, 40), date_str, fill=theme.text_primary, font=font_small
+        self.draw_text(
+            draw, (10, 40), time_str, fill=theme.text_primary, font=font_small
+        )
+        self.draw_text(
+            draw,
+            (self.width - 80, 40),
+            date_str,
+            fill=theme.text_primary,
+            font=font_small,
         )
 
         # Sun path chart
@@ -53,15 +59,19 @@ class SunPathView(BaseView):
         # Y-axis labels at correct positions for the chart elevation range
         font_tiny = self.get_font(FontSize.AXIS_LABEL)
         elev_range = self.CHART_ELEV_MAX - self.CHART_ELEV_MIN
-        draw.text(
+        self.draw_text(
+            draw,
             (5, chart_y),
             f"{self.CHART_ELEV_MAX}°",
             fill=theme.text_tertiary,
             font=font_tiny,
         )
         zero_y = chart_y + int((self.CHART_ELEV_MAX / elev_range) * chart_height) - 5
-        draw.text((10, zero_y), "0°", fill=theme.text_tertiary, font=font_tiny)
-        draw.text(
+        self.draw_text(
+            draw, (10, zero_y), "0°", fill=theme.text_tertiary, font=font_tiny
+        )
+        self.draw_text(
+            draw,
             (5, chart_y + chart_height - 10),
             f"{self.CHART_ELEV_MIN}°",
             fill=theme.text_tertiary,
@@ -75,7 +85,8 @@ class SunPathView(BaseView):
         for hour in [0, 6, 12, 18, 24]:
             x = chart_x + int((hour / 24) * chart_width)
             label = f"{hour:02d}"
-            draw.text(
+            self.draw_text(
+                draw,
                 (x - 8, chart_y + chart_height + 2),
                 label,
                 fill=theme.text_tertiary,
@@ -202,16 +213,18 @@ class SunPathView(BaseView):
                     hours = int(delta.total_seconds() // 3600)
                     minutes = int((delta.total_seconds() % 3600) // 60)
 
-                    draw.text(
-                        (20, y + 5), event_name, fill=theme.accent_warm, font=font
+                    self.draw_text(
+                        draw, (20, y + 5), event_name, fill=theme.accent_warm, font=font
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (115, y + 5),
                         f"in {hours}h {minutes}m",
                         fill=theme.text_primary,
                         font=font,
                     )
-                    draw.text(
+                    self.draw_text(
+                        draw,
                         (20, y + 30),
                         f"at {event_time.strftime('%-I:%M %p')}",
                         fill=theme.text_secondary,
@@ -228,7 +241,9 @@ class SunPathView(BaseView):
             if pos:
                 elev_str = f"El {pos.elevation:.0f}°"
                 az_str = f"Az {pos.azimuth:.0f}°"
-                draw.text(
-                    (260, y + 8), elev_str, fill=theme.accent_sun, font=font_value
+                self.draw_text(
+                    draw, (260, y + 8), elev_str, fill=theme.accent_sun, font=font_value
+                )
+                self.draw_text(
+                    draw, (260, y + 32), az_str, fill=theme.text_secondary, font=font
                 )
-                draw.text((260, y + 32), az_str, fill=theme.text_secondary, font=font)
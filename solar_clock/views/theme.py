@@ -137,8 +137,9 @@ class ThemeManager:
         """
         self._solar_provider = solar_provider
         self._mode: ThemeMode = "auto"
-        self._cached_theme: Optional[Theme] = None
-        self._cache_time: float = 0
+        # (mode, theme, computed at) swapped in as one tuple, so HTTP threads
+        # changing the mode never race the render thread into a stale theme
+        self._cache: Optional[tuple[ThemeMode, Theme, float]] = None
         self._cache_duration: float = 60.0  # 1 minute cache
 
     @classmethod
@@ -175,7 +176,7 @@ class ThemeManager:
         if mode not in ("auto", "day", "night"):
             raise ValueError(f"Invalid theme mode: {mode}")
         self._mode = mode
-        self._cached_theme = None  # Invalidate cache
+        self._cache = None  # Invalidate cache
         logger.info(f"Theme mode set to: {mode}")
 
     def _fallback_is_daytime(self) -> bool:
@@ -227,25 +228,27 @@ class ThemeManager:
             Current Theme instance
         """
         now = time.time()
+        mode = self._mode
 
-        # Check cache validity
+        # Check cache validity; an entry computed for another mode is stale
+        cache = self._cache
         if (
-            self._cached_theme is not None
-            and (now - self._cache_time) < self._cache_duration
+            cache is not None
+            and cache[0] == mode
+            and (now - cache[2]) < self._cache_duration
         ):
-            return self._cached_theme
+            return cache[1]
 
         # Determine theme
-        if self._mode == "day":
+        if mode == "day":
             theme = DAY_THEME
-        elif self._mode == "night":
+        elif mode == "night":
             theme = NIGHT_THEME
         else:  # auto
             theme = DAY_THEME if self.is_daytime() else NIGHT_THEME
 
         # Update cache
-        self._cached_theme = theme
-        self._cache_time = now
+        self._cache = (mode, theme, now)
 
         return theme
 
@@ -1,11 +1,16 @@
 """Weather view - current conditions and forecast."""
 
 import datetime
+from typing import TYPE_CHECKING, Optional
 
 from PIL import Image, ImageDraw
 
-from .base import BaseView, UPDATE_FREQUENT, FontSize, Layout
+from .base import BaseView, DataProviders, UPDATE_FREQUENT, FontSize, Layout
 from .colors import LIGHT_BLUE
+from .theme import Theme
+
+if TYPE_CHECKING:
+    from ..config import Config
 
 
 class WeatherView(BaseView):
@@ -15,6 +20,11 @@ class WeatherView(BaseView):
     title = "Weather"
     update_interval = UPDATE_FREQUENT
 
+    def __init__(self, config: "Config", providers: DataProviders):
+        super().__init__(config, providers)
+        # (theme, panel image) for the static part of the forecast panel
+        self._forecast_panel: Optional[tuple[Theme, Image.Image]] = None
+
     def render_content(self, draw: ImageDraw.ImageDraw, image: Image.Image) -> None:
         """Render the weather view content."""
         theme = self.get_theme()
@@ -26,7 +36,7 @@ class WeatherView(BaseView):
         self._render_current_conditions(draw, Layout.CONTENT_START)
 
         # Forecast (right side)
-        self._render_forecast(draw, Layout.CONTENT_START)
+        self._render_forecast(draw, image, Layout.CONTENT_START)
 
         # Location and weather description
         font_small = self.get_font(14)
@@ -53,9 +63,12 @@ class WeatherView(BaseView):
                         else:
                             hi = mid - 1
                     desc = desc[:lo].rstrip() + "..."
-                draw.text((20, 170), desc, fill=theme.accent_sun, font=font_desc)
+                self.draw_text(
+                    draw, (20, 170), desc, fill=theme.accent_sun, font=font_desc
+                )
 
-        draw.text(
+        self.draw_text(
+            draw,
             (20, self.content_height - 25),
             location,
             fill=theme.text_tertiary,
@@ -87,53 +100,37 @@ class WeatherView(BaseView):
         # Temperature - larger and bolder
         unit = "°C" if self.config.weather.units == "metric" else "°F"
         temp = f"{weather.temperature:.0f}{unit}"
-        draw.text((x, y + 5), temp, fill=theme.text_primary, font=font_large)
+        self.draw_text(draw, (x, y + 5), temp, fill=theme.text_primary, font=font_large)
 
         # Feels like
         feels = f"Feels {weather.feels_like:.0f}°"
-        draw.text((x, y + 58), feels, fill=theme.text_secondary, font=font_small)
+        self.draw_text(
+            draw, (x, y + 58), feels, fill=theme.text_secondary, font=font_small
+        )
 
         # Humidity with icon
         humidity = f"Humidity {weather.humidity}%"
-        draw.text((x, y + 78), humidity, fill=theme.text_secondary, font=font_small)
+        self.draw_text(
+            draw, (x, y + 78), humidity, fill=theme.text_secondary, font=font_small
+        )
 
         # Wind
         wind = f"Wind {weather.wind_speed:.0f} {weather.wind_direction}"
-        draw.text((x, y + 98), wind, fill=theme.text_secondary, font=font_small)
+        self.draw_text(
+            draw, (x, y + 98), wind, fill=theme.text_secondary, font=font_small
+        )
 
-    def _render_forecast(self, draw: ImageDraw.ImageDraw, y: int) -> None:
+    def _render_forecast(
+        self, draw: ImageDraw.ImageDraw, image: Image.Image, y: int
+    ) -> None:
         """Render 3-day forecast."""
-        font_header = self.get_font(FontSize.CAPTION)
         font_day = self.get_font(16)
         font_temp = self.get_bold_font(18)
         theme = self.get_theme()
 
-        # Forecast panel background
+        # Static panel (background, column headers, divider) is cached
         x_start = 175
-        draw.rounded_rectangle(
-            ((170, y - 5), (self.width - 10, y + 175)),
-            radius=8,
-            fill=theme.background_panel,
-        )
-
-        # Table headers
-        draw.text(
-            (x_start + 5, y + 2), "Day", fill=theme.text_tertiary, font=font_header
-        )
-        draw.text(
-            (x_start + 75, y + 2), "Hi", fill=theme.text_tertiary, font=font_header
-        )
-        draw.text(
-            (x_start + 125, y + 2), "Lo", fill=theme.text_tertiary, font=font_header
-        )
-        draw.text(
-            (x_start + 175, y + 2), "Rain", fill=theme.text_tertiary, font=font_header
-        )
-
-        # Header divider
-        draw.line(
-            [(x_start, y + 20), (self.width - 15, y + 20)], fill=theme.divider, width=1
-        )
+        image.paste(self._get_forecast_panel(theme, x_start), (170, y - 5))
 
         if self.providers.weather is None:
             return
@@ -153,16 +150,22 @@ class WeatherView(BaseView):
                 # Get day of week
                 day_label = datetime.date.fromisoformat(day.date).strftime("%a")
 
-            draw.text(
-                (x_start + 5, row_y), day_label, fill=theme.text_primary, font=font_day
+            self.draw_text(
+                draw,
+                (x_start + 5, row_y),
+                day_label,
+                fill=theme.text_primary,
+                font=font_day,
             )
-            draw.text(
+            self.draw_text(
+                draw,
                 (x_start + 70, row_y),
                 f"{day.high_temp:.0f}°",
                 fill=theme.accent_warm,
                 font=font_temp,
             )
-            draw.text(
+            self.draw_text(
+                draw,
                 (x_start + 120, row_y),
                 f"{day.low_temp:.0f}°",
                 fill=theme.accent_cool,
@@ -172,7 +175,8 @@ class WeatherView(BaseView):
             # Rain chance with color coding
             rain = day.rain_chance
             rain_color = theme.text_secondary if rain < 30 else theme.accent_cool
-            draw.text(
+            self.draw_text(
+                draw,
                 (x_start + 175, row_y),
                 f"{rain}%",
                 fill=rain_color,
@@ -188,3 +192,48 @@ class WeatherView(BaseView):
                 )
 
             row_y += row_height
+
+    def _get_forecast_panel(self, theme: Theme, x_start: int) -> Image.Image:
+        """
+        Get the forecast panel background with its column headers.
+
+        The panel only changes with the theme, so it is drawn once and
+        pasted on every frame.
+
+        Args:
+            theme: Current theme
+            x_start: Screen x of the table's left edge
+
+        Returns:
+            Panel image, to be pasted 5px above the forecast area at x=170
+        """
+        if self._forecast_panel and self._forecast_panel[0] == theme:
+            return self._forecast_panel[1]
+
+        font_header = self.get_font(FontSize.CAPTION)
+        left = x_start - 170  # Panel-local x of the table's left edge
+        panel = Image.new("RGB", (self.width - 10 - 170 + 1, 181), theme.background)
+        draw = ImageDraw.Draw(panel)
+        draw.rounded_rectangle(
+            ((0, 0), (panel.width - 1, panel.height - 1)),
+            radius=8,
+            fill=theme.background_panel,
+        )
+
+        # Table headers
+        for offset, label in ((5, "Day"), (75, "Hi"), (125, "Lo"), (175, "Rain")):
+            self.draw_text(
+                draw,
+                (left + offset, 7),
+                label,
+                fill=theme.text_tertiary,
+                font=font_header,
+            )
+
+        # Header divider
+        draw.line(
+            [(left, 25), (self.width - 15 - 170, 25)], fill=theme.divider, width=1
+        )
+
+        self._forecast_panel = (theme, panel)
+        return panel
@@ -192,6 +192,7 @@ def mock_providers():
         winter_solstice=datetime.date(2024, 12, 21),
     )
     lunar.get_analemma_data.return_value = []
+    lunar.get_analemma_series.return_value = None
     lunar.get_equation_of_time.return_value = 5.2  # Minutes
 
     return DataProviders(weather=weather, solar=solar, lunar=lunar)
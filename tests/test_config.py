@@ -1,9 +1,10 @@
 """Tests for configuration loading and validation."""
 
+import dataclasses
 import json
 import os
+import sys
 import pytest
-from pathlib import Path
 from unittest.mock import patch
 
 from solar_clock.config import (
@@ -12,9 +13,13 @@ from solar_clock.config import (
     DisplayConfig,
     HttpServerConfig,
     WeatherConfig,
+    TouchConfig,
+    AppearanceConfig,
     load_config,
+    reload_config,
     get_api_key,
     _dict_to_config,
+    _parse_config,
 )
 
 
@@ -31,7 +36,7 @@ class TestLocationConfig:
             longitude=-74.0060,
         )
         errors = loc.validate()
-        assert errors == []
+        assert errors == ()
 
     def test_invalid_latitude_too_high(self):
         """Test latitude over 90 is invalid."""
@@ -71,7 +76,7 @@ class TestDisplayConfig:
         """Test valid display config."""
         disp = DisplayConfig(width=480, height=320, nav_bar_height=40)
         errors = disp.validate()
-        assert errors == []
+        assert errors == ()
 
     def test_invalid_width(self):
         """Test zero width is invalid."""
@@ -93,7 +98,7 @@ class TestHttpServerConfig:
         """Test valid server config."""
         http = HttpServerConfig(port=8080, bind_address="127.0.0.1")
         errors = http.validate()
-        assert errors == []
+        assert errors == ()
 
     def test_invalid_port_zero(self):
         """Test port 0 is invalid."""
@@ -120,7 +125,7 @@ class TestWeatherConfig:
         """Test valid weather config."""
         weather = WeatherConfig(update_interval_seconds=900, units="imperial")
         errors = weather.validate()
-        assert errors == []
+        assert errors == ()
 
     def test_invalid_interval_too_short(self):
         """Test interval under 60s is invalid."""
@@ -135,6 +140,63 @@ class TestWeatherConfig:
         assert any("units" in e.lower() for e in errors)
 
 
+class TestAppearanceConfig:
+    """Tests for AppearanceConfig validation."""
+
+    def test_default_view_range(self):
+        """default_view must index an existing view."""
+        from solar_clock.views import VIEW_CLASSES
+
+        assert AppearanceConfig(default_view=len(VIEW_CLASSES) - 1).validate() == ()
+        errors = AppearanceConfig(default_view=len(VIEW_CLASSES)).validate()
+        assert any("default_view" in e for e in errors)
+
+    def test_invalid_theme_mode(self):
+        """Unknown theme modes are rejected."""
+        errors = AppearanceConfig(theme_mode="sepia").validate()  # type: ignore[arg-type]
+        assert any("theme_mode" in e for e in errors)
+
+
+class TestConfigValidate:
+    """Tests for whole-config validation."""
+
+    def test_collects_errors_from_all_sections_in_order(self):
+        """Errors from every section are gathered, in section order."""
+        config = Config(
+            location=LocationConfig(latitude=100),
+            http_server=HttpServerConfig(port=0),
+            touch=TouchConfig(tap_timeout=0),
+        )
+
+        errors = config.validate()
+
+        assert len(errors) == 3
+        assert "latitude" in errors[0]
+        assert "port" in errors[1]
+        assert "Tap timeout" in errors[2]
+
+    def test_valid_config_has_no_errors(self):
+        """A default config validates cleanly, without allocating a list."""
+        from solar_clock.config import _EMPTY
+
+        assert Config().validate() is _EMPTY
+        assert Config().location.validate() is _EMPTY
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_config_instances_are_slotted(self):
+        """Config and its sections store fields in slots, not a __dict__."""
+        config = Config()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.display, "__dict__")
+
+    def test_config_is_frozen_and_hashable(self):
+        """Loaded configs cannot drift and can key downstream caches."""
+        config = Config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.display.width = 100  # type: ignore[misc]
+        assert hash(config.location) == hash(LocationConfig())
+
+
 class TestConfigLoading:
     """Tests for config file loading."""
 
@@ -158,6 +220,43 @@ class TestConfigLoading:
             load_config(bad_file)
         assert "Invalid JSON" in str(exc_info.value)
 
+    def test_load_without_msgspec_uses_json(self, temp_config_file):
+        """The stdlib json fallback yields the same config as msgspec would."""
+        with patch("solar_clock.config.MSGSPEC_AVAILABLE", False):
+            config = reload_config(temp_config_file)
+        assert config.location.name == "Test City"
+        assert config.display.width == 480
+
+    def test_msgspec_loads_what_json_loads(self, tmp_path):
+        """Installing msgspec doesn't change which configs load, or how."""
+        pytest.importorskip("msgspec")
+        config_file = tmp_path / "config.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "location": {"name": "Test City"},
+                    "weather": {"update_interval_seconds": 900.0},
+                }
+            )
+        )
+
+        with patch("solar_clock.config.MSGSPEC_AVAILABLE", True):
+            fast = reload_config(config_file)
+        with patch("solar_clock.config.MSGSPEC_AVAILABLE", False):
+            plain = reload_config(config_file)
+
+        assert fast == plain
+        assert fast.weather.update_interval_seconds == 900
+
+    def test_load_non_utf8_file(self, tmp_path):
+        """Undecodable bytes are reported as invalid JSON, not a crash."""
+        bad_file = tmp_path / "latin1.json"
+        bad_file.write_bytes(b'{"location": {"name": "Z\xfcrich"}}')
+        with patch("solar_clock.config.MSGSPEC_AVAILABLE", False):
+            with pytest.raises(ValueError) as exc_info:
+                load_config(bad_file)
+        assert "Invalid JSON" in str(exc_info.value)
+
     def test_load_validation_error(self, tmp_path):
         """Test loading config with validation errors raises error."""
         bad_config = tmp_path / "bad_config.json"
@@ -169,13 +268,56 @@ class TestConfigLoading:
 
     def test_load_defaults_when_no_file(self):
         """Test defaults used when no config file found."""
-        with patch(
-            "solar_clock.config.CONFIG_PATHS", [Path("/nonexistent/config.json")]
-        ):
+        with patch("solar_clock.config.CONFIG_PATHS", ("/nonexistent/config.json",)):
             config = load_config(None)
             assert isinstance(config, Config)
             assert config.display.width == 480  # Default
 
+    def test_load_first_existing_default_path(self, temp_config_file, tmp_path):
+        """Missing candidates are skipped; the first file that opens is used."""
+        candidates = (str(tmp_path / "missing.json"), str(temp_config_file))
+        with patch("solar_clock.config.CONFIG_PATHS", candidates):
+            config = load_config(None)
+        assert config.location.name == "Test City"
+
+    def test_load_reuses_cached_config(self, temp_config_file):
+        """An unchanged file is parsed once and the same config is returned."""
+        first = load_config(temp_config_file)
+
+        with patch("solar_clock.config._parse_config") as mock_parse:
+            second = load_config(temp_config_file)
+            mock_parse.assert_not_called()
+
+        assert second is first
+
+    def test_cache_hit_does_not_open_file(self, temp_config_file):
+        """With an unchanged mtime, a single stat() is all load_config needs."""
+        first = load_config(temp_config_file)
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            assert load_config(temp_config_file) is first
+
+    def test_load_rereads_modified_file(self, temp_config_file):
+        """A changed mtime invalidates the cached config."""
+        load_config(temp_config_file)
+
+        data = json.loads(temp_config_file.read_text())
+        data["location"]["name"] = "Changed City"
+        temp_config_file.write_text(json.dumps(data))
+        st = temp_config_file.stat()
+        os.utime(temp_config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert load_config(temp_config_file).location.name == "Changed City"
+
+    def test_reload_config_bypasses_cache(self, temp_config_file):
+        """reload_config() parses the file again even if it is unchanged."""
+        load_config(temp_config_file)
+        with patch(
+            "solar_clock.config._parse_config", wraps=_parse_config
+        ) as mock_parse:
+            config = reload_config(temp_config_file)
+            mock_parse.assert_called_once()
+        assert config.location.name == "Test City"
+
     def test_dict_to_config_partial(self):
         """Test converting partial dict uses defaults."""
         config = _dict_to_config({"location": {"name": "Custom"}})
@@ -206,9 +348,53 @@ def test_dataclass_from_dict_does_not_call_constructor_for_defaults():
     assert result.units == "metric"
 
 
+def test_config_sections_table_covers_every_config_field():
+    """_dict_to_config is table-driven; the table must match Config's fields."""
+    from solar_clock.config import _CONFIG_SECTIONS
+
+    fields = {f.name: f.type for f in dataclasses.fields(Config)}
+    assert [attr for _, attr, _ in _CONFIG_SECTIONS] == list(fields)
+    for key, attr, cls in _CONFIG_SECTIONS:
+        assert key == attr
+        assert fields[attr] in (cls, cls.__name__)
+
+
+def test_dataclass_from_dict_fills_defaults():
+    """Absent fields take the dataclass defaults."""
+    from solar_clock.config import _dataclass_from_dict
+
+    result = _dataclass_from_dict(TouchConfig, {"tap_timeout": 0.2})
+
+    assert result.tap_timeout == 0.2
+    assert result.device == "/dev/input/event0"
+
+
+def test_dataclass_from_dict_rejects_unknown_keys():
+    """A misspelt key fails loudly instead of leaving the field at its default."""
+    from solar_clock.config import _dataclass_from_dict
+
+    with pytest.raises(ValueError, match="Unknown keys in LocationConfig: lattitude"):
+        _dataclass_from_dict(LocationConfig, {"lattitude": 40.0})
+
+
+def test_load_rejects_unknown_section(tmp_path):
+    """Unknown top-level sections are rejected when loading."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"locaton": {"latitude": 40.0}}))
+    with pytest.raises(ValueError, match="locaton"):
+        load_config(path)
+
+
 class TestGetApiKey:
     """Tests for API key retrieval."""
 
+    @pytest.fixture(autouse=True)
+    def clear_api_key_cache(self):
+        """Re-read the environment in every test."""
+        get_api_key.cache_clear()
+        yield
+        get_api_key.cache_clear()
+
     def test_get_api_key_from_env(self):
         """Test getting API key from environment."""
         with patch.dict(os.environ, {"OPENWEATHER_API_KEY": "test_key_123"}):
@@ -222,3 +408,12 @@ class TestGetApiKey:
             os.environ.pop("OPENWEATHER_API_KEY", None)
             key = get_api_key()
             assert key is None
+
+    def test_get_api_key_is_cached(self):
+        """The environment is only consulted on the first call."""
+        with patch.dict(os.environ, {"OPENWEATHER_API_KEY": "first"}):
+            assert get_api_key() == "first"
+        with patch.dict(os.environ, {"OPENWEATHER_API_KEY": "second"}):
+            assert get_api_key() == "first"
+            get_api_key.cache_clear()
+            assert get_api_key() == "second"
@@ -1,7 +1,9 @@
 """Tests for framebuffer display operations."""
 
-from unittest.mock import MagicMock, mock_open, patch
+import os
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -25,76 +27,100 @@ class TestDisplay:
         """Create a Display instance with mock config."""
         return Display(mock_config)
 
+    @pytest.fixture
+    def fb_writes(self, display):
+        """Give the display a fake descriptor and record each pwrite() to it."""
+        writes = []
+
+        def pwrite(fd, data, offset):
+            # Copy now: the frame buffers are reused by later writes
+            data = bytes(data)
+            writes.append((offset, data))
+            return len(data)
+
+        display._fb_fd = 99
+        with patch("solar_clock.display.os.pwrite", side_effect=pwrite) as mock:
+            mock.writes = writes
+            yield mock
+
     def test_initialization(self, display, mock_config):
         """Test Display initialization."""
         assert display.width == 480
         assert display.height == 320
         assert display.framebuffer == "/dev/fb1"
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_open_success(self, display):
         """Test successfully opening framebuffer."""
-        mock_file = mock_open()
-        with patch("builtins.open", mock_file):
+        with (
+            patch.object(Display, "_map_framebuffer", return_value=False),
+            patch("solar_clock.display.os.open", return_value=7) as mock_open_fd,
+        ):
             result = display.open()
 
         assert result is True
-        assert display._fb_handle is not None
-        mock_file.assert_called_once_with("/dev/fb1", "wb")
+        assert display._fb_fd == 7
+        mock_open_fd.assert_called_once_with("/dev/fb1", os.O_WRONLY)
 
     def test_open_permission_error(self, display):
         """Test opening framebuffer with permission denied."""
-        with patch("builtins.open", side_effect=PermissionError("Permission denied")):
+        with patch(
+            "solar_clock.display.os.open",
+            side_effect=PermissionError("Permission denied"),
+        ):
             result = display.open()
 
         assert result is False
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_open_file_not_found(self, display):
         """Test opening non-existent framebuffer."""
-        with patch("builtins.open", side_effect=FileNotFoundError("Not found")):
+        with patch(
+            "solar_clock.display.os.open", side_effect=FileNotFoundError("Not found")
+        ):
             result = display.open()
 
         assert result is False
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_open_os_error(self, display):
         """Test opening framebuffer with OS error."""
-        with patch("builtins.open", side_effect=OSError("Device error")):
+        with patch("solar_clock.display.os.open", side_effect=OSError("Device error")):
             result = display.open()
 
         assert result is False
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_close(self, display):
         """Test closing framebuffer."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
+        display._fb_fd = 7
 
-        display.close()
+        with patch("solar_clock.display.os.close") as mock_close:
+            display.close()
 
-        mock_file.close.assert_called_once()
-        assert display._fb_handle is None
+        mock_close.assert_called_once_with(7)
+        assert display._fb_fd is None
 
     def test_close_with_error(self, display):
         """Test closing framebuffer when close raises exception."""
-        mock_file = MagicMock()
-        mock_file.close.side_effect = IOError("Close error")
-        display._fb_handle = mock_file
+        display._fb_fd = 7
 
         # Should not raise exception
-        display.close()
+        with patch("solar_clock.display.os.close", side_effect=OSError("Close error")):
+            display.close()
 
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_close_when_not_open(self, display):
         """Test closing when framebuffer is not open."""
-        display._fb_handle = None
+        display._fb_fd = None
 
         # Should not raise exception
-        display.close()
+        with patch("solar_clock.display.os.close") as mock_close:
+            display.close()
 
-        assert display._fb_handle is None
+        mock_close.assert_not_called()
+        assert display._fb_fd is None
 
     def test_rgb_to_rgb565_conversion(self, display):
         """Test RGB to RGB565 color conversion."""
@@ -133,39 +159,33 @@ class TestDisplay:
         # Little-endian: [0xFF, 0xFF]
         assert rgb565_data[6:8] == bytes([0xFF, 0xFF])
 
-    def test_write_frame_success(self, display):
+    def test_write_frame_success(self, display, fb_writes):
         """Test successfully writing frame to framebuffer."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         # Create test image
         image = Image.new("RGB", (480, 320), color=(128, 128, 128))
 
         result = display.write_frame(image)
 
         assert result is True
-        mock_file.seek.assert_called_once_with(0)
-        mock_file.write.assert_called_once()
-        mock_file.flush.assert_called_once()
+        fb_writes.assert_called_once()
+        assert fb_writes.call_args[0][0] == 99
 
-        # Check that correct amount of data was written (480*320*2 bytes)
-        written_data = mock_file.write.call_args[0][0]
+        # Whole frame (480*320*2 bytes) is written in one call at offset 0
+        offset, written_data = fb_writes.writes[0]
+        assert offset == 0
         assert len(written_data) == 480 * 320 * 2
 
     def test_write_frame_when_not_open(self, display):
         """Test writing frame when framebuffer is not open."""
-        display._fb_handle = None
+        display._fb_fd = None
 
         image = Image.new("RGB", (480, 320))
         result = display.write_frame(image)
 
         assert result is False
 
-    def test_write_frame_resizes_image(self, display):
+    def test_write_frame_resizes_image(self, display, fb_writes):
         """Test that write_frame resizes image to correct dimensions."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         # Create image with wrong size
         image = Image.new("RGB", (640, 480))
 
@@ -173,92 +193,85 @@ class TestDisplay:
 
         assert result is True
         # Verify data is for correct size
-        written_data = mock_file.write.call_args[0][0]
+        _, written_data = fb_writes.writes[0]
         assert len(written_data) == 480 * 320 * 2
 
-    def test_write_frame_converts_mode(self, display):
+    def test_write_frame_converts_mode(self, display, fb_writes):
         """Test that write_frame converts non-RGB images."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         # Create image in RGBA mode
         image = Image.new("RGBA", (480, 320), color=(255, 0, 0, 128))
 
         result = display.write_frame(image)
 
         assert result is True
-        mock_file.write.assert_called_once()
+        fb_writes.assert_called_once()
 
-    def test_write_frame_io_error(self, display):
+    def test_write_frame_io_error(self, display, fb_writes):
         """Test write_frame handles IO errors."""
-        mock_file = MagicMock()
-        mock_file.write.side_effect = IOError("Write failed")
-        display._fb_handle = mock_file
+        fb_writes.side_effect = IOError("Write failed")
 
         image = Image.new("RGB", (480, 320))
         result = display.write_frame(image)
 
         assert result is False
 
-    def test_clear_display(self, display):
+    def test_clear_display(self, display, fb_writes):
         """Test clearing display to solid color."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         result = display.clear(color=(255, 0, 0))
 
         assert result is True
-        mock_file.write.assert_called_once()
+        fb_writes.assert_called_once()
 
         # Verify red color was written
-        written_data = mock_file.write.call_args[0][0]
+        _, written_data = fb_writes.writes[0]
         # Red (255,0,0) in RGB565 is 0xF800 (little-endian: 0x00, 0xF8)
         # Check first pixel
         assert written_data[0] == 0x00
         assert written_data[1] == 0xF8
 
-    def test_clear_display_default_black(self, display):
+    def test_clear_display_default_black(self, display, fb_writes):
         """Test clearing display defaults to black."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         result = display.clear()
 
         assert result is True
-        mock_file.write.assert_called_once()
+        fb_writes.assert_called_once()
 
         # Verify black (0,0,0) was written
-        written_data = mock_file.write.call_args[0][0]
+        _, written_data = fb_writes.writes[0]
         # Black in RGB565 is 0x0000
         assert written_data[0] == 0x00
         assert written_data[1] == 0x00
 
     def test_context_manager(self, display):
         """Test Display as context manager."""
-        mock_file = mock_open()
-
-        with patch("builtins.open", mock_file):
+        with (
+            patch.object(Display, "_map_framebuffer", return_value=False),
+            patch("solar_clock.display.os.open", return_value=7),
+            patch("solar_clock.display.os.close"),
+        ):
             with display as d:
                 assert d is display
-                assert display._fb_handle is not None
+                assert display._fb_fd is not None
 
         # After exit, should be closed
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_context_manager_with_exception(self, display):
         """Test context manager properly closes on exception."""
-        mock_file = mock_open()
-
-        with patch("builtins.open", mock_file):
+        with (
+            patch.object(Display, "_map_framebuffer", return_value=False),
+            patch("solar_clock.display.os.open", return_value=7),
+            patch("solar_clock.display.os.close"),
+        ):
             try:
                 with display:
-                    assert display._fb_handle is not None
+                    assert display._fb_fd is not None
                     raise ValueError("Test exception")
             except ValueError:
                 pass
 
         # Should still be closed after exception
-        assert display._fb_handle is None
+        assert display._fb_fd is None
 
     def test_rgb565_color_accuracy(self, display):
         """Test RGB565 conversion maintains color accuracy within limits."""
@@ -289,21 +302,150 @@ class TestDisplay:
             # Just verify it produces 2 bytes without error
             assert len(rgb565_data) == 2
 
-    def test_write_frame_data_integrity(self, display):
+    def test_write_frame_data_integrity(self, display, fb_writes):
         """Test that write_frame produces consistent data."""
-        mock_file = MagicMock()
-        display._fb_handle = mock_file
-
         image = Image.new("RGB", (480, 320), color=(100, 150, 200))
 
         # Write twice
         display.write_frame(image)
-        first_write = mock_file.write.call_args[0][0]
-
-        mock_file.reset_mock()
-
+        display._last_fb = None  # Force a full rewrite
         display.write_frame(image)
-        second_write = mock_file.write.call_args[0][0]
 
         # Should produce identical data
+        first_write, second_write = fb_writes.writes
         assert first_write == second_write
+
+    def test_write_frame_unchanged_skips_write(self, display, fb_writes):
+        """Writing the same frame twice only touches the framebuffer once."""
+        image = Image.new("RGB", (480, 320), color=(100, 150, 200))
+        display.write_frame(image)
+        fb_writes.reset_mock()
+
+        assert display.write_frame(image) is True
+        fb_writes.assert_not_called()
+        assert display.frame_changed is False
+
+    def test_write_frame_writes_only_changed_rows(self, display, fb_writes):
+        """Only contiguous runs of changed scanlines are written, at their offsets."""
+        image = Image.new("RGB", (480, 320), color=(0, 0, 0))
+        display.write_frame(image)
+        fb_writes.writes.clear()
+
+        changed = image.copy()
+        changed.paste((255, 0, 0), (10, 5, 20, 8))  # rows 5-7
+        changed.paste((255, 255, 255), (0, 319, 480, 320))  # last row
+        assert display.write_frame(changed) is True
+        assert display.frame_changed is True
+
+        row_bytes = 480 * 2
+        offsets = [offset for offset, _ in fb_writes.writes]
+        writes = [data for _, data in fb_writes.writes]
+        assert offsets == [5 * row_bytes, 319 * row_bytes]
+        assert [len(w) for w in writes] == [3 * row_bytes, row_bytes]
+        assert writes[1] == b"\xff\xff" * 480
+
+    def test_write_frame_rewrites_fully_after_io_error(self, display, fb_writes):
+        """A failed write forgets the previous frame so the next write is complete."""
+        image = Image.new("RGB", (480, 320))
+        display.write_frame(image)
+
+        pwrite = fb_writes.side_effect
+        fb_writes.side_effect = IOError("Write failed")
+        assert display.write_frame(Image.new("RGB", (480, 320), (255, 0, 0))) is False
+
+        fb_writes.writes.clear()
+        fb_writes.side_effect = pwrite
+        display.write_frame(image)
+        assert len(fb_writes.writes) == 1
+        offset, data = fb_writes.writes[0]
+        assert offset == 0
+        assert len(data) == 480 * 320 * 2
+
+    def test_rgb565_lut_matches_bit_arithmetic(self, display):
+        """Lookup-table packing equals the shift-and-mask formula for every level."""
+        levels = np.arange(256, dtype=np.uint8)
+        image = Image.fromarray(
+            np.stack([levels, levels[::-1], np.roll(levels, 7)], axis=-1).reshape(
+                16, 16, 3
+            ),
+            "RGB",
+        )
+        arr = np.asarray(image).astype(np.uint16)
+        expected = (
+            ((arr[..., 0] >> 3) << 11) | ((arr[..., 1] >> 2) << 5) | (arr[..., 2] >> 3)
+        )
+
+        assert np.array_equal(display._rgb_to_rgb565_array(image), expected)
+
+    def test_write_frame_reuses_two_frame_buffers(self, display, fb_writes):
+        """Frames are packed into two buffers that alternate, not fresh arrays."""
+        colors = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        buffers = []
+        for color in colors:
+            display.write_frame(Image.new("RGB", (480, 320), color))
+            buffers.append(display._last_fb)
+
+        assert buffers[0] is buffers[2]
+        assert buffers[1] is buffers[3]
+        assert buffers[0] is not buffers[1]
+        assert np.all(display._last_fb == 0x001F)
+        assert np.all(display._back_fb == 0x07E0)
+
+    def test_mapped_framebuffer_receives_frames(self, mock_config, tmp_path):
+        """A mappable framebuffer gets frames via the mapping, not file writes."""
+        fb_path = tmp_path / "fb"
+        fb_path.write_bytes(b"\x00" * (480 * 320 * 2))
+        mock_config.framebuffer = str(fb_path)
+        display = Display(mock_config)
+
+        assert display.open() is True
+        assert display._fb_pixels is not None
+
+        image = Image.new("RGB", (480, 320), (0, 0, 0))
+        image.paste((255, 255, 255), (0, 10, 480, 12))
+        assert display.write_frame(image) is True
+        image.paste((255, 0, 0), (0, 200, 480, 201))
+        assert display.write_frame(image) is True
+        display.close()
+
+        pixels = np.frombuffer(fb_path.read_bytes(), dtype="<u2").reshape(320, 480)
+        assert np.all(pixels[10:12] == 0xFFFF)
+        assert np.all(pixels[200] == 0xF800)
+        assert np.all(pixels[:10] == 0)
+        assert display._fb_map is None and display._fb_fd is None
+
+    def test_unmappable_framebuffer_falls_back_to_writes(self, mock_config, tmp_path):
+        """A framebuffer too small to map is still written through the file."""
+        fb_path = tmp_path / "fb"
+        fb_path.write_bytes(b"")
+        mock_config.framebuffer = str(fb_path)
+        display = Display(mock_config)
+
+        assert display.open() is True
+        assert display._fb_map is None
+        assert display.write_frame(Image.new("RGB", (480, 320), (255, 255, 255)))
+        display.close()
+
+        assert fb_path.read_bytes() == b"\xff\xff" * (480 * 320)
+
+    def test_rgb565_luts_are_read_only(self):
+        """The shared channel tables cannot be modified in place."""
+        from solar_clock.display import _B_LUT, _G_LUT, _R_LUT
+
+        for lut in (_R_LUT, _G_LUT, _B_LUT):
+            assert lut.shape == (256,)
+            with pytest.raises(ValueError):
+                lut[0] = 1
+
+    def test_write_frame_warns_once_per_resized_size(self, display, fb_writes, caplog):
+        """Mis-sized frames are resized, with one warning per source size."""
+
+        with caplog.at_level("WARNING", logger="solar_clock.display"):
+            for _ in range(3):
+                assert display.write_frame(Image.new("RGB", (640, 480))) is True
+            assert display.write_frame(Image.new("RGB", (240, 160))) is True
+
+        warnings = [r.getMessage() for r in caplog.records]
+        assert len(warnings) == 2
+        assert "640x480" in warnings[0]
+        assert "240x160" in warnings[1]
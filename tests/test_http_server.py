@@ -1,8 +1,13 @@
 """Tests for HTTP server and API endpoints."""
 
 import base64
+import hmac
+import http.client
+import json
 import os
+import socket
 import time
+from http.server import ThreadingHTTPServer
 from io import BytesIO
 from unittest.mock import MagicMock, Mock, patch
 
@@ -10,6 +15,9 @@ import pytest
 from PIL import Image
 
 from solar_clock.http_server import (
+    _etag_matches,
+    WEBP_AVAILABLE,
+    ClientRateLimiter,
     RateLimiter,
     ScreenshotHandler,
     create_server,
@@ -68,6 +76,50 @@ class TestRateLimiter:
 
         assert allowed_count <= 5
 
+    def test_rate_limiter_ignores_wall_clock(self):
+        """Refills follow the monotonic clock; wall-clock steps change nothing."""
+        limiter = RateLimiter(rate_per_second=2)
+        assert limiter.allow() and limiter.allow()
+
+        with patch("time.time", return_value=time.time() + 3600):
+            assert limiter.allow() is False
+
+    def test_rate_limiter_zero_rate_denies(self):
+        """A rate of zero never allows a request."""
+        assert RateLimiter(rate_per_second=0).allow() is False
+
+    def test_rate_limiter_denies_without_lock_when_exhausted(self):
+        """Once the bucket is empty, denials don't contend for the lock."""
+        limiter = RateLimiter(rate_per_second=2)
+        assert limiter.allow() and limiter.allow()
+
+        limiter.lock = MagicMock()
+        assert limiter.allow() is False
+        limiter.lock.__enter__.assert_not_called()
+
+
+class TestClientRateLimiter:
+    """Tests for the per-client rate limiter."""
+
+    def test_clients_have_separate_buckets(self):
+        """Exhausting one client's bucket leaves the others untouched."""
+        limiter = ClientRateLimiter(rate_per_second=1)
+        assert limiter.allow("10.0.0.1") is True
+        assert limiter.allow("10.0.0.1") is False
+        assert limiter.allow("10.0.0.2") is True
+
+    def test_least_recently_used_client_evicted(self):
+        """Past MAX_CLIENTS, the least recently seen client loses its bucket."""
+        limiter = ClientRateLimiter(rate_per_second=1)
+        limiter.MAX_CLIENTS = 2
+        assert limiter.allow("a") and limiter.allow("b")
+        assert limiter.allow("a") is False  # "a" is now most recent
+        assert limiter.allow("c") is True  # evicts "b"
+
+        assert limiter.allow("a") is False
+        assert limiter.allow("b") is True  # fresh bucket, evicts "c"
+        assert limiter.allow("c") is True
+
 
 class TestScreenshotHandler:
     """Tests for the ScreenshotHandler class."""
@@ -97,6 +149,7 @@ class TestScreenshotHandler:
         ScreenshotHandler.clock_instance = mock_clock
         ScreenshotHandler.rate_limiter = None
         ScreenshotHandler.auth_credentials = None
+        ScreenshotHandler._image_cache = {}
 
         # Create handler without going through __init__
         # to avoid socket/request parsing
@@ -108,6 +161,25 @@ class TestScreenshotHandler:
 
         return handler
 
+    def test_log_message_at_debug(self, handler_with_mock, caplog):
+        """Request lines are logged at DEBUG with the client address."""
+        with caplog.at_level("DEBUG", logger="solar_clock.http_server"):
+            handler_with_mock.log_message(
+                '"%s" %s %s', "GET /health HTTP/1.1", 200, "-"
+            )
+
+        assert caplog.messages == ['127.0.0.1 - "GET /health HTTP/1.1" 200 -']
+
+    def test_log_message_skipped_above_debug(self, handler_with_mock):
+        """Nothing is formatted when DEBUG logging is off."""
+        with (
+            patch("solar_clock.http_server.logger.isEnabledFor", return_value=False),
+            patch("solar_clock.http_server.logger.debug") as debug,
+        ):
+            handler_with_mock.log_message("%s", object())
+
+        debug.assert_not_called()
+
     def test_health_endpoint(self, handler_with_mock):
         """Test /health endpoint returns OK."""
         handler = handler_with_mock
@@ -140,6 +212,210 @@ class TestScreenshotHandler:
         output = handler.wfile.getvalue()
         assert output.startswith(b"\x89PNG")
 
+    def test_screenshot_reuses_png_for_unchanged_frame(
+        self, handler_with_mock, mock_clock
+    ):
+        """The same published frame is served from cache without reading pixels."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        with patch.object(
+            Image.Image, "save", autospec=True, side_effect=Image.Image.save
+        ) as save:
+            handler.do_GET()
+            first = handler.wfile.getvalue()
+
+            with patch.object(Image.Image, "tobytes") as tobytes:
+                handler.wfile = BytesIO()
+                handler.do_GET()
+            assert handler.wfile.getvalue() == first
+            assert save.call_count == 1
+            tobytes.assert_not_called()
+
+            # The main loop publishes a new object only when pixels change
+            mock_clock.get_last_frame.return_value = Image.new(
+                "RGB", (480, 320), color=(255, 0, 0)
+            )
+            handler.wfile = BytesIO()
+            handler.do_GET()
+            assert handler.wfile.getvalue() != first
+            assert save.call_count == 2
+
+    def test_screenshot_fallback_render_compares_pixels(
+        self, handler_with_mock, mock_clock
+    ):
+        """Freshly rendered copies with unchanged pixels reuse the encoding."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+        mock_clock.get_last_frame.return_value = None
+
+        with patch.object(
+            Image.Image, "save", autospec=True, side_effect=Image.Image.save
+        ) as save:
+            for color in ((0, 0, 0), (0, 0, 0), (255, 0, 0)):
+                # render_current(copy=True) yields a new object every call
+                mock_clock.view_manager.render_current.return_value = Image.new(
+                    "RGB", (480, 320), color=color
+                )
+                handler.wfile = BytesIO()
+                handler.do_GET()
+            assert save.call_count == 2
+
+    def test_screenshot_serves_published_frame(self, handler_with_mock, mock_clock):
+        """/screenshot reuses the main loop's frame instead of rendering."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(200)
+        mock_clock.view_manager.render_current.assert_not_called()
+
+    def test_screenshot_renders_without_published_frame(
+        self, handler_with_mock, mock_clock
+    ):
+        """With no current published frame, /screenshot renders one."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+        mock_clock.get_last_frame.return_value = None
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(200)
+        mock_clock.view_manager.render_current.assert_called_once_with(copy=True)
+
+    def test_screenshot_png_uses_fast_deflate(self, handler_with_mock):
+        """PNG screenshots are encoded at zlib level 1, not Pillow's default 6."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        with patch.object(
+            Image.Image, "save", autospec=True, side_effect=Image.Image.save
+        ) as save:
+            handler.do_GET()
+
+        assert save.call_args.kwargs["format"] == "PNG"
+        assert save.call_args.kwargs["compress_level"] == 1
+        handler.send_header.assert_any_call(
+            "Content-Length", str(len(handler.wfile.getvalue()))
+        )
+
+    @pytest.mark.skipif(not WEBP_AVAILABLE, reason="Pillow built without WebP")
+    def test_screenshot_webp_when_accepted(self, handler_with_mock):
+        """Clients that accept WebP get a WebP screenshot."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.headers = {"Accept": "image/webp,image/*;q=0.8"}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_header.assert_any_call("Content-Type", "image/webp")
+        handler.send_header.assert_any_call("Vary", "Accept")
+        output = handler.wfile.getvalue()
+        assert output[:4] == b"RIFF" and output[8:12] == b"WEBP"
+
+    def test_screenshot_png_by_default(self, handler_with_mock):
+        """Without WebP in Accept, the screenshot is a PNG."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.headers = {"Accept": "*/*"}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_header.assert_any_call("Content-Type", "image/png")
+        assert handler.wfile.getvalue().startswith(b"\x89PNG")
+
+    def test_screenshot_not_modified_when_etag_matches(self, handler_with_mock):
+        """A matching If-None-Match gets an empty 304; a stale one gets the image."""
+        handler = handler_with_mock
+        handler.path = "/screenshot"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+        etags = [
+            c.args[1] for c in handler.send_header.call_args_list if c.args[0] == "ETag"
+        ]
+        assert len(etags) == 1
+
+        handler.headers = {"If-None-Match": etags[0]}
+        handler.wfile = BytesIO()
+        handler.do_GET()
+        handler.send_response.assert_called_with(304)
+        assert handler.wfile.getvalue() == b""
+
+        handler.headers = {"If-None-Match": '"stale"'}
+        handler.do_GET()
+        handler.send_response.assert_called_with(200)
+        assert handler.wfile.getvalue().startswith(b"\x89PNG")
+
+    @pytest.mark.parametrize(
+        "header, matches",
+        [
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", W/"abc" , "y"', True),
+            ("*", True),
+            ('"xabcx"', False),
+            ('"abc-gzip"', False),
+            ("abc", False),
+            ("", False),
+        ],
+    )
+    def test_etag_matching(self, header, matches):
+        """If-None-Match compares whole tags, weakly, and honors "*"."""
+        assert _etag_matches(header, '"abc"') is matches
+
+    @pytest.mark.parametrize("param", ["jpeg", "JPG"])
+    def test_screenshot_format_query(self, handler_with_mock, param):
+        """?format=jpeg overrides content negotiation."""
+        handler = handler_with_mock
+        handler.path = f"/screenshot?format={param}"
+        handler.headers = {"Accept": "image/webp"}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(200)
+        handler.send_header.assert_any_call("Content-Type", "image/jpeg")
+        assert handler.wfile.getvalue().startswith(b"\xff\xd8")
+
+    def test_screenshot_unknown_format_rejected(self, handler_with_mock):
+        """An unsupported ?format= is a 400, not a silent PNG."""
+        handler = handler_with_mock
+        handler.path = "/screenshot?format=gif"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(400)
+
     def test_screenshot_no_frame_available(self, handler_with_mock, mock_clock):
         """Test /screenshot when no frame is available."""
         handler = handler_with_mock
@@ -222,6 +498,25 @@ class TestScreenshotHandler:
         handler.send_response.assert_called_with(200)
         assert b"clock (1/9)" in handler.wfile.getvalue()
 
+    def test_view_endpoint_json(self, handler_with_mock, mock_clock):
+        """/view answers in JSON when the client asks for it."""
+        handler = handler_with_mock
+        handler.path = "/view"
+        handler.headers = {"Accept": "application/json"}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(200)
+        handler.send_header.assert_any_call("Content-Type", "application/json")
+        assert json.loads(handler.wfile.getvalue()) == {
+            "view": "clock",
+            "index": 0,
+            "count": 9,
+        }
+
     def test_not_found_endpoint(self, handler_with_mock):
         """Test unknown endpoint returns 404."""
         handler = handler_with_mock
@@ -237,11 +532,55 @@ class TestScreenshotHandler:
         handler.send_response.assert_called_with(404)
         assert b"Not Found" in handler.wfile.getvalue()
 
+    def test_theme_endpoint(self, handler_with_mock, mock_clock):
+        """GET /theme reports theme status as JSON without changing it."""
+        handler = handler_with_mock
+        handler.path = "/theme"
+        mock_clock.theme_manager.get_status.return_value = {"mode": "auto"}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(200)
+        assert handler.wfile.getvalue().replace(b" ", b"") == b'{"mode":"auto"}'
+        mock_clock.theme_manager.set_mode.assert_not_called()
+
+    @pytest.mark.parametrize("mode", ["auto", "day", "night"])
+    def test_theme_mode_endpoints(self, handler_with_mock, mock_clock, mode):
+        """GET /theme/<mode> switches the theme mode (path is case-insensitive)."""
+        handler = handler_with_mock
+        handler.path = f"/Theme/{mode.upper()}"
+        mock_clock.theme_manager.get_status.return_value = {"mode": mode}
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        mock_clock.theme_manager.set_mode.assert_called_once_with(mode)
+        handler.send_response.assert_called_with(200)
+
+    @pytest.mark.parametrize("path", ["/theme/dusk", "/theme/", "/health/x"])
+    def test_unknown_subpaths_not_found(self, handler_with_mock, mock_clock, path):
+        """Only exact routes match; unknown theme modes are a 404."""
+        handler = handler_with_mock
+        handler.path = path
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler.do_GET()
+
+        handler.send_response.assert_called_with(404)
+        mock_clock.theme_manager.set_mode.assert_not_called()
+
     def test_rate_limiting(self, handler_with_mock):
         """Test that rate limiting blocks excessive requests."""
         handler = handler_with_mock
         handler.path = "/health"
-        ScreenshotHandler.rate_limiter = RateLimiter(rate_per_second=1)
+        ScreenshotHandler.rate_limiter = ClientRateLimiter(rate_per_second=1)
 
         # Mock send methods
         handler.send_response = Mock()
@@ -261,6 +600,11 @@ class TestScreenshotHandler:
         assert handler.send_response.call_args[0][0] == 429
         assert b"Too Many Requests" in handler.wfile.getvalue()
 
+        # Another client has its own bucket
+        handler.client_address = ("127.0.0.2", 12345)
+        handler.do_GET()
+        assert handler.send_response.call_args[0][0] == 200
+
     def test_basic_auth_success(self, handler_with_mock):
         """Test successful basic authentication."""
         handler = handler_with_mock
@@ -344,6 +688,38 @@ class TestScreenshotHandler:
 
         handler.send_response.assert_called_with(401)
 
+    def test_basic_auth_result_follows_credentials(self, handler_with_mock):
+        """A cached header check is not reused once the credentials change."""
+        handler = handler_with_mock
+        handler.path = "/health"
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+        token = base64.b64encode(b"testuser:testpass").decode()
+        handler.headers = {"Authorization": f"Basic {token}"}
+
+        ScreenshotHandler.auth_credentials = ("testuser", "testpass")
+        handler.do_GET()
+        assert handler.send_response.call_args[0][0] == 200
+
+        ScreenshotHandler.auth_credentials = ("testuser", "changed")
+        handler.do_GET()
+        assert handler.send_response.call_args[0][0] == 401
+
+    def test_basic_auth_uses_constant_time_compare(self, handler_with_mock):
+        """Credentials are compared with hmac.compare_digest."""
+        handler = handler_with_mock
+        token = base64.b64encode(b"timing:check").decode()
+        handler.headers = {"Authorization": f"Basic {token}"}
+        ScreenshotHandler.auth_credentials = ("timing", "other")
+
+        with patch(
+            "solar_clock.http_server.hmac.compare_digest", wraps=hmac.compare_digest
+        ) as compare:
+            assert handler._check_auth() is False
+
+        assert compare.call_count == 2
+
     def test_no_auth_when_not_configured(self, handler_with_mock):
         """Test that requests are allowed when auth is not configured."""
         handler = handler_with_mock
@@ -394,6 +770,60 @@ class TestServerCreation:
         assert ScreenshotHandler.clock_instance == clock
         assert ScreenshotHandler.rate_limiter is not None
 
+    def test_create_server_handles_requests_concurrently(self, mock_config):
+        """The server runs each request on its own thread."""
+        server = create_server(mock_config, MagicMock())
+        try:
+            assert isinstance(server, ThreadingHTTPServer)
+            assert server.daemon_threads
+            assert server.allow_reuse_address
+            assert server.request_queue_size == 128
+        finally:
+            server.server_close()
+
+    def test_connections_disable_nagle(self, mock_config):
+        """Accepted connections set TCP_NODELAY, a large send buffer and buffer writes."""
+        server = create_server(mock_config, MagicMock())
+        thread = start_server_thread(server)
+        try:
+            with patch.object(socket.socket, "setsockopt") as mock_setsockopt:
+                with socket.create_connection(server.server_address, timeout=5) as conn:
+                    conn.sendall(b"GET /missing HTTP/1.0\r\n\r\n")
+                    response = b""
+                    while chunk := conn.recv(4096):
+                        response += chunk
+        finally:
+            server.shutdown()
+            thread.join(timeout=1)
+
+        assert response.split(b"\r\n", 1)[0].endswith(b" 404 Not Found")
+        mock_setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        mock_setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024)
+        assert ScreenshotHandler.wbufsize > 0
+
+    def test_connections_kept_alive(self, mock_config):
+        """Several requests are served over one HTTP/1.1 connection."""
+        server = create_server(mock_config, MagicMock())
+        thread = start_server_thread(server)
+        try:
+            host, port = server.server_address[:2]
+            conn = http.client.HTTPConnection(host, port, timeout=5)
+            responses = []
+            sockets = set()
+            for path in ("/health", "/missing", "/health"):
+                conn.request("GET", path)
+                response = conn.getresponse()
+                responses.append((response.status, response.read()))
+                sockets.add(conn.sock)
+            conn.close()
+        finally:
+            server.shutdown()
+            thread.join(timeout=1)
+
+        assert responses == [(200, b"OK"), (404, b"Not Found"), (200, b"OK")]
+        # http.client drops its socket when the server closes the connection
+        assert len(sockets) == 1 and None not in sockets
+
     @patch.dict(os.environ, {"HTTP_AUTH_USER": "admin", "HTTP_AUTH_PASS": "secret"})
     def test_create_server_with_auth(self, mock_config):
         """Test server creation with auth credentials from environment."""
@@ -1,6 +1,10 @@
 """Tests for lunar data provider and moon calculations."""
 
+import dataclasses
 import datetime
+import json
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -11,6 +15,8 @@ from solar_clock.data.lunar import (
     MoonTimes,
     SolsticeEquinox,
     AnalemmaPoint,
+    _ephem_to_date,
+    _jd_to_date,
 )
 
 
@@ -101,18 +107,33 @@ class TestLunarProvider:
         assert dates.fall_equinox < dates.winter_solstice
 
     def test_get_solstice_equinox_without_ephem(self):
-        """Test solstice/equinox returns fallback dates when ephem unavailable."""
+        """Test solstice/equinox uses the closed form when ephem unavailable."""
         with patch("solar_clock.data.lunar.EPHEM_AVAILABLE", False):
             provider = LunarProvider(40.7128, -74.0060)
-            dates = provider.get_solstice_equinox(2024)
+            dates = provider.get_solstice_equinox(2024, exact=True)
 
-            # Should return approximate dates
+            # UTC dates of the 2024 events
             assert isinstance(dates, SolsticeEquinox)
             assert dates.spring_equinox == datetime.date(2024, 3, 20)
-            assert dates.summer_solstice == datetime.date(2024, 6, 21)
+            assert dates.summer_solstice == datetime.date(2024, 6, 20)
             assert dates.fall_equinox == datetime.date(2024, 9, 22)
             assert dates.winter_solstice == datetime.date(2024, 12, 21)
 
+    def test_solstice_equinox_closed_form_matches_ephem(self, provider):
+        """The closed form agrees with ephem's search on every date."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        for year in range(2000, 2051):
+            assert provider.get_solstice_equinox(year) == (
+                provider.get_solstice_equinox(year, exact=True)
+            ), year
+
+    def test_solstice_equinox_cached_per_year(self, provider):
+        """Repeated lookups for a year return the memoized result."""
+        first = provider.get_solstice_equinox(2030)
+        assert provider.get_solstice_equinox(2030) is first
+
     @pytest.mark.skipif(
         not pytest.importorskip("ephem", reason="ephem not installed"), reason=""
     )
@@ -146,6 +167,17 @@ class TestLunarProvider:
         # They should have different values (equation of time changes)
         assert abs(feb_eot - nov_eot) > 5
 
+    def test_equation_of_time_closed_form_tracks_ephem(self, provider):
+        """The default closed form stays within a minute of the ephem solve."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        for month in range(1, 13):
+            date = datetime.date(2024, month, 15)
+            fast = provider.get_equation_of_time(date)
+            exact = provider.get_equation_of_time(date, accurate=True)
+            assert fast == pytest.approx(exact, abs=1.0)
+
     @pytest.mark.skipif(
         not pytest.importorskip("ephem", reason="ephem not installed"), reason=""
     )
@@ -169,6 +201,55 @@ class TestLunarProvider:
             # Equation of time should be in expected range
             assert -20 <= point.equation_of_time <= 20
 
+    def test_get_analemma_series(self, provider):
+        """The series holds the same samples as the point list, as arrays."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        series = provider.get_analemma_series()
+        points = provider.get_analemma_data()
+
+        assert len(series) == len(points)
+        assert series.elevations.tolist() == [p.elevation for p in points]
+        assert series.equations_of_time.tolist() == [p.equation_of_time for p in points]
+        assert series.dates == tuple(p.date for p in points)
+        # Cached and shared, so the arrays must not be writable
+        assert provider.get_analemma_series() is series
+        with pytest.raises(ValueError):
+            series.elevations[0] = 0.0
+
+    def test_analemma_persisted_across_providers(self, tmp_path):
+        """A second provider loads the year's analemma from disk, not ephem."""
+        first = LunarProvider(40.7128, -74.0060, cache_dir=tmp_path)
+        if not first.available:
+            pytest.skip("ephem not available")
+        series = first.get_analemma_series()
+        assert len(list(tmp_path.glob("analemma_*.json"))) == 1
+
+        second = LunarProvider(40.7128, -74.0060, cache_dir=tmp_path)
+        with patch(
+            "solar_clock.data.lunar._ephem", side_effect=AssertionError("solved")
+        ):
+            loaded = second.get_analemma_series()
+
+        assert loaded.dates == series.dates
+        assert loaded.elevations.tolist() == series.elevations.tolist()
+        assert loaded.equations_of_time.tolist() == series.equations_of_time.tolist()
+
+    def test_corrupt_analemma_cache_is_recomputed(self, tmp_path):
+        """An unreadable cache file is ignored and rewritten."""
+        provider = LunarProvider(40.7128, -74.0060, cache_dir=tmp_path)
+        if not provider.available:
+            pytest.skip("ephem not available")
+        year = datetime.date.today().year
+        path = tmp_path / f"analemma_{year}_40.7128_-74.0060.json"
+        path.write_text("{not json")
+
+        series = provider.get_analemma_series()
+
+        assert series is not None and len(series) > 50
+        assert len(json.loads(path.read_text())["elevations"]) == len(series)
+
     def test_get_analemma_data_without_ephem(self):
         """Test analemma data returns empty list when ephem unavailable."""
         with patch("solar_clock.data.lunar.EPHEM_AVAILABLE", False):
@@ -214,6 +295,72 @@ class TestLunarProvider:
         assert provider._analemma_cache is not None
         assert provider._analemma_cache[0] == datetime.date.today().year
 
+    def test_analemma_one_transit_per_point(self, provider):
+        """Analemma EoT is derived from the elevation transit, not a second solve."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        with patch.object(provider, "get_equation_of_time") as mock_eot:
+            points = provider.get_analemma_data()
+
+        mock_eot.assert_not_called()
+        # Matches the standalone calculation within the drift between transits
+        for point in points[::8]:
+            expected = provider.get_equation_of_time(point.date, accurate=True)
+            assert point.equation_of_time == pytest.approx(expected, abs=0.5)
+
+    def test_moon_phase_reuses_lunation_searches(self, provider):
+        """New/full moon searches run once per lunation, not per call."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+        import ephem
+
+        with patch.object(
+            ephem, "next_new_moon", wraps=ephem.next_new_moon
+        ) as next_new, patch.object(
+            ephem, "previous_new_moon", wraps=ephem.previous_new_moon
+        ) as prev_new:
+            first = provider.get_moon_phase()
+            second = provider.get_moon_phase()
+
+        assert first is not None and second is not None
+        assert next_new.call_count == 1
+        assert prev_new.call_count == 1
+        assert second.next_new == first.next_new
+        assert second.next_full == first.next_full
+
+    def test_lunation_bounds_refreshed_after_passing(self, provider):
+        """Once the cached next new/full moon is past, the searches rerun."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+        import ephem
+
+        now = ephem.Date("2024/6/1")
+        prev_new, next_new, next_full = provider._lunation_bounds(now)
+        assert prev_new <= now < min(next_new, next_full)
+
+        later = ephem.Date(min(next_new, next_full) + 1)
+        bounds = provider._lunation_bounds(later)
+        assert bounds[0] <= later < min(bounds[1], bounds[2])
+        assert bounds != (prev_new, next_new, next_full)
+
+    def test_moon_times_cached_per_date(self, provider):
+        """A date's rise/set search runs once; old dates are evicted."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        today = datetime.datetime.now(provider.tz).date()
+        with patch.object(
+            provider, "_compute_moon_times", wraps=provider._compute_moon_times
+        ) as compute:
+            first = provider.get_moon_times()
+            assert provider.get_moon_times(today) is first
+            provider.get_moon_times(today - datetime.timedelta(days=5))
+
+        assert compute.call_count == 2
+        provider.get_moon_times(today + datetime.timedelta(days=1))
+        assert today - datetime.timedelta(days=5) not in provider._moon_times_cache
+
     def test_moon_times_reuses_observer(self, provider):
         """get_moon_times() must not create a new ephem.Observer on each call."""
         if not provider.available:
@@ -225,6 +372,63 @@ class TestLunarProvider:
         t2 = provider.get_moon_times()
         assert t1 is not None or t2 is not None  # at least one should work
 
+    @pytest.mark.parametrize("longitude", [-150.0, 0.0, 150.0])
+    def test_analemma_transits_fall_on_sample_dates(self, longitude):
+        """Warm-started transit searches land on each point's own date."""
+        ephem = pytest.importorskip("ephem")
+
+        provider = LunarProvider(35.0, longitude, "UTC")
+        points = provider.get_analemma_data()
+
+        observer = ephem.Observer()
+        observer.lat = "35"
+        observer.lon = str(longitude)
+        observer.pressure = 0
+        sun = ephem.Sun()
+        for point in points[::9]:
+            # Independent cold search from local mean midnight of the date
+            observer.date = ephem.Date(point.date) - longitude / 360
+            observer.date = observer.next_transit(sun)
+            sun.compute(observer)
+            assert point.elevation == pytest.approx(
+                float(sun.alt) * 180 / ephem.pi, abs=1e-6
+            )
+
+    def test_queries_do_not_construct_observers_or_bodies(self, provider):
+        """Observers and bodies are built once and reused across queries."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+
+        provider.get_moon_times()
+        provider.get_equation_of_time(accurate=True)
+        provider.get_analemma_data()
+        provider._analemma_cache = None
+        with patch("solar_clock.data.lunar.ephem.Observer") as mock_observer, patch(
+            "solar_clock.data.lunar.ephem.Moon"
+        ) as mock_moon, patch("solar_clock.data.lunar.ephem.Sun") as mock_sun:
+            provider.get_moon_phase()
+            provider.get_moon_times()
+            provider.get_equation_of_time(accurate=True)
+            assert len(provider.get_analemma_data()) > 0
+
+        mock_observer.assert_not_called()
+        mock_moon.assert_not_called()
+        mock_sun.assert_not_called()
+
+    def test_ephem_not_imported_until_first_query(self):
+        """Importing the module or building a provider doesn't load ephem."""
+        pytest.importorskip("ephem")
+        code = (
+            "import sys\n"
+            "from solar_clock.data.lunar import LunarProvider\n"
+            "provider = LunarProvider(40.7, -74.0)\n"
+            "provider.get_solstice_equinox(2024)\n"
+            "assert 'ephem' not in sys.modules, 'loaded early'\n"
+            "assert provider.get_moon_times() is not None\n"
+            "assert 'ephem' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_moon_times_are_local_timezone_aware(self):
         """Moon times must be timezone-aware in the configured local timezone.
 
@@ -270,6 +474,15 @@ class TestLunarProvider:
         if times.moonset is not None:
             assert times.moonset >= local_midnight
 
+    def test_observer_coordinates_in_radians(self, provider):
+        """Observer lat/lon are assigned as radians and match the config."""
+        if not provider.available:
+            pytest.skip("ephem not available")
+        import math
+
+        assert math.degrees(provider._observer.lat) == pytest.approx(40.7128)
+        assert math.degrees(provider._observer.lon) == pytest.approx(-74.0060)
+
     def test_eot_observer_created_once(self, provider):
         """get_equation_of_time() must reuse _eot_observer."""
         if not provider.available:
@@ -282,6 +495,23 @@ class TestLunarProvider:
         assert str(provider._eot_observer.lon) == "0:00:00.0"
 
 
+class TestJulianDayConversion:
+    """Tests for the Julian day date helpers."""
+
+    def test_jd_to_date(self):
+        """Julian days roll over to the next date at midnight UTC."""
+        assert _jd_to_date(2451544.5) == datetime.date(2000, 1, 1)
+        assert _jd_to_date(2451545.49) == datetime.date(2000, 1, 1)
+        assert _jd_to_date(2451545.5) == datetime.date(2000, 1, 2)
+
+    def test_ephem_to_date_matches_ephem(self):
+        """Dublin Julian days convert like ephem.Date(...).datetime().date()."""
+        ephem = pytest.importorskip("ephem")
+        for value in (0.0, 0.4999, 0.5, 45000.25, 45000.75, -1000.6):
+            d = ephem.Date(value)
+            assert _ephem_to_date(d) == d.datetime().date(), value
+
+
 class TestPhaseNameMapping:
     """Tests for moon phase name mapping."""
 
@@ -303,6 +533,10 @@ class TestPhaseNameMapping:
             (0.80, "Waning Crescent"),
             (0.90, "Waning Crescent"),
             (0.98, "New Moon"),
+            # Each threshold belongs to the following phase
+            (0.03, "Waxing Crescent"),
+            (0.47, "Full Moon"),
+            (0.97, "New Moon"),
         ],
     )
     def test_get_phase_name(self, phase, expected_name):
@@ -352,6 +586,16 @@ class TestMoonPhaseDataclass:
         assert phase.days_to_new == 15
         assert phase.days_to_full == 7
 
+    def test_moon_phase_is_frozen_and_slotted(self):
+        """MoonPhase instances are immutable and carry no __dict__."""
+        today = datetime.date.today()
+        phase = MoonPhase(0.5, 100.0, "Full Moon", today, today, 14, 0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            phase.phase = 0.1  # type: ignore[misc]
+        if sys.version_info >= (3, 10):
+            assert not hasattr(phase, "__dict__")
+
 
 class TestMoonTimesDataclass:
     """Tests for MoonTimes dataclass."""
@@ -1,13 +1,27 @@
 """Tests for main application lifecycle and SolarClock class."""
 
+import contextlib
 import signal
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from PIL import Image
 
+from solar_clock.config import Config
 from solar_clock.main import SolarClock, main
+from solar_clock.views.base import ViewManager
+
+
+def _rendering(render):
+    """Stand-in for ViewManager.rendered() that yields render()'s frame."""
+
+    @contextlib.contextmanager
+    def rendered():
+        yield render()
+
+    return rendered
 
 
 class TestSolarClock:
@@ -133,12 +147,22 @@ class TestSolarClock:
     def test_get_last_frame(self, solar_clock):
         """Test get_last_frame returns cached frame."""
         test_frame = Image.new("RGB", (480, 320))
-        solar_clock._last_frame = test_frame
+        solar_clock._last_frame = (solar_clock.view_manager.generation, test_frame)
 
         result = solar_clock.get_last_frame()
 
         assert result is test_frame
 
+    def test_get_last_frame_after_view_change(self, solar_clock):
+        """A frame rendered before a view change is not handed out."""
+        test_frame = Image.new("RGB", (480, 320))
+        solar_clock.view_manager.generation = 4
+        solar_clock._last_frame = (4, test_frame)
+
+        solar_clock.view_manager.generation = 5
+
+        assert solar_clock.get_last_frame() is None
+
     def test_get_last_frame_when_none(self, solar_clock):
         """Test get_last_frame returns None when no frame cached."""
         solar_clock._last_frame = None
@@ -156,22 +180,53 @@ class TestSolarClock:
         assert solar_clock.running is False
 
     def test_signal_handler_wakes_main_loop(self):
-        """Signal handler must set view_changed to interrupt the sleep."""
-        import threading
+        """Signal handler must notify a view change to interrupt the sleep."""
         from solar_clock.main import SolarClock
-        from unittest.mock import MagicMock
+        from solar_clock.views.base import ViewManager
 
         clock = SolarClock.__new__(SolarClock)
         clock.running = True
-        clock.view_manager = MagicMock()
-        clock.view_manager.view_changed = threading.Event()
+        clock.view_manager = ViewManager([MagicMock()])
+        generation = clock.view_manager.generation
 
         clock._signal_handler(2, None)
 
         assert not clock.running
-        assert (
-            clock.view_manager.view_changed.is_set()
-        ), "view_changed must be set so wait() returns immediately"
+        assert clock.view_manager.wait_for_change(
+            generation, timeout=0
+        ), "a change must be pending so wait_for_change() returns immediately"
+
+    def test_settle_navigation_returns_once_quiet(self, solar_clock):
+        """With no further view changes, settling takes about NAV_SETTLE."""
+        solar_clock.running = True
+        solar_clock.view_manager = ViewManager([MagicMock()])
+        solar_clock.view_manager.next_view()
+
+        start = time.monotonic()
+        solar_clock._settle_navigation()
+
+        assert time.monotonic() - start < SolarClock.NAV_SETTLE_MAX
+
+    def test_settle_navigation_bounded_under_constant_changes(self, solar_clock):
+        """A never-ending burst of view changes still renders by NAV_SETTLE_MAX."""
+        solar_clock.running = True
+        solar_clock.view_manager = MagicMock()
+        solar_clock.view_manager.wait_for_change.return_value = True
+
+        start = time.monotonic()
+        solar_clock._settle_navigation()
+
+        elapsed = time.monotonic() - start
+        assert SolarClock.NAV_SETTLE_MAX <= elapsed < SolarClock.NAV_SETTLE_MAX + 0.5
+
+    def test_settle_navigation_stops_on_shutdown(self, solar_clock):
+        """Settling ends as soon as the clock stops running."""
+        solar_clock.running = False
+        solar_clock.view_manager = MagicMock()
+
+        solar_clock._settle_navigation()
+
+        solar_clock.view_manager.wait_for_change.assert_not_called()
 
     def test_cleanup(self, solar_clock):
         """Test cleanup stops all components."""
@@ -237,7 +292,7 @@ class TestSolarClock:
             solar_clock.running = False
             return Image.new("RGB", (480, 320))
 
-        solar_clock.view_manager.render_current.side_effect = stop_running
+        solar_clock.view_manager.rendered = _rendering(stop_running)
 
         solar_clock.run()
 
@@ -261,7 +316,7 @@ class TestSolarClock:
             solar_clock.running = False
             return Image.new("RGB", (480, 320))
 
-        solar_clock.view_manager.render_current.side_effect = stop_running
+        solar_clock.view_manager.rendered = _rendering(stop_running)
 
         solar_clock.run()
 
@@ -284,7 +339,7 @@ class TestSolarClock:
             solar_clock.running = False
             return Image.new("RGB", (480, 320))
 
-        solar_clock.view_manager.render_current.side_effect = stop_running
+        solar_clock.view_manager.rendered = _rendering(stop_running)
 
         solar_clock.run()
 
@@ -306,7 +361,6 @@ class TestSolarClock:
         solar_clock.view_manager = MagicMock()
 
         test_frame = Image.new("RGB", (480, 320))
-        solar_clock.view_manager.render_current.return_value = test_frame
 
         # Run one iteration then stop
         iteration_count = [0]
@@ -317,15 +371,61 @@ class TestSolarClock:
                 solar_clock.running = False
             return test_frame
 
-        solar_clock.view_manager.render_current.side_effect = render_with_counter
+        solar_clock.view_manager.rendered = _rendering(render_with_counter)
         solar_clock.running = True
 
         solar_clock.run()
 
         # Verify render and write were called
-        assert solar_clock.view_manager.render_current.call_count >= 1
+        assert iteration_count[0] >= 1
         assert solar_clock.display.write_frame.call_count >= 1
-        assert solar_clock._last_frame is test_frame
+        # A private copy is published, tagged with the rendered generation
+        generation, published = solar_clock._last_frame
+        assert generation is solar_clock.view_manager.generation
+        assert published is not test_frame
+        assert published.tobytes() == test_frame.tobytes()
+
+    @patch("solar_clock.main.start_server_thread")
+    @patch("solar_clock.main.signal.signal")
+    def test_run_publishes_copy_only_when_frame_changes(
+        self, mock_signal, mock_start_thread, solar_clock
+    ):
+        """An unchanged frame reuses the published copy instead of copying."""
+        solar_clock.display = MagicMock()
+        solar_clock.display.open.return_value = True
+        solar_clock.touch_handler = MagicMock()
+        solar_clock.view_manager = MagicMock()
+        solar_clock.view_manager.generation = 0
+
+        test_frame = Image.new("RGB", (480, 320))
+        copies = []
+
+        def copy():
+            copies.append(Image.new("RGB", (480, 320)))
+            return copies[-1]
+
+        test_frame.copy = copy
+        renders = [0]
+
+        def render():
+            renders[0] += 1
+            # Unchanged pixels after the first frame; the view changes after
+            # the 2nd, so the 3rd is rendered for the new generation
+            solar_clock.display.frame_changed = renders[0] == 1
+            if renders[0] == 2:
+                solar_clock.view_manager.generation = 1
+            elif renders[0] == 3:
+                solar_clock.running = False
+            return test_frame
+
+        solar_clock.view_manager.rendered = _rendering(render)
+        solar_clock.running = True
+
+        solar_clock.run()
+
+        assert renders[0] == 3
+        assert len(copies) == 1
+        assert solar_clock._last_frame == (1, copies[0])
 
     @patch("solar_clock.main.start_server_thread")
     @patch("solar_clock.main.signal.signal")
@@ -337,7 +437,9 @@ class TestSolarClock:
         solar_clock.display.open.return_value = True
         solar_clock.touch_handler = MagicMock()
         solar_clock.view_manager = MagicMock()
-        solar_clock.view_manager.render_current.side_effect = RuntimeError("Test error")
+        solar_clock.view_manager.rendered = _rendering(
+            Mock(side_effect=RuntimeError("Test error"))
+        )
         solar_clock.running = True
 
         solar_clock.run()
@@ -424,14 +526,16 @@ class TestMainFunction:
     @patch("sys.argv", ["solar_clock", "--bind-all"])
     def test_main_with_bind_all(self, mock_get_key, mock_load_config, mock_solar_clock):
         """Test main with --bind-all flag."""
-        mock_config = MagicMock()
-        mock_config.http_server.bind_address = "127.0.0.1"
-        mock_load_config.return_value = mock_config
+        config = Config()
+        mock_load_config.return_value = config
 
         result = main()
 
         assert result == 0
-        assert mock_config.http_server.bind_address == "0.0.0.0"
+        run_config = mock_solar_clock.call_args[0][0]
+        assert run_config.http_server.bind_address == "0.0.0.0"
+        assert run_config.http_server.port == config.http_server.port
+        assert config.http_server.bind_address == "127.0.0.1"  # Loaded config untouched
 
     @patch("solar_clock.main.SolarClock")
     @patch("solar_clock.main.load_config")
@@ -451,18 +555,38 @@ class TestMainFunction:
         mock_solar_clock.assert_called_once()
 
 
-def test_view_changed_clear_before_wait_order():
-    """Verify the main loop clears view_changed before waiting (not after)."""
-    import inspect
-    from solar_clock.main import SolarClock
-
-    source = inspect.getsource(SolarClock.run)
-    # Find string positions in source
-    clear_pos = source.find("view_changed.clear()")
-    wait_pos = source.find("view_changed.wait(")
-    assert clear_pos != -1, "view_changed.clear() not found in run()"
-    assert wait_pos != -1, "view_changed.wait() not found in run()"
-    assert clear_pos < wait_pos, (
-        f"view_changed.clear() (pos {clear_pos}) must come before "
-        f"view_changed.wait() (pos {wait_pos}) in run()"
-    )
+def test_view_change_during_render_is_not_lost():
+    """A view change while a frame renders cuts the following sleep short."""
+    from solar_clock.views.base import ViewManager
+
+    clock = SolarClock.__new__(SolarClock)
+    clock.running = True
+    clock.display = MagicMock()
+    clock.view_manager = ViewManager([MagicMock(update_interval=60)])
+    clock.NAV_SETTLE = 0.01
+    clock._cleanup = MagicMock()
+    clock._last_frame = None
+    renders = []
+
+    def render():
+        renders.append(time.monotonic())
+        if len(renders) == 1:
+            # Navigation lands mid-render, before the loop starts waiting
+            clock.view_manager.next_view()
+        else:
+            clock._signal_handler(signal.SIGTERM, None)
+        return MagicMock()
+
+    clock.view_manager.rendered = _rendering(render)
+    with (
+        patch.object(clock.display, "open", return_value=True),
+        patch("solar_clock.main.signal.signal"),
+    ):
+        clock.http_server = None
+        clock.providers = MagicMock(weather=None)
+        clock.touch_handler = MagicMock()
+        clock.config = MagicMock()
+        clock.run()
+
+    assert len(renders) == 2
+    assert renders[1] - renders[0] < 5
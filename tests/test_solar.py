@@ -1,9 +1,26 @@
 """Tests for solar data provider."""
 
+import dataclasses
 import datetime
+import sys
+
 import pytest
 
-from solar_clock.data.solar import SolarProvider, SunTimes, SolarPosition, GoldenHour
+from solar_clock.data.solar import (
+    SolarProvider,
+    SunTimes,
+    SolarPosition,
+    GoldenHour,
+    _compute_sun_times,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_sun_times_cache():
+    """Isolate tests from the module-level sun times memo."""
+    _compute_sun_times.cache_clear()
+    yield
+    _compute_sun_times.cache_clear()
 
 
 class TestSolarProvider:
@@ -66,6 +83,17 @@ class TestSolarProvider:
         assert morning_pos is not None
         assert noon_pos.elevation > morning_pos.elevation
 
+    def test_solar_position_matches_astral_single_solve(self, provider):
+        """Elevation and azimuth from one solve match astral's separate calls."""
+        from astral.sun import azimuth, elevation
+
+        observer = provider.location.observer
+        for hour in range(0, 24, 3):
+            dt = datetime.datetime(2026, 3, 1, hour, tzinfo=datetime.timezone.utc)
+            pos = provider.get_solar_position(dt)
+            assert pos.elevation == pytest.approx(elevation(observer, dt))
+            assert pos.azimuth == pytest.approx(azimuth(observer, dt))
+
     def test_get_golden_hour(self, provider):
         """Test golden hour calculation."""
         morning, evening = provider.get_golden_hour()
@@ -115,6 +143,36 @@ class TestSolarProvider:
         assert name in ["Dawn", "Sunrise", "Solar Noon", "Sunset", "Dusk"]
         assert time > datetime.datetime.now(time.tzinfo)
 
+    def test_get_next_solar_event_from_given_now(self, provider):
+        """An explicit now picks the event after it, in the provider's timezone."""
+        from zoneinfo import ZoneInfo
+
+        # 10:00 New York on an ordinary June day, given in UTC
+        now = datetime.datetime(2026, 6, 1, 14, 0, tzinfo=ZoneInfo("UTC"))
+        name, time = provider.get_next_solar_event(now)
+
+        assert name == "Solar Noon"
+        assert time.date() == datetime.date(2026, 6, 1)
+        assert time > now
+
+        # An event exactly at now has already happened
+        times = provider.get_sun_times(datetime.date(2026, 6, 1))
+        assert provider.get_next_solar_event(times.sunrise) == (
+            "Solar Noon",
+            times.noon,
+        )
+
+        # Just after dusk rolls over to tomorrow's dawn
+        late = times.dusk + datetime.timedelta(minutes=1)
+        name, time = provider.get_next_solar_event(late)
+        assert name == "Dawn"
+        assert time.date() == datetime.date(2026, 6, 2)
+
+    def test_get_day_length_change_for_date(self, provider):
+        """Days lengthen in spring and shorten in autumn."""
+        assert provider.get_day_length_change(datetime.date(2026, 4, 1)) > 0
+        assert provider.get_day_length_change(datetime.date(2026, 10, 1)) < 0
+
     def test_get_twilight_times(self, provider):
         """Test twilight times calculation."""
         twilight = provider.get_twilight_times()
@@ -155,6 +213,83 @@ class TestSolarProvider:
         assert result1 is not None
         assert result1.sunrise.hour == 6
 
+    def test_sun_times_shared_across_providers(self, provider):
+        """Providers at the same location share the memoized computation."""
+        from unittest.mock import patch
+
+        other = SolarProvider(
+            name="Other",
+            region="Elsewhere",
+            timezone="America/New_York",
+            latitude=40.7128,
+            longitude=-74.0060,
+        )
+        date = datetime.date(2026, 6, 1)
+        expected = provider.get_sun_times(date)
+
+        with patch("solar_clock.data.solar.sun") as mock_sun:
+            assert other.get_sun_times(date) == expected
+
+        mock_sun.assert_not_called()
+
+    def test_get_day_length_cached_per_date(self, provider):
+        """get_day_length() should derive each date's length only once."""
+        from unittest.mock import patch
+
+        date = datetime.date(2026, 3, 20)
+        with patch.object(
+            provider, "_day_length_only", wraps=provider._day_length_only
+        ) as mock_length:
+            first = provider.get_day_length(date)
+            second = provider.get_day_length(date)
+
+        assert first == second
+        assert mock_length.call_count == 1
+
+    def test_day_length_skips_twilight_solves(self, provider):
+        """Day length needs only sunrise and sunset, not the full sun() solve."""
+        from unittest.mock import patch
+
+        date = datetime.date(2026, 9, 1)
+        times = provider.get_sun_times(date)
+        provider._day_length_cache.clear()
+
+        with patch("solar_clock.data.solar.sun") as mock_sun:
+            length = provider.get_day_length(date)
+
+        mock_sun.assert_not_called()
+        expected = (times.sunset - times.sunrise).total_seconds() / 3600
+        assert length == pytest.approx(expected)
+
+    def test_get_day_length_default_tracks_today(self, provider):
+        """The date=None branch resolves to the current date on every call."""
+        from unittest.mock import patch
+
+        class FakeDate(datetime.date):
+            current = datetime.date(2026, 3, 20)
+
+            @classmethod
+            def today(cls):
+                return cls.current
+
+        with patch("solar_clock.data.solar.datetime.date", FakeDate):
+            march = provider.get_day_length()
+            FakeDate.current = datetime.date(2026, 6, 21)
+            june = provider.get_day_length()
+
+        assert march is not None and june is not None
+        assert june > march
+
+    def test_results_are_frozen_and_slotted(self, provider):
+        """Sun times are immutable and carry no __dict__."""
+        times = provider.get_sun_times(datetime.date(2026, 6, 1))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            times.sunrise = times.sunset  # type: ignore[misc]
+        if sys.version_info >= (3, 10):
+            assert not hasattr(times, "__dict__")
+        assert hash(times) == hash(provider.get_sun_times(datetime.date(2026, 6, 1)))
+
 
 class TestSolarPositionCalculations:
     """Tests for specific solar calculations."""
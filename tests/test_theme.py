@@ -2,7 +2,7 @@
 
 import pytest
 
-from solar_clock.views.theme import DAY_THEME, NIGHT_THEME
+from solar_clock.views.theme import DAY_THEME, NIGHT_THEME, ThemeManager
 
 
 def _relative_luminance(rgb: tuple[int, int, int]) -> float:
@@ -72,3 +72,26 @@ class TestThemeAccents:
                 f"{theme.name} theme {field} {color} has contrast {ratio:.2f} "
                 f"on {bg_name} {bg} (needs >= 3.0)"
             )
+
+
+class TestThemeManagerCache:
+    """Tests for ThemeManager's cached theme."""
+
+    def test_cached_theme_for_old_mode_is_ignored(self):
+        """A theme cached under another mode (e.g. by a racing reader) is not served."""
+        manager = ThemeManager()
+        manager.set_mode("day")
+        assert manager.get_current_theme() is DAY_THEME
+
+        # Mode changes while a theme computed for the old mode is still cached,
+        # as when a render races an HTTP set_mode
+        manager._mode = "night"
+        assert manager.get_current_theme() is NIGHT_THEME
+
+    def test_set_mode_switches_theme_immediately(self):
+        """Changing mode takes effect without waiting for the cache to expire."""
+        manager = ThemeManager()
+        manager.set_mode("night")
+        assert manager.get_current_theme() is NIGHT_THEME
+        manager.set_mode("day")
+        assert manager.get_current_theme() is DAY_THEME
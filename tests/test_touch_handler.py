@@ -1,5 +1,8 @@
 """Tests for touch input handling."""
 
+import os
+import struct
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -98,6 +101,82 @@ class TestTouchHandler:
         assert touch_handler._device is None
         assert touch_handler._thread is None
 
+    def test_run_polls_until_stopped(self, touch_handler):
+        """The input loop drains readable events and exits once stopped."""
+        read_fd, write_fd = os.pipe()
+        device = MagicMock(fd=read_fd)
+        events = [Mock(), Mock()]
+
+        def read():
+            os.read(read_fd, 1)
+            touch_handler._running = False
+            return iter(events)
+
+        device.read.side_effect = read
+        touch_handler._device = device
+        touch_handler._running = True
+        touch_handler.poll_timeout = 0.01
+        os.write(write_fd, b"x")
+
+        try:
+            with patch.object(touch_handler, "_process_events") as process:
+                touch_handler._run()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert [list(c.args[0]) for c in process.call_args_list] == [events]
+
+    def test_run_exits_when_idle_and_stopped(self, touch_handler):
+        """With no input, the loop still returns promptly after stop."""
+        read_fd, write_fd = os.pipe()
+        touch_handler._device = MagicMock(fd=read_fd)
+        touch_handler._running = True
+        touch_handler.poll_timeout = 0.01
+
+        thread = threading.Thread(target=touch_handler._run)
+        thread.start()
+        touch_handler._running = False
+        thread.join(timeout=1.0)
+        os.close(read_fd)
+        os.close(write_fd)
+
+        assert not thread.is_alive()
+        touch_handler._device.read.assert_not_called()
+
+    def test_claim_device_grabs_and_masks_events(self, touch_handler):
+        """The device is grabbed and given per-type kernel event masks."""
+        device = MagicMock(fd=7)
+        fake_ecodes = MagicMock(
+            EV_ABS=3, ABS_CNT=64, ABS_X=0, ABS_Y=1,
+            EV_KEY=1, KEY_CNT=768, BTN_TOUCH=330,
+            EV_MSC=4, MSC_CNT=8,
+        )  # fmt: skip
+        with (
+            patch("solar_clock.touch_handler.ecodes", fake_ecodes, create=True),
+            patch("solar_clock.touch_handler.fcntl.ioctl") as ioctl,
+        ):
+            TouchHandler._claim_device(device)
+
+        device.grab.assert_called_once()
+        requests = [struct.unpack("IIQ", c.args[2])[:2] for c in ioctl.call_args_list]
+        assert requests == [(3, 8), (1, 96), (4, 1)]
+
+    def test_claim_device_tolerates_unsupported_mask(self, touch_handler):
+        """Kernels without EVIOCSMASK still get a working device."""
+        device = MagicMock(fd=7)
+        device.grab.side_effect = OSError("busy")
+        fake_ecodes = MagicMock(ABS_CNT=64, KEY_CNT=768, MSC_CNT=8, BTN_TOUCH=330)
+        with (
+            patch("solar_clock.touch_handler.ecodes", fake_ecodes, create=True),
+            patch(
+                "solar_clock.touch_handler.fcntl.ioctl", side_effect=OSError("EINVAL")
+            ) as ioctl,
+        ):
+            TouchHandler._claim_device(device)
+
+        ioctl.assert_called_once()
+
     def test_stop_when_not_started(self, touch_handler):
         """Test stop when handler was never started."""
         # Should not raise exception
@@ -133,6 +212,55 @@ class TestTouchHandler:
         y = touch_handler._transform_y(2048)
         assert 169 <= y <= 171  # ~170
 
+    def test_process_event_matches_calibration_formula(self, touch_handler):
+        """The multiply-add transform equals the normalized formula."""
+        codes = {"_EV_ABS": 3, "_EV_KEY": 1, "_ABS_X": 0, "_ABS_Y": 1}
+        with patch.multiple("solar_clock.touch_handler", create=True, **codes):
+            for raw in range(0, 4096, 7):
+                normalized = (raw - 400) / (3500 - 400)
+                expected_y = max(0, min(319, int(normalized * 320)))
+                expected_x = max(0, min(479, int((1.0 - normalized) * 480)))
+
+                touch_handler._process_event(Mock(type=3, code=0, value=raw))
+                touch_handler._process_event(Mock(type=3, code=1, value=raw))
+
+                assert abs(touch_handler.current_y - expected_y) <= 1
+                assert abs(touch_handler.current_x - expected_x) <= 1
+                assert touch_handler._transform_y(raw) == touch_handler.current_y
+                assert touch_handler._transform_x(raw) == touch_handler.current_x
+
+    def test_process_events_coalesces_motion_per_frame(self, touch_handler):
+        """Only the last position in each SYN_REPORT frame is transformed."""
+        codes = {
+            "_EV_SYN": 0,
+            "_EV_ABS": 3,
+            "_EV_KEY": 1,
+            "_SYN_REPORT": 0,
+            "_ABS_X": 0,
+            "_ABS_Y": 1,
+            "_BTN_TOUCH": 330,
+        }
+        down = [
+            Mock(type=1, code=330, value=1),
+            Mock(type=3, code=0, value=2048),
+            Mock(type=3, code=1, value=2048),
+            Mock(type=0, code=0, value=0),
+        ]
+        drag = [Mock(type=3, code=1, value=v) for v in range(1000, 3000, 100)]
+        drag.append(Mock(type=0, code=0, value=0))
+
+        with patch.multiple("solar_clock.touch_handler", create=True, **codes):
+            with patch.object(
+                touch_handler, "_transform_x", wraps=touch_handler._transform_x
+            ) as transform_x:
+                touch_handler._process_events(down + drag)
+
+        # Touch-down records the position reported in its own frame
+        assert touch_handler.touch_start_x == touch_handler._transform_x(2048)
+        assert touch_handler.touch_start_y == touch_handler._transform_y(2048)
+        assert touch_handler.current_x == touch_handler._transform_x(2900)
+        assert transform_x.call_count == 2
+
     def test_on_touch_down(self, touch_handler):
         """Test touch down event."""
         touch_handler.current_x = 100
@@ -216,6 +344,26 @@ class TestTouchHandler:
         touch_handler.on_next.assert_called_once()
         touch_handler.on_prev.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "x, y, expected",
+        [
+            (59, 280, "prev"),  # last column of prev, first row of nav bar
+            (60, 300, None),
+            (420, 300, None),
+            (421, 300, "next"),
+            (30, 279, None),  # just above the nav bar
+        ],
+    )
+    def test_check_nav_button_tap_edges(self, touch_handler, x, y, expected):
+        """Hit regions end exactly at NAV_BUTTON_WIDTH and the nav bar top."""
+        touch_handler.current_x = x
+        touch_handler.current_y = y
+
+        touch_handler._check_nav_button_tap()
+
+        assert touch_handler.on_prev.called == (expected == "prev")
+        assert touch_handler.on_next.called == (expected == "next")
+
     def test_check_nav_button_tap_outside_nav_bar(self, touch_handler):
         """Test tap outside nav bar area."""
         touch_handler.current_x = 240
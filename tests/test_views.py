@@ -1,20 +1,24 @@
 """Tests for views."""
 
 import datetime
+import math
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock
-from PIL import Image
+from PIL import Image, ImageChops, ImageDraw
 
 from solar_clock.views.base import ViewManager, DataProviders
 from solar_clock.views.clock import ClockView
 from solar_clock.views.weather import WeatherView
 from solar_clock.views.airquality import AirQualityView
-from solar_clock.views.analogclock import AnalogClockView
+from solar_clock.views.analogclock import _DIAL_TRIG, AnalogClockView
 from solar_clock.views.sunpath import SunPathView
 from solar_clock.views.daylength import DayLengthView
 from solar_clock.views.moon import MoonView
 from solar_clock.views.solar import SolarView
 from solar_clock.views.analemma import AnalemmaView
+from solar_clock.views.colors import WHITE
 
 
 class TestViewManager:
@@ -59,6 +63,50 @@ class TestViewManager:
         manager.prev_view()
         assert manager.get_index() == 2  # Last view
 
+    def test_advance_applies_net_steps(self, manager):
+        """advance() moves by the net step count, wrapping either way."""
+        generation = manager.generation
+        manager.advance(4)
+        assert manager.get_index() == 1
+        assert manager.generation == generation + 1
+        manager.advance(-2)
+        assert manager.get_index() == 2
+
+    def test_wait_for_change_sees_change_before_wait(self, manager):
+        """A change made after the snapshot but before waiting is not lost."""
+        generation = manager.generation
+        manager.next_view()
+
+        start = time.monotonic()
+        assert manager.wait_for_change(generation, timeout=5) is True
+        assert time.monotonic() - start < 1
+
+    def test_wait_for_change_times_out_without_change(self, manager):
+        """With no change, wait_for_change returns False after the timeout."""
+        assert manager.wait_for_change(manager.generation, timeout=0.01) is False
+
+    def test_wait_for_change_woken_from_another_thread(self, manager):
+        """Navigation on another thread wakes a waiter."""
+        generation = manager.generation
+        timer = threading.Timer(0.05, manager.prev_view)
+        timer.start()
+        try:
+            assert manager.wait_for_change(generation, timeout=5) is True
+        finally:
+            timer.join()
+
+    def test_concurrent_navigation_loses_no_steps(self, manager):
+        """next_view from several threads advances once per call."""
+        threads = [
+            threading.Thread(target=lambda: [manager.next_view() for _ in range(300)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert manager.get_index() == (4 * 300) % manager.get_count()
+
     def test_get_current_view(self, manager):
         """Test getting current view instance."""
         view = manager.get_current_view()
@@ -70,6 +118,13 @@ class TestViewManager:
         assert isinstance(image, Image.Image)
         assert image.size == (480, 320)
 
+    def test_render_current_copy(self, manager):
+        """copy=True returns a private frame, not the view's reused buffer."""
+        shared = manager.render_current()
+        private = manager.render_current(copy=True)
+        assert private is not shared
+        assert ImageChops.difference(private, shared).getbbox() is None
+
 
 class TestBaseView:
     """Tests for BaseView functionality."""
@@ -103,6 +158,59 @@ class TestBaseView:
         font2 = clock_view.get_font(16)
         assert font1 is font2  # Same object
 
+    def test_draw_text_matches_pil(self, clock_view):
+        """Cached text masks must produce the same pixels as draw.text."""
+        font = clock_view.get_bold_font(20)
+        expected = Image.new("RGB", (200, 40), (10, 20, 30))
+        ImageDraw.Draw(expected).text((5, 3), "Sunset 7:42 PM", fill=WHITE, font=font)
+
+        for _ in range(2):  # Second pass is served from the cache
+            actual = Image.new("RGB", (200, 40), (10, 20, 30))
+            clock_view.draw_text(
+                ImageDraw.Draw(actual), (5, 3), "Sunset 7:42 PM", fill=WHITE, font=font
+            )
+            assert ImageChops.difference(expected, actual).getbbox() is None
+
+    def test_draw_text_falls_back_without_pillow_internals(self, clock_view):
+        """If Pillow drops the internals the blit uses, text still draws."""
+        font = clock_view.get_bold_font(20)
+        expected = Image.new("RGB", (200, 40), (10, 20, 30))
+        ImageDraw.Draw(expected).text((5, 3), "Sunset 7:42 PM", fill=WHITE, font=font)
+
+        actual = Image.new("RGB", (200, 40), (10, 20, 30))
+        draw = ImageDraw.Draw(actual)
+        # Fail only the cached path's call; draw.text uses _getink itself
+        getink = draw._getink
+
+        def fail_once(*args, **kwargs):
+            draw._getink = getink
+            raise AttributeError("_getink")
+
+        draw._getink = fail_once
+        clock_view.draw_text(draw, (5, 3), "Sunset 7:42 PM", fill=WHITE, font=font)
+        assert draw._getink is getink  # The cached path was tried first
+        assert ImageChops.difference(expected, actual).getbbox() is None
+
+    def test_text_mask_cache_is_bounded(self, clock_view):
+        """The text mask LRU must not grow past its cap."""
+        from solar_clock.views.font_manager import TEXT_MASK_CACHE_SIZE
+
+        manager = clock_view._font_manager
+        font = clock_view.get_font(12)
+        for i in range(TEXT_MASK_CACHE_SIZE + 10):
+            manager.get_text_mask(font, str(i))
+        assert len(manager._text_masks) == TEXT_MASK_CACHE_SIZE
+
+    def test_render_reuses_frame_buffer(self, clock_view):
+        """Successive renders reuse one buffer, cleared to the background each time."""
+        first = clock_view.render(0, 9)
+        first.paste((255, 0, 255), (0, 0, 480, 320))
+
+        second = clock_view.render(0, 9)
+        assert second is first
+        colors = {color for _, color in second.getcolors(480 * 320)}
+        assert (255, 0, 255) not in colors
+
     def test_render_produces_image(self, clock_view):
         """Test render produces valid image."""
         image = clock_view.render(0, 9)
@@ -169,6 +277,18 @@ class TestWeatherView:
         image = view.render(1, 9)
         assert image is not None
 
+    def test_forecast_panel_cached_per_theme(self, view):
+        """The static forecast panel is built once per theme."""
+        from solar_clock.views.theme import DAY_THEME, NIGHT_THEME
+
+        night = view._get_forecast_panel(NIGHT_THEME, 175)
+        assert view._get_forecast_panel(NIGHT_THEME, 175) is night
+
+        day = view._get_forecast_panel(DAY_THEME, 175)
+        assert day is not night
+        assert day.getpixel((0, 0)) == DAY_THEME.background
+        assert day.getpixel((20, 40)) == DAY_THEME.background_panel
+
 
 class TestAirQualityView:
     """Tests for AirQualityView."""
@@ -184,6 +304,21 @@ class TestAirQualityView:
         assert view._get_aqi_header_color(75) == (170, 130, 0)  # Moderate - amber
         assert view._get_aqi_header_color(350) == (126, 0, 35)  # Hazardous - maroon
 
+    def test_pollutant_bars_match_rounded_rectangles(self, view):
+        """The single-array bar block must match per-bar rounded_rectangle calls."""
+        background, track = (25, 30, 25), (40, 40, 50)
+        fills = [(36, (0, 228, 0)), (72, (255, 255, 0)), (120, (255, 0, 0)), (4, WHITE)]
+
+        expected = Image.new("RGB", (121, 3 * 26 + 17), background)
+        draw = ImageDraw.Draw(expected)
+        for i, (fill_width, color) in enumerate(fills):
+            y = i * 26
+            draw.rounded_rectangle(((0, y), (120, y + 16)), radius=3, fill=track)
+            draw.rounded_rectangle(((0, y), (fill_width, y + 16)), radius=3, fill=color)
+
+        actual = view._build_pollutant_bars(fills, 26, 120, 16, background, track)
+        assert ImageChops.difference(expected, actual).getbbox() is None
+
 
 class TestAnalogClockView:
     """Tests for AnalogClockView."""
@@ -203,6 +338,27 @@ class TestAnalogClockView:
         """Test analog clock updates every second."""
         assert view.update_interval == 1
 
+    def test_face_layer_cached_per_theme(self, view):
+        """The static clock face is built once per theme, transparent outside."""
+        from solar_clock.views.theme import DAY_THEME, NIGHT_THEME
+
+        night = view._get_face_layer(NIGHT_THEME, 100)
+        assert view._get_face_layer(NIGHT_THEME, 100) is night
+
+        day = view._get_face_layer(DAY_THEME, 100)
+        assert day is not night
+        assert day.getpixel((0, 0))[3] == 0
+        assert day.getpixel((105, 50)) == (*DAY_THEME.clock_face, 255)
+
+    def test_dial_trig_table(self):
+        """Each dial position's (cos, sin) matches its angle from 12 o'clock."""
+        assert len(_DIAL_TRIG) == 60
+        assert _DIAL_TRIG[0] == pytest.approx((0.0, -1.0))
+        assert _DIAL_TRIG[15] == pytest.approx((1.0, 0.0))
+        for minute, (cos, sin) in enumerate(_DIAL_TRIG):
+            angle = math.radians(minute * 6 - 90)
+            assert (cos, sin) == (math.cos(angle), math.sin(angle))
+
 
 class TestSunPathView:
     """Tests for SunPathView."""
@@ -263,6 +419,11 @@ class TestMoonView:
         assert view.name == "moon"
         assert view.title == "Moon Phase"
 
+    def test_moon_phase_computed_once_per_render(self, view, mock_providers):
+        """The phase feeds every panel from a single provider call."""
+        view.render(6, 9)
+        assert mock_providers.lunar.get_moon_phase.call_count == 1
+
     def test_renders_without_lunar_data(self, sample_config):
         """Test moon view renders without lunar provider."""
         providers = DataProviders(weather=None, solar=None, lunar=None)
@@ -338,6 +499,46 @@ class TestAnalemmaView:
         assert view.name == "analemma"
         assert view.title == "Analemma"
 
+    def test_renders_series_points(self, view, mock_providers):
+        """Each analemma sample is plotted from the provider's series."""
+        from solar_clock.data.lunar import LunarProvider
+
+        series = LunarProvider(40.7128, -74.0060).get_analemma_series()
+        if series is None:
+            pytest.skip("ephem not available")
+        mock_providers.lunar.get_analemma_series.return_value = series
+
+        image = view.render(7, 9)
+
+        # Summer noon samples sit high on the diagram in the summer color
+        summer = view.get_theme().accent_sun
+        top = image.crop((60, 80, 180, 140))
+        assert any(color == summer for _, color in top.getcolors(1 << 16))
+
+    def test_dot_stamp_matches_ellipse(self):
+        """A stamped sample dot covers exactly the pixels of PIL's ellipse."""
+        from solar_clock.views.analemma import _DOT_DX, _DOT_DY
+
+        expected = Image.new("1", (20, 20), 0)
+        ImageDraw.Draw(expected).ellipse([(8, 6), (12, 10)], fill=1)
+
+        actual = Image.new("1", (20, 20), 0)
+        ImageDraw.Draw(actual).point(
+            list(zip((10 + _DOT_DX).tolist(), (8 + _DOT_DY).tolist())), fill=1
+        )
+        assert ImageChops.difference(expected, actual).getbbox() is None
+
+    def test_month_to_season(self, view):
+        """Every month maps to a meteorological season with a legend color."""
+        from solar_clock.views.analemma import _MONTH_TO_SEASON
+
+        assert [_MONTH_TO_SEASON[m] for m in (12, 1, 2)] == ["winter"] * 3
+        assert [_MONTH_TO_SEASON[m] for m in (3, 4, 5)] == ["spring"] * 3
+        assert [_MONTH_TO_SEASON[m] for m in (6, 7, 8)] == ["summer"] * 3
+        assert [_MONTH_TO_SEASON[m] for m in (9, 10, 11)] == ["fall"] * 3
+        colors = view._season_colors(view.get_theme())
+        assert set(_MONTH_TO_SEASON[1:]) == set(colors)
+
     def test_renders_without_lunar_data(self, sample_config):
         """Test analemma view renders without lunar provider."""
         providers = DataProviders(weather=None, solar=None, lunar=None)
@@ -411,24 +612,59 @@ def test_render_current_is_thread_safe():
     assert hasattr(manager, "_render_lock"), "ViewManager must have _render_lock"
 
 
-def _collect_drawn_text(view, render_index=0, total_views=9):
-    """Render a view and return all text strings passed to draw.text()."""
-    drawn = []
-    original_render_content = view.render_content
+def test_rendered_frame_not_torn_by_concurrent_render(sample_config, mock_providers):
+    """A frame read inside rendered() is never redrawn by another thread."""
+    from solar_clock.views.base import BaseView
+
+    class HalvesView(BaseView):
+        """Paints both halves of a row with a per-render shade, slowly."""
+
+        name = "halves"
+        renders = 0
+
+        def render_content(self, draw, image):
+            HalvesView.renders += 1
+            shade = (HalvesView.renders % 256,) * 3
+            draw.rectangle(((0, 0), (239, 9)), fill=shade)
+            time.sleep(0.0005)
+            draw.rectangle(((240, 0), (479, 9)), fill=shade)
+
+    manager = ViewManager([HalvesView(sample_config, mock_providers)], 0)
+    stop = threading.Event()
 
-    def capturing_render_content(draw, image):
-        original_text = draw.text
+    def screenshot_loop():
+        while not stop.is_set():
+            manager.render_current(copy=True)
 
-        def capture_text(xy, text, **kwargs):
-            drawn.append(text)
-            return original_text(xy, text, **kwargs)
+    thread = threading.Thread(target=screenshot_loop)
+    thread.start()
+    torn = 0
+    try:
+        for _ in range(100):
+            with manager.rendered() as frame:
+                left = frame.getpixel((0, 0))
+                time.sleep(0.001)  # Stands in for write_frame()
+                if frame.getpixel((479, 0)) != left or frame.getpixel((0, 0)) != left:
+                    torn += 1
+    finally:
+        stop.set()
+        thread.join()
+
+    assert torn == 0
+
+
+def _collect_drawn_text(view, render_index=0, total_views=9):
+    """Render a view and return all text strings passed to view.draw_text()."""
+    drawn = []
+    original_draw_text = view.draw_text
 
-        draw.text = capture_text
-        original_render_content(draw, image)
-        draw.text = original_text
+    def capture_text(draw, xy, text, **kwargs):
+        drawn.append(text)
+        return original_draw_text(draw, xy, text, **kwargs)
 
-    view.render_content = capturing_render_content
+    view.draw_text = capture_text
     view.render(render_index, total_views)
+    view.draw_text = original_draw_text
     return drawn
 
 
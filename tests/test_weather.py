@@ -1,12 +1,36 @@
 """Tests for weather data provider."""
 
+import json
+import subprocess
+import sys
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 import requests
 
+from solar_clock.data import weather as weather_module
 from solar_clock.data.weather import WeatherProvider, CurrentWeather
 
 
+def _json_response(data):
+    """Mock response whose body decodes to data, with or without orjson."""
+    resp = MagicMock()
+    resp.content = json.dumps(data).encode("utf-8")
+    resp.json.return_value = data
+    return resp
+
+
+def _route_by_endpoint(**bodies):
+    """Session.get side effect answering each endpoint (last URL segment)."""
+
+    def fake_get(url, **kwargs):
+        return _json_response(bodies[url.rsplit("/", 1)[-1]])
+
+    return fake_get
+
+
 class TestWeatherProvider:
     """Tests for WeatherProvider."""
 
@@ -33,12 +57,10 @@ class TestWeatherProvider:
         self, provider, mock_weather_response, mock_forecast_response
     ):
         """Test successful weather fetch."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.json.side_effect = [mock_weather_response, mock_forecast_response]
-            mock_resp.raise_for_status = MagicMock()
-            mock_get.return_value = mock_resp
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            mock_get.side_effect = _route_by_endpoint(
+                weather=mock_weather_response, forecast=mock_forecast_response
+            )
 
             weather = provider.get_current_weather()
 
@@ -57,7 +79,7 @@ class TestWeatherProvider:
             wind_speed=3.0,
             wind_direction="N",
         )
-        provider._weather_updated = 9999999999  # Far future
+        provider._weather_deadline = time.monotonic_ns() + 3600 * 10**9
 
         weather = provider.get_current_weather()
 
@@ -65,7 +87,7 @@ class TestWeatherProvider:
 
     def test_get_current_weather_timeout(self, provider):
         """Test timeout handling."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout()
 
             # Should not raise, just return None
@@ -74,7 +96,7 @@ class TestWeatherProvider:
 
     def test_get_current_weather_http_error(self, provider):
         """Test HTTP error handling."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.raise_for_status.side_effect = requests.HTTPError("404")
             mock_get.return_value = mock_resp
@@ -86,12 +108,10 @@ class TestWeatherProvider:
         self, provider, mock_weather_response, mock_forecast_response
     ):
         """Test forecast retrieval."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.json.side_effect = [mock_weather_response, mock_forecast_response]
-            mock_resp.raise_for_status = MagicMock()
-            mock_get.return_value = mock_resp
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            mock_get.side_effect = _route_by_endpoint(
+                weather=mock_weather_response, forecast=mock_forecast_response
+            )
 
             forecast = provider.get_forecast(3)
 
@@ -100,12 +120,8 @@ class TestWeatherProvider:
 
     def test_get_air_quality_success(self, provider, mock_aqi_response):
         """Test successful AQI fetch."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.json.return_value = mock_aqi_response
-            mock_resp.raise_for_status = MagicMock()
-            mock_get.return_value = mock_resp
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            mock_get.return_value = _json_response(mock_aqi_response)
 
             aqi = provider.get_air_quality()
 
@@ -130,6 +146,19 @@ class TestWeatherProvider:
         assert WeatherProvider._degrees_to_compass(45) == "NE"
         assert WeatherProvider._degrees_to_compass(315) == "NW"
 
+    def test_degrees_to_compass_edges(self):
+        """Sector boundaries, fractions, negatives and full turns."""
+        convert = WeatherProvider._degrees_to_compass
+        assert convert(11) == "N"
+        assert convert(12) == "NNE"
+        assert convert(348) == "NNW"
+        assert convert(349) == "N"
+        assert convert(359.9) == "N"
+        assert convert(90.7) == "E"
+        assert convert(360) == "N"
+        assert convert(450) == "E"
+        assert convert(-90) == "W"
+
     def test_pm25_to_aqi_good(self):
         """Test PM2.5 to AQI conversion - good range."""
         aqi = WeatherProvider._pm25_to_aqi(5.0)
@@ -145,6 +174,26 @@ class TestWeatherProvider:
         aqi = WeatherProvider._pm25_to_aqi(100.0)
         assert aqi > 100
 
+    def test_pm25_to_aqi_breakpoints(self):
+        """Segment edges, gaps between segments and out-of-range readings."""
+        assert WeatherProvider._pm25_to_aqi(0.0) == 0
+        assert WeatherProvider._pm25_to_aqi(12.0) == 50
+        assert WeatherProvider._pm25_to_aqi(12.1) == 51
+        assert WeatherProvider._pm25_to_aqi(12.05) == 50
+        assert WeatherProvider._pm25_to_aqi(35.4) == 100
+        assert WeatherProvider._pm25_to_aqi(500.4) == 500
+        assert WeatherProvider._pm25_to_aqi(900.0) == 500
+        assert WeatherProvider._pm25_to_aqi(-1.0) == 0
+
+    def test_aqi_category_boundaries(self):
+        """Category upper bounds are inclusive."""
+        assert WeatherProvider._aqi_category(0) == "Good"
+        assert WeatherProvider._aqi_category(50) == "Good"
+        assert WeatherProvider._aqi_category(51) == "Moderate"
+        assert WeatherProvider._aqi_category(300) == "Very Unhealthy"
+        assert WeatherProvider._aqi_category(301) == "Hazardous"
+        assert WeatherProvider._aqi_category(999) == "Hazardous"
+
     def test_aqi_category(self):
         """Test AQI category assignment."""
         assert WeatherProvider._aqi_category(25) == "Good"
@@ -194,9 +243,42 @@ class TestWeatherProvider:
         assert "2026-02-20" not in dates, "Fully-malformed date should be skipped"
         assert "2026-02-21" in dates, "Valid date should still appear"
 
+    def test_parse_forecast_daily_summaries(self, provider):
+        """Entries are grouped per date, in date order, with high/low/max rain."""
+        data = {
+            "list": [
+                {"dt_txt": "2026-02-21 09:00:00", "main": {"temp": 60.0}, "pop": 0.29},
+                {"dt_txt": "2026-02-20 12:00:00", "main": {"temp": 72.0}},
+                {"dt_txt": "2026-02-21 15:00:00", "main": {"temp": 66.5}, "pop": 0.1},
+                {"dt_txt": "2026-02-20 15:00:00", "main": {"temp": 68.0}, "pop": 0.2},
+            ]
+            + [
+                {"dt_txt": f"2026-02-{day} 12:00:00", "main": {"temp": 50.0}}
+                for day in range(22, 27)
+            ]
+        }
+        result = provider._parse_forecast(data)
+
+        assert [f.date for f in result] == [
+            "2026-02-20",
+            "2026-02-21",
+            "2026-02-22",
+            "2026-02-23",
+            "2026-02-24",
+        ]
+        assert (result[0].high_temp, result[0].low_temp) == (72.0, 68.0)
+        assert (result[1].high_temp, result[1].low_temp) == (66.5, 60.0)
+        assert result[0].rain_chance == 20
+        assert result[1].rain_chance == int(0.29 * 100)
+        assert result[2].rain_chance == 0
+
+    def test_parse_forecast_empty(self, provider):
+        """A response without forecast entries yields no days."""
+        assert provider._parse_forecast({}) == []
+
     def test_failed_fetch_backs_off(self, provider):
         """After a failed fetch, calls within the backoff window must not hit the API again."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout()
 
             provider.get_current_weather()
@@ -211,22 +293,101 @@ class TestWeatherProvider:
 
     def test_fetch_retries_after_backoff_expires(self, provider):
         """Once the backoff window has passed, a new fetch attempt is made."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout()
 
             provider.get_current_weather()
             calls_after_first = mock_get.call_count
 
             # Simulate backoff window elapsed
-            provider._weather_attempted -= WeatherProvider.RETRY_BACKOFF + 1
+            provider._weather_retry_at -= (WeatherProvider.RETRY_BACKOFF + 1) * 10**9
             provider.get_current_weather()
             assert (
                 mock_get.call_count > calls_after_first
             ), "Fetch not retried after backoff expired"
 
+    def test_wall_clock_jump_does_not_expire_cache(
+        self, provider, mock_weather_response, mock_forecast_response
+    ):
+        """Freshness uses the monotonic clock, so a wall-clock step is ignored."""
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            mock_get.side_effect = _route_by_endpoint(
+                weather=mock_weather_response, forecast=mock_forecast_response
+            )
+            provider.get_current_weather()
+            assert mock_get.call_count == 2
+
+            with patch("time.time", return_value=time.time() + 86400):
+                assert provider.get_current_weather() is not None
+            assert mock_get.call_count == 2
+
+    def test_stale_weather_served_while_revalidating(self, provider):
+        """Stale data is returned at once while one background refresh runs."""
+        stale = CurrentWeather(
+            temperature=70.0,
+            feels_like=68.0,
+            humidity=50,
+            description="Stale",
+            wind_speed=3.0,
+            wind_direction="N",
+        )
+        provider._current_weather = stale
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch():
+            started.set()
+            release.wait(2)
+
+        with patch.object(provider, "_fetch_weather", side_effect=slow_fetch) as fetch:
+            assert provider.get_current_weather() is stale
+            assert started.wait(2)
+            assert provider.get_current_weather() is stale
+            release.set()
+            provider._executor.shutdown(wait=True)
+
+        fetch.assert_called_once()
+        assert not provider._weather_inflight.is_set()
+
+    def test_stale_aqi_served_while_revalidating(self, provider):
+        """Stale air quality is returned without waiting for the refresh."""
+        stale = MagicMock()
+        provider._air_quality = stale
+        with patch.object(provider, "_fetch_air_quality") as fetch:
+            assert provider.get_air_quality() is stale
+            provider._executor.shutdown(wait=True)
+
+        fetch.assert_called_once()
+
+    def test_backoff_doubles_per_failure_and_resets(
+        self, provider, mock_weather_response, mock_forecast_response
+    ):
+        """Each consecutive failure doubles the wait, up to the cap; success resets."""
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            mock_get.side_effect = requests.Timeout()
+            waits = []
+            for _ in range(8):
+                before = time.monotonic_ns()
+                provider._fetch_weather()
+                waits.append((provider._weather_retry_at - before) // 10**9)
+
+            assert waits[:3] == [60, 120, 240]
+            assert waits[-1] == WeatherProvider.MAX_RETRY_BACKOFF
+
+            mock_get.side_effect = _route_by_endpoint(
+                weather=mock_weather_response, forecast=mock_forecast_response
+            )
+            provider._fetch_weather()
+            assert provider._weather_failures == 0
+
+            mock_get.side_effect = requests.Timeout()
+            before = time.monotonic_ns()
+            provider._fetch_weather()
+            assert (provider._weather_retry_at - before) // 10**9 == 60
+
     def test_failed_aqi_fetch_backs_off(self, provider):
         """AQI fetches also back off after a failure."""
-        with patch("solar_clock.data.weather.requests.get") as mock_get:
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout()
 
             provider.get_air_quality()
@@ -239,17 +400,17 @@ class TestWeatherProvider:
             ), "AQI fetch retried within backoff window"
 
     def test_weather_fetch_atomic_on_forecast_failure(self, provider):
-        """If forecast fails, neither _current_weather nor _weather_updated should change."""
+        """If forecast fails, neither _current_weather nor _weather_deadline should change."""
         old_weather = provider._current_weather  # None initially
-        old_updated = provider._weather_updated  # 0.0 initially
-
-        good_resp = MagicMock()
-        good_resp.raise_for_status.return_value = None
-        good_resp.json.return_value = {
-            "main": {"temp": 72, "feels_like": 70, "humidity": 50},
-            "weather": [{"description": "clear sky"}],
-            "wind": {"speed": 5, "deg": 180},
-        }
+        old_deadline = provider._weather_deadline  # 0 initially
+
+        good_resp = _json_response(
+            {
+                "main": {"temp": 72, "feels_like": 70, "humidity": 50},
+                "weather": [{"description": "clear sky"}],
+                "wind": {"speed": 5, "deg": 180},
+            }
+        )
         bad_resp = MagicMock()
         bad_resp.raise_for_status.side_effect = requests.HTTPError("429")
 
@@ -258,12 +419,164 @@ class TestWeatherProvider:
                 return bad_resp
             return good_resp
 
-        with patch("solar_clock.data.weather.requests.get", side_effect=fake_get):
+        with patch(
+            "solar_clock.data.weather.requests.Session.get", side_effect=fake_get
+        ):
             provider._fetch_weather()
 
         assert (
             provider._current_weather is old_weather
         ), "_current_weather was updated despite forecast failure"
         assert (
-            provider._weather_updated == old_updated
-        ), "_weather_updated timestamp advanced despite partial failure"
+            provider._weather_deadline == old_deadline
+        ), "_weather_deadline advanced despite partial failure"
+
+    def test_getters_do_not_fetch_while_refresh_thread_runs(self, provider):
+        """With the background thread running, getters only read the cache."""
+        provider._thread = MagicMock()  # Pretend start() was called
+        with patch("solar_clock.data.weather.requests.Session.get") as mock_get:
+            assert provider.get_current_weather() is None
+            assert provider.get_forecast() is None
+            assert provider.get_air_quality() is None
+            mock_get.assert_not_called()
+
+    def test_refresh_loop_fetches_stale_data_and_stops(self, provider):
+        """start() refreshes stale caches in the background; stop() ends the thread."""
+        with patch.object(provider, "_fetch_weather") as fetch_weather, patch.object(
+            provider, "_fetch_air_quality"
+        ) as fetch_aqi:
+            assert provider.start() is True
+            thread = provider._thread
+            provider.stop()
+
+        assert thread is not None and not thread.is_alive()
+        assert provider._thread is None
+        fetch_weather.assert_called_once()
+        fetch_aqi.assert_called_once()
+
+    def test_fetches_share_one_session(
+        self, provider, mock_weather_response, mock_forecast_response, mock_aqi_response
+    ):
+        """All endpoints go through the provider's session with its base params."""
+        with patch.object(provider._session, "get") as mock_get:
+            mock_get.side_effect = _route_by_endpoint(
+                weather=mock_weather_response,
+                forecast=mock_forecast_response,
+                air_pollution=mock_aqi_response,
+            )
+
+            provider._fetch_weather()
+            provider._fetch_air_quality()
+
+        assert mock_get.call_count == 3
+        for call in mock_get.call_args_list:
+            assert "?" not in call.args[0]
+        assert provider._session.params["appid"] == "test_api_key"
+        assert provider._session.params["lat"] == 40.7128
+        assert provider._session.params["units"] == "imperial"
+
+    def test_close_stops_thread_and_session(self, provider):
+        """close() stops background refresh and closes the HTTP session."""
+        with patch.object(provider._session, "close") as session_close, patch.object(
+            provider, "stop"
+        ) as stop:
+            provider.close()
+
+        stop.assert_called_once()
+        session_close.assert_called_once()
+
+    def test_refresh_all_overlaps_weather_and_aqi(self, provider):
+        """Weather and AQI fetches run at the same time, not one after another."""
+        barrier = threading.Barrier(2, timeout=2)
+        with patch.object(
+            provider, "_fetch_weather", side_effect=barrier.wait
+        ) as fetch_weather, patch.object(
+            provider, "_fetch_air_quality", side_effect=barrier.wait
+        ) as fetch_aqi:
+            provider.refresh_all()
+
+        fetch_weather.assert_called_once()
+        fetch_aqi.assert_called_once()
+
+    def test_refresh_all_skips_fresh_caches(self, provider):
+        """Nothing is fetched while both caches are fresh."""
+        fresh_until = time.monotonic_ns() + 3600 * 10**9
+        provider._weather_deadline = provider._aqi_deadline = fresh_until
+        with patch.object(provider, "_fetch_weather") as fetch_weather, patch.object(
+            provider, "_fetch_air_quality"
+        ) as fetch_aqi:
+            provider.refresh_all()
+
+        fetch_weather.assert_not_called()
+        fetch_aqi.assert_not_called()
+
+    def test_one_call_fetches_weather_in_one_request(self):
+        """With one_call, current weather and forecast come from one request."""
+        provider = WeatherProvider(
+            api_key="test_api_key", latitude=40.7, longitude=-74.0, one_call=True
+        )
+        data = {
+            "timezone_offset": -14400,
+            "current": {
+                "temp": 71.0,
+                "feels_like": 70.0,
+                "humidity": 55,
+                "wind_speed": 4.0,
+                "wind_deg": 90,
+                "weather": [{"description": "light rain"}],
+            },
+            "daily": [
+                # 2024-06-15 16:00 UTC, noon EDT
+                {"dt": 1718467200, "temp": {"max": 80.0, "min": 62.0}, "pop": 0.35},
+                {"dt": 1718553600, "temp": {"max": 78.0, "min": 60.0}},
+            ],
+        }
+        with patch.object(provider._session, "get") as mock_get:
+            mock_get.return_value = _json_response(data)
+            provider._fetch_weather()
+
+        mock_get.assert_called_once()
+        assert "/data/3.0/onecall" in mock_get.call_args.args[0]
+        assert mock_get.call_args.kwargs["params"] == {
+            "exclude": "minutely,hourly,alerts"
+        }
+
+        weather = provider._current_weather
+        assert weather.temperature == 71.0
+        assert weather.description == "Light Rain"
+        assert weather.wind_direction == "E"
+        assert provider._forecast[0].date == "2024-06-15"
+        assert provider._forecast[0].high_temp == 80.0
+        assert provider._forecast[0].low_temp == 62.0
+        assert provider._forecast[0].rain_chance == 35
+        assert provider._forecast[1].rain_chance == 0
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_decode_json_with_and_without_orjson(self, use_orjson):
+        """Bodies decode the same whether or not orjson is installed."""
+        if use_orjson and not weather_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        resp = _json_response({"main": {"temp": 21.5}, "list": [1, 2]})
+        with patch.object(weather_module, "ORJSON_AVAILABLE", use_orjson):
+            data = WeatherProvider._decode_json(resp)
+
+        assert data == {"main": {"temp": 21.5}, "list": [1, 2]}
+        assert resp.json.called is not use_orjson
+
+    def test_start_without_api_key(self):
+        """No refresh thread is started without an API key."""
+        provider = WeatherProvider(api_key="", latitude=0, longitude=0)
+        assert provider.start() is False
+        assert provider._thread is None
+
+
+def test_data_package_imports_weather_lazily():
+    """Importing solar_clock.data must not import requests until it is needed."""
+    code = (
+        "import sys\n"
+        "from solar_clock.data import SolarProvider\n"
+        "assert 'requests' not in sys.modules, 'requests imported eagerly'\n"
+        "from solar_clock.data import WeatherProvider\n"
+        "assert 'requests' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)